@@ -3,37 +3,116 @@ User authentication module for The Grand Budapest Terminal.
 
 This module provides secure user authentication with bcrypt password hashing.
 """
+import os
+import re
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import bcrypt
-from datetime import datetime, timedelta
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:
+    PasswordHasher = None
 
-def hash_password(password: str) -> str:
+
+MIN_BCRYPT_ROUNDS = 12
+DEFAULT_BCRYPT_ROUNDS = int(os.getenv("AUTH_BCRYPT_ROUNDS", MIN_BCRYPT_ROUNDS))
+_BCRYPT_PREFIXES = frozenset((b"$2a$", b"$2b$", b"$2y$"))
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def hash_password(password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> str:
     """
     Hash a password using bcrypt with secure salt.
     
     Args:
         password: Plain text password to hash
+        rounds: bcrypt cost factor (defaults to AUTH_BCRYPT_ROUNDS, minimum 12)
         
     Returns:
         Hashed password string
+        
+    Raises:
+        ValueError: If rounds is below the minimum cost
     """
-    salt = bcrypt.gensalt(rounds=12)
+    if rounds < MIN_BCRYPT_ROUNDS:
+        raise ValueError(f"bcrypt rounds must be at least {MIN_BCRYPT_ROUNDS}")
+    salt = bcrypt.gensalt(rounds=rounds)
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 
-def verify_password(password: str, password_hash: str) -> bool:
+def hash_password_argon2(password: str) -> str:
+    """
+    Hash a password using argon2id.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Encoded argon2id hash string
+        
+    Raises:
+        RuntimeError: If argon2-cffi is not installed
+    """
+    if PasswordHasher is None:
+        raise RuntimeError("argon2-cffi is required for argon2id hashing")
+    return PasswordHasher().hash(password)
+
+
+def verify_password(password: str | bytes, password_hash: str | bytes) -> bool:
     """
     Verify a password against its hash.
     
+    Accepts both bcrypt and argon2id hashes; anything else is rejected
+    without running a key schedule. Callers that already hold bytes can
+    pass them directly to skip re-encoding.
+    
     Args:
-        password: Plain text password to check
-        password_hash: Previously hashed password
+        password: Plain text password to check (str or UTF-8 bytes)
+        password_hash: Previously hashed password (str or bytes)
         
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(password.encode(), password_hash.encode())
+    password_bytes = password if isinstance(password, bytes) else password.encode()
+    hash_bytes = password_hash if isinstance(password_hash, bytes) else password_hash.encode()
+    if hash_bytes.startswith(b"$argon2"):
+        if PasswordHasher is None:
+            return False
+        try:
+            return PasswordHasher().verify(hash_bytes, password_bytes)
+        except (VerificationError, InvalidHashError):
+            return False
+    if hash_bytes[:4] not in _BCRYPT_PREFIXES:
+        return False
+    return bcrypt.checkpw(password_bytes, hash_bytes)
+
+
+def verify_password_batch(
+    pairs: list[tuple[str | bytes, str | bytes]],
+    max_workers: Optional[int] = None,
+) -> list[bool]:
+    """
+    Verify many passwords against their hashes concurrently.
+    
+    bcrypt releases the GIL while hashing, so independent checks run in
+    parallel across CPU cores.
+    
+    Args:
+        pairs: (password, password_hash) tuples to check
+        max_workers: Thread pool size (defaults to the executor's choice)
+        
+    Returns:
+        List of results in the same order as pairs
+    """
+    if len(pairs) < 2:
+        return [verify_password(password, password_hash) for password, password_hash in pairs]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: verify_password(*pair), pairs))
 
 
 def create_session(user_id: int, duration_hours: int = 24) -> dict:
@@ -45,13 +124,14 @@ def create_session(user_id: int, duration_hours: int = 24) -> dict:
         duration_hours: How long session should last
         
     Returns:
-        Dictionary with session details
+        Dictionary with session details (UTC ISO 8601 timestamps, second precision)
     """
-    expires_at = datetime.utcnow() + timedelta(hours=duration_hours)
+    now = time.time()
+    expires_at = now + duration_hours * 3600
     return {
         "user_id": user_id,
-        "expires_at": expires_at.isoformat(),
-        "created_at": datetime.utcnow().isoformat()
+        "expires_at": time.strftime(_ISO_FORMAT, time.gmtime(expires_at)),
+        "created_at": time.strftime(_ISO_FORMAT, time.gmtime(now))
     }
 
 
@@ -65,9 +145,21 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid format
     """
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
+
+
+def validate_emails(emails: Iterable[str]) -> list[bool]:
+    """
+    Validate many email addresses in one call.
+    
+    Args:
+        emails: Email addresses to validate
+        
+    Returns:
+        List of validity flags in input order
+    """
+    match = _EMAIL_RE.match
+    return [("@" in email and match(email) is not None) for email in emails]
 
 
 class AuthenticationError(Exception):
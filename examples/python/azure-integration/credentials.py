@@ -10,7 +10,13 @@ Example:
     >>> demo.demonstrate_credential_chain()
 """
 
-from azure.core.credentials import AccessToken
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from azure.core.credentials import AccessToken, TokenCredential
 from azure.identity import (
     AzureCliCredential,
     AzurePowerShellCredential,
@@ -23,6 +29,106 @@ from azure.identity import (
 from loguru import logger
 
 
+class CachingTokenCredential:
+    """
+    Token credential wrapper that caches access tokens in memory.
+    
+    Developer credentials such as AzureCliCredential fetch a new token on
+    every get_token call. Wrapping the credential returns the cached token
+    per scope until it is within refresh_margin seconds of expiry.
+    
+    Example:
+        >>> credential = CachingTokenCredential(DefaultAzureCredential())
+        >>> token = credential.get_token("https://storage.azure.com/.default")
+    """
+    
+    def __init__(self, credential: TokenCredential, refresh_margin: float = 300.0) -> None:
+        """
+        Initialize the caching wrapper.
+        
+        Args:
+            credential: Credential used to fetch tokens on a cache miss
+            refresh_margin: Seconds before expiry at which a token is refreshed
+        """
+        self._credential = credential
+        self._refresh_margin = refresh_margin
+        self._tokens: dict[tuple[Any, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+    
+    def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,
+    ) -> AccessToken:
+        """
+        Get an access token, serving it from the cache while still fresh.
+        
+        Requests carrying claims (e.g. a CAE challenge) always bypass the cache.
+        
+        Args:
+            scopes: Token scopes
+            claims: Additional claims required in the token
+            tenant_id: Optional tenant to request the token from
+            
+        Returns:
+            Access token
+        """
+        if claims:
+            return self._credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+        
+        key = (scopes, tenant_id, kwargs.get("enable_cae", False))
+        token = self._tokens.get(key)
+        if token is not None and token.expires_on - time.time() > self._refresh_margin:
+            return token
+        
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None or token.expires_on - time.time() <= self._refresh_margin:
+                token = self._credential.get_token(*scopes, tenant_id=tenant_id, **kwargs)
+                self._tokens[key] = token
+            return token
+    
+    def close(self) -> None:
+        """Close the wrapped credential."""
+        self._credential.close()
+    
+    def __enter__(self) -> "CachingTokenCredential":
+        """Enter the context."""
+        return self
+    
+    def __exit__(self, *args: object) -> None:
+        """Exit the context and close the wrapped credential."""
+        self.close()
+
+
+def make_fast_credential() -> ChainedTokenCredential:
+    """
+    Create a credential chain for server deployments.
+    
+    DefaultAzureCredential probes up to seven sources on first use, and the
+    developer ones (Azure CLI, PowerShell) spawn subprocesses. This chain
+    only tries managed identity and then environment service principal
+    settings, so a cold token fetch is a single HTTP call.
+    
+    Returns:
+        ChainedTokenCredential of ManagedIdentity and Environment credentials
+        
+    Example:
+        >>> from storage import BlobStorageClient
+        >>> storage = BlobStorageClient(
+        ...     "mystorageaccount", "data", credential=make_fast_credential()
+        ... )
+    """
+    return ChainedTokenCredential(
+        ManagedIdentityCredential(),
+        EnvironmentCredential(),
+    )
+
+
 class AzureAuthDemo:
     """
     Demonstrates Azure authentication credential chain.
@@ -59,10 +165,16 @@ class AzureAuthDemo:
         logger.info("Creating DefaultAzureCredential")
         return DefaultAzureCredential()
     
-    def demonstrate_credential_chain(self) -> dict[str, bool]:
+    def demonstrate_credential_chain(self, timeout: float = 10.0) -> dict[str, bool]:
         """
         Demonstrate which credentials in the chain are available.
         
+        Probes run concurrently, so the total wait is bounded by the slowest
+        credential rather than the sum of all of them.
+        
+        Args:
+            timeout: Seconds to wait for all probes; unfinished ones count as unavailable
+            
         Returns:
             Dictionary mapping credential type to availability
             
@@ -80,64 +192,56 @@ class AzureAuthDemo:
         logger.info("Testing credential chain availability")
         
         scope = "https://management.azure.com/.default"
-        results: dict[str, bool] = {}
-        
-        # Test EnvironmentCredential
-        logger.info("Testing EnvironmentCredential...")
-        try:
-            cred = EnvironmentCredential()
-            token = cred.get_token(scope)
-            results["EnvironmentCredential"] = True
-            logger.info("✓ EnvironmentCredential available")
-        except Exception as e:
-            results["EnvironmentCredential"] = False
-            logger.info(f"✗ EnvironmentCredential not available: {type(e).__name__}")
-        
-        # Test WorkloadIdentityCredential
-        logger.info("Testing WorkloadIdentityCredential...")
-        try:
-            cred = WorkloadIdentityCredential()
-            token = cred.get_token(scope)
-            results["WorkloadIdentityCredential"] = True
-            logger.info("✓ WorkloadIdentityCredential available")
-        except Exception as e:
-            results["WorkloadIdentityCredential"] = False
-            logger.info(f"✗ WorkloadIdentityCredential not available: {type(e).__name__}")
+        probes: list[tuple[str, Callable[[], TokenCredential]]] = [
+            ("EnvironmentCredential", EnvironmentCredential),
+            ("WorkloadIdentityCredential", WorkloadIdentityCredential),
+            ("ManagedIdentityCredential", ManagedIdentityCredential),
+            ("AzureCliCredential", AzureCliCredential),
+            ("AzurePowerShellCredential", AzurePowerShellCredential),
+        ]
+        results: dict[str, bool] = dict.fromkeys((name for name, _ in probes), False)
         
-        # Test ManagedIdentityCredential
-        logger.info("Testing ManagedIdentityCredential...")
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        futures = {
+            executor.submit(self._probe_credential, name, factory, scope): name
+            for name, factory in probes
+        }
         try:
-            cred = ManagedIdentityCredential()
-            token = cred.get_token(scope)
-            results["ManagedIdentityCredential"] = True
-            logger.info("✓ ManagedIdentityCredential available")
-        except Exception as e:
-            results["ManagedIdentityCredential"] = False
-            logger.info(f"✗ ManagedIdentityCredential not available: {type(e).__name__}")
+            for future in as_completed(futures, timeout=timeout):
+                results[futures[future]] = future.result()
+        except TimeoutError:
+            pending = [name for future, name in futures.items() if not future.done()]
+            logger.info(f"✗ Timed out waiting for: {', '.join(pending)}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        # Test AzureCliCredential
-        logger.info("Testing AzureCliCredential...")
-        try:
-            cred = AzureCliCredential()
-            token = cred.get_token(scope)
-            results["AzureCliCredential"] = True
-            logger.info("✓ AzureCliCredential available")
-        except Exception as e:
-            results["AzureCliCredential"] = False
-            logger.info(f"✗ AzureCliCredential not available: {type(e).__name__}")
+        return results
+    
+    @staticmethod
+    def _probe_credential(
+        name: str,
+        factory: Callable[[], TokenCredential],
+        scope: str,
+    ) -> bool:
+        """
+        Try to get a token from a single credential type.
         
-        # Test AzurePowerShellCredential
-        logger.info("Testing AzurePowerShellCredential...")
+        Args:
+            name: Credential type name used for logging
+            factory: Callable that constructs the credential
+            scope: Token scope to request
+            
+        Returns:
+            True if a token was obtained, False otherwise
+        """
+        logger.info(f"Testing {name}...")
         try:
-            cred = AzurePowerShellCredential()
-            token = cred.get_token(scope)
-            results["AzurePowerShellCredential"] = True
-            logger.info("✓ AzurePowerShellCredential available")
+            factory().get_token(scope)
+            logger.info(f"✓ {name} available")
+            return True
         except Exception as e:
-            results["AzurePowerShellCredential"] = False
-            logger.info(f"✗ AzurePowerShellCredential not available: {type(e).__name__}")
-        
-        return results
+            logger.info(f"✗ {name} not available: {type(e).__name__}")
+            return False
     
     def create_custom_credential_chain(
         self,
@@ -10,14 +10,52 @@ Example:
     >>> secret = client.get_secret("database-password")
 """
 
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from itertools import islice
 from typing import Any
 
-from azure.core.exceptions import ResourceNotFoundError
+import requests
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.pipeline.transport import HttpTransport, RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import KeyVaultSecret, SecretClient, SecretProperties
 from loguru import logger
 
 
+@cache
+def _get_shared_credential() -> DefaultAzureCredential:
+    """
+    Get the process-wide DefaultAzureCredential.
+    
+    The credential probes its chain once and caches access tokens internally
+    (refreshing them before expiry), so sharing one instance avoids
+    re-authenticating for every KeyVaultClient.
+    
+    Returns:
+        Shared DefaultAzureCredential instance
+    """
+    return DefaultAzureCredential()
+
+
+@cache
+def _get_shared_transport() -> RequestsTransport:
+    """
+    Get the process-wide HTTP transport for SecretClient instances.
+    
+    The transport wraps a shared requests.Session it does not own, so
+    connections (and their TLS sessions) are pooled across clients and
+    closing one client does not tear down the pool for the others.
+    
+    Returns:
+        Shared RequestsTransport instance
+    """
+    return RequestsTransport(session=requests.Session(), session_owner=False)
+
+
 class KeyVaultClient:
     """
     Azure Key Vault client with DefaultAzureCredential.
@@ -27,6 +65,7 @@ class KeyVaultClient:
     Attributes:
         vault_url: Key Vault URL (https://<vault-name>.vault.azure.net)
         client: Azure SecretClient instance
+        cache_ttl: Seconds a retrieved secret value is served from memory
         
     Example:
         >>> vault_url = "https://myvault.vault.azure.net"
@@ -34,22 +73,44 @@ class KeyVaultClient:
         >>> secret_value = kv.get_secret("api-key")
     """
     
-    def __init__(self, vault_url: str) -> None:
+    # Seconds the secret-name listing used by secret_exists stays valid
+    NAME_SET_TTL = 60.0
+    # Vaults with more secrets than this are probed per name instead
+    NAME_SET_MAX_SECRETS = 1000
+    
+    def __init__(
+        self,
+        vault_url: str,
+        transport: HttpTransport | None = None,
+        cache_ttl: float = 300.0,
+    ) -> None:
         """
         Initialize Key Vault client.
         
         Args:
             vault_url: Key Vault URL
+            transport: Optional HTTP transport (e.g. a tuned RequestsTransport);
+                a connection pool shared by all instances is used when omitted
+            cache_ttl: Seconds to cache secret values in memory (0 disables caching)
             
         Example:
             >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
         """
         self.vault_url = vault_url
-        logger.info(f"Initializing Key Vault client: {vault_url}")
+        self.cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._cache_lock = threading.Lock()
+        self._name_set: frozenset[str] | None = None
+        self._name_set_expires = 0.0
+        logger.info("Initializing Key Vault client: {}", vault_url)
         
         # DefaultAzureCredential tries multiple auth methods automatically
-        credential = DefaultAzureCredential()
-        self.client = SecretClient(vault_url=vault_url, credential=credential)
+        credential = _get_shared_credential()
+        self.client = SecretClient(
+            vault_url=vault_url,
+            credential=credential,
+            transport=transport if transport is not None else _get_shared_transport(),
+        )
         
         logger.info("Key Vault client initialized successfully")
     
@@ -57,6 +118,8 @@ class KeyVaultClient:
         """
         Get secret value from Key Vault.
         
+        Values are served from the in-memory cache until cache_ttl expires.
+        
         Args:
             secret_name: Name of the secret
             
@@ -71,17 +134,22 @@ class KeyVaultClient:
             >>> db_password = kv.get_secret("database-password")
             >>> print(db_password)
         """
-        logger.info(f"Retrieving secret: {secret_name}")
+        cached = self._get_cached(secret_name)
+        if cached is not None:
+            return cached
+        
+        logger.debug("Retrieving secret: {}", secret_name)
         
         try:
             secret = self.client.get_secret(secret_name)
-            logger.info(f"✓ Successfully retrieved secret: {secret_name}")
+            logger.debug("✓ Successfully retrieved secret: {}", secret_name)
+            self._set_cached(secret_name, secret.value)
             return secret.value
         except ResourceNotFoundError:
-            logger.error(f"Secret not found: {secret_name}")
+            logger.error("Secret not found: {}", secret_name)
             raise
         except Exception as e:
-            logger.error(f"Failed to retrieve secret {secret_name}: {e}")
+            logger.error("Failed to retrieve secret {}: {}", secret_name, e)
             raise
     
     def get_secret_with_metadata(self, secret_name: str) -> KeyVaultSecret:
@@ -101,17 +169,17 @@ class KeyVaultClient:
             >>> print(f"Created: {secret.properties.created_on}")
             >>> print(f"Enabled: {secret.properties.enabled}")
         """
-        logger.info(f"Retrieving secret with metadata: {secret_name}")
+        logger.debug("Retrieving secret with metadata: {}", secret_name)
         
         try:
             secret = self.client.get_secret(secret_name)
-            logger.info(f"✓ Retrieved secret: {secret_name}")
-            logger.debug(f"  Created: {secret.properties.created_on}")
-            logger.debug(f"  Updated: {secret.properties.updated_on}")
-            logger.debug(f"  Enabled: {secret.properties.enabled}")
+            logger.debug("✓ Retrieved secret: {}", secret_name)
+            logger.debug("  Created: {}", secret.properties.created_on)
+            logger.debug("  Updated: {}", secret.properties.updated_on)
+            logger.debug("  Enabled: {}", secret.properties.enabled)
             return secret
         except Exception as e:
-            logger.error(f"Failed to retrieve secret {secret_name}: {e}")
+            logger.error("Failed to retrieve secret {}: {}", secret_name, e)
             raise
     
     def set_secret(self, secret_name: str, value: str) -> KeyVaultSecret:
@@ -129,14 +197,15 @@ class KeyVaultClient:
             >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
             >>> kv.set_secret("new-api-key", "secret-value-123")
         """
-        logger.info(f"Setting secret: {secret_name}")
+        logger.info("Setting secret: {}", secret_name)
         
         try:
             secret = self.client.set_secret(secret_name, value)
-            logger.info(f"✓ Successfully set secret: {secret_name}")
+            self.invalidate(secret_name)
+            logger.info("✓ Successfully set secret: {}", secret_name)
             return secret
         except Exception as e:
-            logger.error(f"Failed to set secret {secret_name}: {e}")
+            logger.error("Failed to set secret {}: {}", secret_name, e)
             raise
     
     def delete_secret(self, secret_name: str) -> None:
@@ -152,16 +221,17 @@ class KeyVaultClient:
             >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
             >>> kv.delete_secret("old-api-key")
         """
-        logger.info(f"Deleting secret: {secret_name}")
+        logger.info("Deleting secret: {}", secret_name)
         
         try:
             poller = self.client.begin_delete_secret(secret_name)
             deleted_secret = poller.result()
-            logger.info(f"✓ Successfully deleted secret: {secret_name}")
-            logger.info(f"  Deletion date: {deleted_secret.deleted_date}")
-            logger.info(f"  Recovery id: {deleted_secret.recovery_id}")
+            self.invalidate(secret_name)
+            logger.info("✓ Successfully deleted secret: {}", secret_name)
+            logger.info("  Deletion date: {}", deleted_secret.deleted_date)
+            logger.info("  Recovery id: {}", deleted_secret.recovery_id)
         except Exception as e:
-            logger.error(f"Failed to delete secret {secret_name}: {e}")
+            logger.error("Failed to delete secret {}: {}", secret_name, e)
             raise
     
     def list_secrets(self) -> list[str]:
@@ -180,23 +250,58 @@ class KeyVaultClient:
         logger.info("Listing all secrets")
         
         try:
-            secret_properties = self.client.list_properties_of_secrets()
-            secret_names = [prop.name for prop in secret_properties]
-            logger.info(f"✓ Found {len(secret_names)} secrets")
+            secret_names = list(self.iter_secrets())
+            logger.info("✓ Found {} secrets", len(secret_names))
             return secret_names
         except Exception as e:
-            logger.error(f"Failed to list secrets: {e}")
+            logger.error("Failed to list secrets: {}", e)
             raise
     
+    def iter_secrets(self) -> Iterator[str]:
+        """
+        Iterate over secret names in the vault.
+        
+        Names are yielded as the SDK fetches each page, so memory stays
+        bounded by the page size even for very large vaults.
+        
+        Yields:
+            Secret names
+            
+        Example:
+            >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
+            >>> for name in kv.iter_secrets():
+            ...     print(name)
+        """
+        for prop in self.client.list_properties_of_secrets():
+            yield prop.name
+    
+    def count_secrets(self) -> int:
+        """
+        Count secrets in the vault without building a list of names.
+        
+        Returns:
+            Number of secrets
+            
+        Example:
+            >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
+            >>> print(kv.count_secrets())
+        """
+        return sum(1 for _ in self.client.list_properties_of_secrets())
+    
     def get_multiple_secrets(
         self,
         secret_names: list[str],
+        max_workers: int = 8,
     ) -> dict[str, str]:
         """
         Get multiple secrets efficiently.
         
+        Secrets are fetched concurrently so round-trips overlap. Keep
+        max_workers modest: Key Vault throttles requests per vault.
+        
         Args:
             secret_names: List of secret names to retrieve
+            max_workers: Maximum number of concurrent requests
             
         Returns:
             Dictionary mapping secret names to values
@@ -210,45 +315,64 @@ class KeyVaultClient:
             ... ])
             >>> print(secrets["database-password"])
         """
-        logger.info(f"Retrieving {len(secret_names)} secrets")
+        logger.info("Retrieving {} secrets", len(secret_names))
         
         secrets: dict[str, str] = {}
+        if not secret_names:
+            return secrets
         
-        for secret_name in secret_names:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(secret_names))) as executor:
+            futures = {
+                secret_name: executor.submit(self.get_secret, secret_name)
+                for secret_name in secret_names
+            }
+        
+        for secret_name, future in futures.items():
             try:
-                value = self.get_secret(secret_name)
-                secrets[secret_name] = value
+                secrets[secret_name] = future.result()
             except ResourceNotFoundError:
-                logger.warning(f"Secret not found: {secret_name}")
+                logger.warning("Secret not found: {}", secret_name)
             except Exception as e:
-                logger.error(f"Error retrieving {secret_name}: {e}")
+                logger.error("Error retrieving {}: {}", secret_name, e)
         
-        logger.info(f"✓ Retrieved {len(secrets)}/{len(secret_names)} secrets")
+        logger.info("✓ Retrieved {}/{} secrets", len(secrets), len(secret_names))
         return secrets
     
     def secret_exists(self, secret_name: str) -> bool:
         """
         Check if a secret exists in the vault.
         
+        Uses the (briefly cached) list of secret names rather than fetching
+        the secret value itself. When the identity may not list secrets, or
+        the vault is too large to enumerate, the secret is fetched instead.
+        
         Args:
             secret_name: Name of the secret
             
         Returns:
             True if secret exists, False otherwise
             
+        Raises:
+            HttpResponseError: If the fallback fetch fails for another reason
+            
         Example:
             >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
             >>> if kv.secret_exists("api-key"):
             ...     print("API key is configured")
         """
-        try:
-            self.client.get_secret(secret_name)
+        if self._get_cached(secret_name) is not None:
             return True
+        
+        name_set = self._get_name_set()
+        if name_set is not None:
+            return secret_name in name_set
+        
+        try:
+            secret = self.client.get_secret(secret_name)
         except ResourceNotFoundError:
             return False
-        except Exception as e:
-            logger.error(f"Error checking secret {secret_name}: {e}")
-            return False
+        self._set_cached(secret_name, secret.value)
+        return True
     
     def update_secret_properties(
         self,
@@ -277,35 +401,93 @@ class KeyVaultClient:
             ...     tags={"environment": "production", "version": "v2"}
             ... )
         """
-        logger.info(f"Updating properties for secret: {secret_name}")
+        logger.info("Updating properties for secret: {}", secret_name)
         
         try:
-            # Get current properties
-            secret = self.client.get_secret(secret_name)
-            properties = secret.properties
-            
-            # Update properties
-            if enabled is not None:
-                properties.enabled = enabled
-            if content_type is not None:
-                properties.content_type = content_type
-            if tags is not None:
-                properties.tags = tags
+            # Key Vault patches only the supplied fields; omitted ones are kept
+            changes = {
+                key: value
+                for key, value in (
+                    ("enabled", enabled),
+                    ("content_type", content_type),
+                    ("tags", tags),
+                )
+                if value is not None
+            }
+            updated = self.client.update_secret_properties(secret_name, **changes)
+            self.invalidate(secret_name)
             
-            # Update in Key Vault
-            updated = self.client.update_secret_properties(
-                secret_name,
-                enabled=properties.enabled,
-                content_type=properties.content_type,
-                tags=properties.tags,
-            )
-            
-            logger.info(f"✓ Updated properties for secret: {secret_name}")
+            logger.info("✓ Updated properties for secret: {}", secret_name)
             return updated
         except Exception as e:
-            logger.error(f"Failed to update secret properties: {e}")
+            logger.error("Failed to update secret properties: {}", e)
             raise
     
+    def invalidate(self, secret_name: str) -> None:
+        """
+        Drop a secret from the in-memory cache.
+        
+        Args:
+            secret_name: Name of the secret
+            
+        Example:
+            >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
+            >>> kv.invalidate("api-key")  # next get_secret hits Key Vault
+        """
+        with self._cache_lock:
+            self._cache.pop(secret_name, None)
+            self._name_set_expires = 0.0
+    
+    def invalidate_all(self) -> None:
+        """
+        Drop all secrets from the in-memory cache.
+        
+        Example:
+            >>> kv = KeyVaultClient("https://myvault.vault.azure.net")
+            >>> kv.invalidate_all()
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._name_set_expires = 0.0
+    
+    def _get_cached(self, secret_name: str) -> str | None:
+        """Return a cached secret value if present and not expired."""
+        entry = self._cache.get(secret_name)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+    
+    def _set_cached(self, secret_name: str, value: str | None) -> None:
+        """Cache a secret value for cache_ttl seconds."""
+        if self.cache_ttl <= 0 or value is None:
+            return
+        with self._cache_lock:
+            self._cache[secret_name] = (time.monotonic() + self.cache_ttl, value)
+    
+    def _get_name_set(self) -> frozenset[str] | None:
+        """
+        Return secret names in the vault, re-listing after NAME_SET_TTL.
+        
+        Returns None when the names cannot be listed (e.g. no list
+        permission) or there are more than NAME_SET_MAX_SECRETS; that outcome
+        is cached for NAME_SET_TTL too.
+        """
+        name_set = self._name_set
+        if time.monotonic() >= self._name_set_expires:
+            try:
+                names = frozenset(islice(
+                    (prop.name for prop in self.client.list_properties_of_secrets()),
+                    self.NAME_SET_MAX_SECRETS + 1,
+                ))
+                name_set = names if len(names) <= self.NAME_SET_MAX_SECRETS else None
+            except HttpResponseError as e:
+                logger.debug("Cannot list secrets, probing by name: {}", e)
+                name_set = None
+            with self._cache_lock:
+                self._name_set = name_set
+                self._name_set_expires = time.monotonic() + self.NAME_SET_TTL
+        return name_set
+    
     def close(self) -> None:
         """
         Close the Key Vault client.
@@ -319,6 +501,20 @@ class KeyVaultClient:
         """
         logger.info("Closing Key Vault client")
         self.client.close()
+    
+    @classmethod
+    def close_shared(cls) -> None:
+        """
+        Close the connection pool shared by all KeyVaultClient instances.
+        
+        Call once at process shutdown; clients created afterwards get a new pool.
+        
+        Example:
+            >>> KeyVaultClient.close_shared()
+        """
+        if _get_shared_transport.cache_info().currsize:
+            _get_shared_transport().session.close()
+            _get_shared_transport.cache_clear()
 
 
 def main() -> None:
@@ -364,7 +560,7 @@ def main() -> None:
         
         # Close client
         kv.close()
-        
+    
     except Exception as e:
         logger.error(f"Error: {e}")
         logger.info(
@@ -10,13 +10,119 @@ Example:
     >>> client.upload_blob("data.txt", b"Hello, Azure!")
 """
 
-from collections.abc import Iterator
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from functools import cache, lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Any, BinaryIO
+from urllib.parse import quote
 
+import requests
+from azure.core import MatchConditions
+from azure.core.credentials import TokenCredential
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import HttpResponse, RequestsTransport
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobClient, BlobServiceClient, ContainerClient
+from azure.storage.blob import (
+    BlobClient,
+    BlobProperties,
+    BlobSasPermissions,
+    BlobServiceClient,
+    StandardBlobTier,
+    generate_blob_sas,
+)
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from credentials import CachingTokenCredential
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@cache
+def _get_shared_credential() -> CachingTokenCredential:
+    """
+    Get the process-wide DefaultAzureCredential with in-memory token caching.
+    
+    Returns:
+        Shared caching credential
+    """
+    return CachingTokenCredential(DefaultAzureCredential())
+
+
+# Percent-encode blob names for use in URLs; copies often repeat names
+_quote = lru_cache(maxsize=8192)(quote)
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+@cache
+def _get_shared_transport() -> RequestsTransport:
+    """
+    Get the process-wide HTTP transport for BlobServiceClient instances.
+    
+    The default requests pool keeps only 10 connections per host, which is
+    smaller than the parallelism of chunked transfers and batch fan-out;
+    extra connections are opened and dropped on every burst. The adapter
+    here keeps enough idle keep-alive connections to avoid repeated TLS
+    handshakes. Retries are left to the SDK's own retry policy.
+    
+    Returns:
+        Shared RequestsTransport instance
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+_service_clients: dict[tuple[str, TokenCredential | None], BlobServiceClient] = {}
+_service_clients_lock = threading.Lock()
+
+
+def _get_service_client(
+    account_url: str,
+    credential: TokenCredential | None = None,
+) -> BlobServiceClient:
+    """
+    Get the shared BlobServiceClient for a storage account.
+    
+    Container and blob clients derived from one service client share its
+    HTTP pipeline, so every BlobStorageClient for the same account and
+    credential reuses a single connection pool.
+    
+    Args:
+        account_url: Blob service endpoint of the storage account
+        credential: Credential to authenticate with (shared
+            DefaultAzureCredential if None)
+            
+    Returns:
+        Shared BlobServiceClient instance
+    """
+    key = (account_url, credential)
+    with _service_clients_lock:
+        service_client = _service_clients.get(key)
+        if service_client is None:
+            service_client = BlobServiceClient(
+                account_url=account_url,
+                credential=credential or _get_shared_credential(),
+                transport=_get_shared_transport(),
+            )
+            _service_clients[key] = service_client
+        return service_client
 
 
 class BlobStorageClient:
@@ -35,38 +141,51 @@ class BlobStorageClient:
         >>> storage.upload_blob("file.txt", b"content")
     """
     
-    def __init__(self, account_name: str, container_name: str) -> None:
+    # Maximum number of BlobClient objects kept per instance
+    BLOB_CLIENT_CACHE_SIZE = 4096
+    
+    def __init__(
+        self,
+        account_name: str,
+        container_name: str,
+        credential: TokenCredential | None = None,
+    ) -> None:
         """
         Initialize Blob Storage client.
         
         Args:
             account_name: Azure Storage account name
             container_name: Container name
-            
+            credential: Credential to use instead of the shared
+                DefaultAzureCredential (see credentials.make_fast_credential)
+                
         Example:
             >>> storage = BlobStorageClient("mystorageaccount", "data")
         """
         self.account_name = account_name
         self.container_name = container_name
         
-        account_url = f"https://{account_name}.blob.core.windows.net"
-        logger.info(f"Initializing Blob Storage client: {account_url}")
+        self._account_url = f"https://{account_name}.blob.core.windows.net"
+        logger.info("Initializing Blob Storage client: {}", self._account_url)
         
-        # DefaultAzureCredential for automatic authentication
-        credential = DefaultAzureCredential()
-        
-        # Create service client
-        self.service_client = BlobServiceClient(
-            account_url=account_url,
-            credential=credential,
-        )
+        # Service client shared per account and credential
+        self.service_client = _get_service_client(self._account_url, credential)
         
         # Get container client
         self.container_client = self.service_client.get_container_client(
             container_name
         )
         
-        logger.info(f"Blob Storage client initialized: {container_name}")
+        # Reuse BlobClient objects for repeatedly accessed blob names
+        self._get_blob_client = lru_cache(maxsize=self.BLOB_CLIENT_CACHE_SIZE)(
+            self._create_blob_client
+        )
+        
+        logger.info("Blob Storage client initialized: {}", container_name)
+    
+    def _create_blob_client(self, blob_name: str) -> BlobClient:
+        """Create a BlobClient for a blob in this container."""
+        return self.container_client.get_blob_client(blob_name)
     
     def create_container_if_not_exists(self) -> None:
         """
@@ -76,88 +195,166 @@ class BlobStorageClient:
             >>> storage = BlobStorageClient("account", "container")
             >>> storage.create_container_if_not_exists()
         """
-        logger.info(f"Creating container: {self.container_name}")
+        logger.info("Creating container: {}", self.container_name)
         
         try:
             self.container_client.create_container()
-            logger.info(f"✓ Container created: {self.container_name}")
+            logger.info("✓ Container created: {}", self.container_name)
         except ResourceExistsError:
-            logger.info(f"Container already exists: {self.container_name}")
+            logger.info("Container already exists: {}", self.container_name)
         except Exception as e:
-            logger.error(f"Failed to create container: {e}")
+            logger.error("Failed to create container: {}", e)
             raise
     
     def upload_blob(
         self,
         blob_name: str,
-        data: bytes | str,
+        data: bytes | str | BinaryIO,
         overwrite: bool = False,
+        max_concurrency: int = 4,
     ) -> None:
         """
         Upload data to blob.
         
+        Large payloads are split into blocks and sent on up to
+        max_concurrency parallel connections. bytes is the fast path; str
+        forces a UTF-8 encode inside the SDK.
+        
         Args:
             blob_name: Name of the blob
-            data: Data to upload (bytes or string)
+            data: Data to upload (bytes, string, or binary file object)
             overwrite: Overwrite if blob exists
+            max_concurrency: Maximum parallel block uploads
             
         Example:
             >>> storage = BlobStorageClient("account", "container")
             >>> storage.upload_blob("file.txt", b"Hello, Azure!")
             >>> storage.upload_blob("data.json", '{"key": "value"}')
         """
-        logger.info(f"Uploading blob: {blob_name}")
+        logger.debug("Uploading blob: {}", blob_name)
         
         try:
-            blob_client = self.container_client.get_blob_client(blob_name)
-            blob_client.upload_blob(data, overwrite=overwrite)
-            logger.info(f"✓ Successfully uploaded: {blob_name}")
+            blob_client = self._get_blob_client(blob_name)
+            blob_client.upload_blob(
+                data,
+                overwrite=overwrite,
+                max_concurrency=max_concurrency,
+            )
+            logger.debug("✓ Successfully uploaded: {}", blob_name)
         except ResourceExistsError:
-            logger.error(f"Blob already exists: {blob_name}")
+            logger.error("Blob already exists: {}", blob_name)
             raise
         except Exception as e:
-            logger.error(f"Failed to upload blob: {e}")
+            logger.error("Failed to upload blob: {}", e)
             raise
     
+    def upload_json(
+        self,
+        blob_name: str,
+        obj: Any,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Serialize an object to JSON and upload it as a blob.
+        
+        Uses orjson when installed, which produces bytes directly without an
+        intermediate str.
+        
+        Args:
+            blob_name: Name of the blob
+            obj: JSON-serializable object
+            overwrite: Overwrite if blob exists
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> storage.upload_json("data.json", {"key": "value"})
+        """
+        if orjson is not None:
+            data = orjson.dumps(obj)
+        else:
+            data = json.dumps(obj, separators=(",", ":")).encode()
+        self.upload_blob(blob_name, data, overwrite=overwrite)
+    
+    def create_blob(self, blob_name: str, data: bytes | str | BinaryIO) -> bool:
+        """
+        Create a blob only if it does not already exist.
+        
+        Single round-trip create-if-absent: the upload carries an
+        If-None-Match: * precondition, so there is no need to call
+        blob_exists first.
+        
+        Args:
+            blob_name: Name of the blob
+            data: Data to upload (bytes, string, or binary file object)
+            
+        Returns:
+            True if the blob was created, False if it already existed
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> if not storage.create_blob("lock.txt", b"owner-1"):
+            ...     print("Already taken")
+        """
+        try:
+            self._get_blob_client(blob_name).upload_blob(
+                data,
+                match_condition=MatchConditions.IfMissing,
+            )
+        except ResourceExistsError:
+            logger.debug("Blob already exists: {}", blob_name)
+            return False
+        logger.debug("✓ Created blob: {}", blob_name)
+        return True
+    
     def upload_file(
         self,
         blob_name: str,
         file_path: str | Path,
         overwrite: bool = False,
+        max_concurrency: int = 4,
     ) -> None:
         """
         Upload file to blob storage.
         
+        The file is streamed to the SDK in blocks rather than read into memory.
+        
         Args:
             blob_name: Name of the blob
             file_path: Path to local file
             overwrite: Overwrite if blob exists
+            max_concurrency: Maximum parallel block uploads
             
         Example:
             >>> storage = BlobStorageClient("account", "container")
             >>> storage.upload_file("backup.zip", "/path/to/backup.zip")
         """
         file_path = Path(file_path)
-        logger.info(f"Uploading file: {file_path} -> {blob_name}")
+        logger.info("Uploading file: {} -> {}", file_path, blob_name)
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
             with open(file_path, "rb") as f:
-                self.upload_blob(blob_name, f.read(), overwrite=overwrite)
+                self.upload_blob(
+                    blob_name,
+                    f,
+                    overwrite=overwrite,
+                    max_concurrency=max_concurrency,
+                )
             
-            logger.info(f"✓ Successfully uploaded file: {blob_name}")
+            logger.info("✓ Successfully uploaded file: {}", blob_name)
         except Exception as e:
-            logger.error(f"Failed to upload file: {e}")
+            logger.error("Failed to upload file: {}", e)
             raise
     
-    def download_blob(self, blob_name: str) -> bytes:
+    def download_blob(self, blob_name: str, max_concurrency: int = 4) -> bytes:
         """
         Download blob data.
         
         Args:
             blob_name: Name of the blob
+            max_concurrency: Maximum parallel range downloads
             
         Returns:
             Blob data as bytes
@@ -167,81 +364,114 @@ class BlobStorageClient:
             >>> data = storage.download_blob("file.txt")
             >>> print(data.decode())
         """
-        logger.info(f"Downloading blob: {blob_name}")
+        logger.debug("Downloading blob: {}", blob_name)
         
         try:
-            blob_client = self.container_client.get_blob_client(blob_name)
-            data = blob_client.download_blob().readall()
-            logger.info(f"✓ Downloaded {len(data)} bytes from {blob_name}")
+            blob_client = self._get_blob_client(blob_name)
+            data = blob_client.download_blob(max_concurrency=max_concurrency).readall()
+            logger.debug("✓ Downloaded {} bytes from {}", len(data), blob_name)
             return data
         except ResourceNotFoundError:
-            logger.error(f"Blob not found: {blob_name}")
+            logger.error("Blob not found: {}", blob_name)
             raise
         except Exception as e:
-            logger.error(f"Failed to download blob: {e}")
+            logger.error("Failed to download blob: {}", e)
             raise
     
     def download_to_file(
         self,
         blob_name: str,
         file_path: str | Path,
+        max_concurrency: int = 4,
     ) -> None:
         """
         Download blob to local file.
         
+        Chunks are written straight to disk, so memory use is bounded by the
+        chunk size rather than the blob size.
+        
         Args:
             blob_name: Name of the blob
             file_path: Destination file path
+            max_concurrency: Maximum parallel range downloads
             
         Example:
             >>> storage = BlobStorageClient("account", "container")
             >>> storage.download_to_file("backup.zip", "/tmp/backup.zip")
         """
         file_path = Path(file_path)
-        logger.info(f"Downloading blob to file: {blob_name} -> {file_path}")
+        logger.info("Downloading blob to file: {} -> {}", blob_name, file_path)
         
         try:
-            data = self.download_blob(blob_name)
+            # The first request is issued here, so a missing blob fails
+            # before the destination file is created
+            blob_client = self._get_blob_client(blob_name)
+            downloader = blob_client.download_blob(max_concurrency=max_concurrency)
             
             file_path.parent.mkdir(parents=True, exist_ok=True)
             with open(file_path, "wb") as f:
-                f.write(data)
+                size = downloader.readinto(f)
             
-            logger.info(f"✓ Downloaded to: {file_path}")
+            logger.info("✓ Downloaded {} bytes to: {}", size, file_path)
         except Exception as e:
-            logger.error(f"Failed to download to file: {e}")
+            logger.error("Failed to download to file: {}", e)
             raise
     
-    def list_blobs(self, prefix: str | None = None) -> list[str]:
+    # Largest page the List Blobs API returns; fewer pages means fewer round-trips
+    LIST_PAGE_SIZE = 5000
+    
+    def list_blobs(self, prefix: str | None = None) -> Iterator[str]:
         """
-        List all blobs in container.
+        Iterate over blobs in container.
+        
+        Names are yielded page by page as the SDK fetches them, so callers
+        can stop early and memory stays bounded by the page size.
         
         Args:
             prefix: Optional prefix filter
             
-        Returns:
-            List of blob names
+        Yields:
+            Blob names
             
         Example:
             >>> storage = BlobStorageClient("account", "container")
-            >>> blobs = storage.list_blobs()
-            >>> for name in blobs:
+            >>> for name in storage.list_blobs():
             ...     print(name)
             >>> 
             >>> # List with prefix
-            >>> logs = storage.list_blobs(prefix="logs/")
+            >>> logs = list(storage.list_blobs(prefix="logs/"))
         """
-        logger.info(f"Listing blobs (prefix={prefix})")
+        logger.info("Listing blobs (prefix={})", prefix)
         
         try:
-            blob_list = self.container_client.list_blobs(name_starts_with=prefix)
-            blob_names = [blob.name for blob in blob_list]
-            logger.info(f"✓ Found {len(blob_names)} blobs")
-            return blob_names
+            blob_list = self.container_client.list_blobs(
+                name_starts_with=prefix,
+                results_per_page=self.LIST_PAGE_SIZE,
+            )
+            for blob in blob_list:
+                yield blob.name
         except Exception as e:
-            logger.error(f"Failed to list blobs: {e}")
+            logger.error("Failed to list blobs: {}", e)
             raise
     
+    def list_blobs_eager(self, prefix: str | None = None) -> list[str]:
+        """
+        List all blobs in container.
+        
+        Args:
+            prefix: Optional prefix filter
+            
+        Returns:
+            List of blob names
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> blobs = storage.list_blobs_eager(prefix="logs/")
+        """
+        blob_names = list(self.list_blobs(prefix=prefix))
+        logger.info("✓ Found {} blobs", len(blob_names))
+        return blob_names
+    
     def delete_blob(self, blob_name: str) -> None:
         """
         Delete a blob.
@@ -253,22 +483,107 @@ class BlobStorageClient:
             >>> storage = BlobStorageClient("account", "container")
             >>> storage.delete_blob("old-file.txt")
         """
-        logger.info(f"Deleting blob: {blob_name}")
+        logger.debug("Deleting blob: {}", blob_name)
         
         try:
-            blob_client = self.container_client.get_blob_client(blob_name)
+            blob_client = self._get_blob_client(blob_name)
             blob_client.delete_blob()
-            logger.info(f"✓ Deleted blob: {blob_name}")
+            logger.debug("✓ Deleted blob: {}", blob_name)
         except ResourceNotFoundError:
-            logger.warning(f"Blob not found: {blob_name}")
+            logger.warning("Blob not found: {}", blob_name)
         except Exception as e:
-            logger.error(f"Failed to delete blob: {e}")
+            logger.error("Failed to delete blob: {}", e)
             raise
     
+    # Maximum number of sub-requests the Blob Batch API accepts per call
+    BATCH_SIZE = 256
+    
+    def delete_blobs(self, blob_names: Iterable[str]) -> int:
+        """
+        Delete many blobs using Blob Batch requests.
+        
+        Deletes are packed BATCH_SIZE at a time into a single HTTP call
+        instead of one round-trip per blob.
+        
+        Args:
+            blob_names: Names of the blobs to delete
+            
+        Returns:
+            Number of blobs deleted
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> storage.delete_blobs(["logs/1.txt", "logs/2.txt"])
+        """
+        logger.info("Deleting blobs in batches")
+        deleted = self._run_batches(
+            blob_names,
+            lambda batch: self.container_client.delete_blobs(
+                *batch, raise_on_any_failure=False
+            ),
+        )
+        logger.info("✓ Deleted {} blobs", deleted)
+        return deleted
+    
+    def set_blobs_tier(
+        self,
+        blob_names: Iterable[str],
+        tier: StandardBlobTier | str,
+    ) -> int:
+        """
+        Set the access tier of many blobs using Blob Batch requests.
+        
+        Args:
+            blob_names: Names of the blobs to update
+            tier: Target tier (e.g. "Hot", "Cool", "Archive")
+            
+        Returns:
+            Number of blobs updated
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> storage.set_blobs_tier(["old/1.bin", "old/2.bin"], "Archive")
+        """
+        logger.info("Setting tier {} in batches", tier)
+        updated = self._run_batches(
+            blob_names,
+            lambda batch: self.container_client.set_standard_blob_tier_blobs(
+                tier, *batch, raise_on_any_failure=False
+            ),
+        )
+        logger.info("✓ Set tier {} on {} blobs", tier, updated)
+        return updated
+    
+    def _run_batches(
+        self,
+        blob_names: Iterable[str],
+        operation: Callable[[list[str]], Iterator[HttpResponse]],
+    ) -> int:
+        """Run a batch operation over blob names in BATCH_SIZE chunks."""
+        succeeded = 0
+        names = iter(blob_names)
+        while batch := list(islice(names, self.BATCH_SIZE)):
+            for blob_name, response in zip(batch, operation(batch), strict=True):
+                if response.status_code < 300:
+                    succeeded += 1
+                elif response.status_code == 404:
+                    logger.warning("Blob not found: {}", blob_name)
+                else:
+                    logger.error(
+                        "Batch operation failed for {}: {}",
+                        blob_name,
+                        response.status_code,
+                    )
+        return succeeded
+    
     def blob_exists(self, blob_name: str) -> bool:
         """
         Check if blob exists.
         
+        Only use this when the content is not needed: checking and then
+        downloading costs two round-trips, whereas try_download_blob and
+        get_blob_properties_if_exists answer in one.
+        
         Args:
             blob_name: Name of the blob
             
@@ -281,15 +596,65 @@ class BlobStorageClient:
             ...     print("File exists")
         """
         try:
-            blob_client = self.container_client.get_blob_client(blob_name)
+            blob_client = self._get_blob_client(blob_name)
             blob_client.get_blob_properties()
             return True
         except ResourceNotFoundError:
             return False
         except Exception as e:
-            logger.error(f"Error checking blob {blob_name}: {e}")
+            logger.error("Error checking blob {}: {}", blob_name, e)
             return False
     
+    def try_download_blob(
+        self,
+        blob_name: str,
+        max_concurrency: int = 4,
+    ) -> bytes | None:
+        """
+        Download blob data, or return None if the blob does not exist.
+        
+        Args:
+            blob_name: Name of the blob
+            max_concurrency: Maximum parallel range downloads
+            
+        Returns:
+            Blob data as bytes, or None if not found
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> data = storage.try_download_blob("config.json")
+            >>> if data is not None:
+            ...     print(data.decode())
+        """
+        try:
+            blob_client = self._get_blob_client(blob_name)
+            return blob_client.download_blob(max_concurrency=max_concurrency).readall()
+        except ResourceNotFoundError:
+            return None
+    
+    def get_blob_properties_if_exists(
+        self,
+        blob_name: str,
+    ) -> dict[str, str | int] | None:
+        """
+        Get blob properties, or None if the blob does not exist.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            Dictionary with blob properties, or None if not found
+            
+        Example:
+            >>> storage = BlobStorageClient("account", "container")
+            >>> props = storage.get_blob_properties_if_exists("file.txt")
+        """
+        try:
+            blob_client = self._get_blob_client(blob_name)
+            return self._properties_to_dict(blob_name, blob_client.get_blob_properties())
+        except ResourceNotFoundError:
+            return None
+    
     def get_blob_properties(self, blob_name: str) -> dict[str, str | int]:
         """
         Get blob properties.
@@ -306,36 +671,57 @@ class BlobStorageClient:
             >>> print(f"Size: {props['size']} bytes")
             >>> print(f"Content type: {props['content_type']}")
         """
-        logger.info(f"Getting properties for blob: {blob_name}")
+        logger.debug("Getting properties for blob: {}", blob_name)
         
         try:
-            blob_client = self.container_client.get_blob_client(blob_name)
+            blob_client = self._get_blob_client(blob_name)
             properties = blob_client.get_blob_properties()
             
-            return {
-                "name": blob_name,
-                "size": properties.size,
-                "content_type": properties.content_settings.content_type,
-                "last_modified": str(properties.last_modified),
-                "etag": properties.etag,
-            }
+            return self._properties_to_dict(blob_name, properties)
         except Exception as e:
-            logger.error(f"Failed to get blob properties: {e}")
+            logger.error("Failed to get blob properties: {}", e)
             raise
     
+    @staticmethod
+    def _properties_to_dict(blob_name: str, properties: BlobProperties) -> dict[str, str | int]:
+        """Convert SDK BlobProperties to the dictionary returned by this client."""
+        return {
+            "name": blob_name,
+            "size": properties.size,
+            "content_type": properties.content_settings.content_type,
+            "last_modified": str(properties.last_modified),
+            "etag": properties.etag,
+        }
+    
     def copy_blob(
         self,
         source_blob: str,
         dest_blob: str,
         source_container: str | None = None,
-    ) -> None:
+        wait: bool = True,
+        timeout: float = 300.0,
+        authorize_source: bool = False,
+    ) -> str:
         """
         Copy blob within or across containers.
         
+        The copy runs server-side; no blob data passes through this process.
+        
         Args:
             source_blob: Source blob name
             dest_blob: Destination blob name
             source_container: Source container (uses same if None)
+            wait: Poll until the copy leaves the "pending" state
+            timeout: Maximum seconds to wait for completion
+            authorize_source: Append a short-lived user delegation SAS to the
+                source URL (needed when the source blob is not public)
+                
+        Returns:
+            Copy status ("success", or "pending" when wait is False)
+            
+        Raises:
+            TimeoutError: If the copy is still pending after timeout
+            RuntimeError: If the copy failed or was aborted
             
         Example:
             >>> storage = BlobStorageClient("account", "container")
@@ -345,26 +731,70 @@ class BlobStorageClient:
             >>> storage.copy_blob("file.txt", "backup.txt", source_container="other")
         """
         source_container = source_container or self.container_name
-        logger.info(f"Copying blob: {source_container}/{source_blob} -> {dest_blob}")
+        logger.info("Copying blob: {}/{} -> {}", source_container, source_blob, dest_blob)
         
         try:
-            source_url = (
-                f"https://{self.account_name}.blob.core.windows.net/"
-                f"{source_container}/{source_blob}"
-            )
+            source_url = f"{self._account_url}/{source_container}/{_quote(source_blob)}"
+            if authorize_source:
+                source_url = f"{source_url}?{self._read_sas(source_container, source_blob)}"
+            
+            dest_client = self._get_blob_client(dest_blob)
+            copy = dest_client.start_copy_from_url(source_url)
+            status = copy["copy_status"]
             
-            dest_client = self.container_client.get_blob_client(dest_blob)
-            dest_client.start_copy_from_url(source_url)
+            if wait:
+                status = self._wait_for_copy(dest_client, status, timeout)
             
-            logger.info(f"✓ Copied blob: {source_blob} -> {dest_blob}")
+            logger.info("✓ Copied blob ({}): {} -> {}", status, source_blob, dest_blob)
+            return status
         except Exception as e:
-            logger.error(f"Failed to copy blob: {e}")
+            logger.error("Failed to copy blob: {}", e)
             raise
     
+    def _wait_for_copy(
+        self,
+        blob_client: BlobClient,
+        status: str,
+        timeout: float,
+    ) -> str:
+        """Poll a pending copy with exponential backoff until it finishes."""
+        deadline = time.monotonic() + timeout
+        delay = 0.5
+        while status == "pending":
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Copy still pending after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 10.0)
+            copy_props = blob_client.get_blob_properties().copy
+            status = copy_props.status
+            if status in ("failed", "aborted"):
+                raise RuntimeError(f"Copy {status}: {copy_props.status_description}")
+        return status
+    
+    def _read_sas(self, container_name: str, blob_name: str) -> str:
+        """Generate a one-hour read-only user delegation SAS for a blob."""
+        start = datetime.now(UTC)
+        expiry = start + timedelta(hours=1)
+        delegation_key = self.service_client.get_user_delegation_key(
+            key_start_time=start,
+            key_expiry_time=expiry,
+        )
+        return generate_blob_sas(
+            account_name=self.account_name,
+            container_name=container_name,
+            blob_name=blob_name,
+            user_delegation_key=delegation_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=expiry,
+        )
+    
     def close(self) -> None:
         """
         Close the storage client.
         
+        The underlying service client is shared with other instances for the
+        same account and stays open; use close_shared() at process shutdown.
+        
         Example:
             >>> storage = BlobStorageClient("account", "container")
             >>> try:
@@ -373,7 +803,29 @@ class BlobStorageClient:
             ...     storage.close()
         """
         logger.info("Closing Blob Storage client")
-        self.service_client.close()
+    
+    @classmethod
+    def close_shared(cls) -> None:
+        """
+        Close the service clients and connection pool shared by all
+        BlobStorageClient instances.
+        
+        Call once at process shutdown; clients created afterwards get a new pool.
+        
+        Example:
+            >>> BlobStorageClient.close_shared()
+        """
+        with _service_clients_lock:
+            service_clients = list(_service_clients.values())
+            _service_clients.clear()
+        
+        for service_client in service_clients:
+            service_client.close()
+        
+        # The transport does not own its session, so close the pool here
+        if _get_shared_transport.cache_info().currsize:
+            _get_shared_transport().session.close()
+            _get_shared_transport.cache_clear()
 
 
 def main() -> None:
@@ -425,7 +877,7 @@ def main() -> None:
         
         # Close client
         storage.close()
-        
+    
     except Exception as e:
         logger.error(f"Error: {e}")
         logger.info(
@@ -0,0 +1,401 @@
+"""
+Asynchronous Azure Blob Storage operations using DefaultAzureCredential.
+
+Async counterpart of storage.BlobStorageClient built on the
+azure.storage.blob.aio SDK, so a single event loop can keep many blob
+requests in flight at once.
+
+Example:
+    >>> import asyncio
+    >>> from storage_async import AsyncBlobStorageClient
+    >>> async def demo() -> None:
+    ...     async with AsyncBlobStorageClient("mystorageaccount", "mycontainer") as client:
+    ...         await client.upload_blob("data.txt", b"Hello, Azure!")
+    >>> asyncio.run(demo())
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from types import TracebackType
+from urllib.parse import quote
+
+import aiohttp
+from azure.core.credentials_async import AsyncTokenCredential
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob.aio import BlobServiceClient
+from loguru import logger
+
+# Connection pool sizing for the shared aiohttp session
+POOL_LIMIT = 64
+KEEPALIVE_TIMEOUT = 60
+
+
+def create_shared_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session for several AsyncBlobStorageClient instances.
+    
+    Unlike the sync client's process-wide pool, an aiohttp session is bound
+    to the event loop it was created on, so this must be called from a
+    coroutine. The caller owns the session and closes it once every client
+    using it is done; the clients themselves leave it open.
+    
+    Returns:
+        Session with a connector sized for concurrent blob requests
+        
+    Example:
+        >>> async with create_shared_session() as session:
+        ...     async with AsyncBlobStorageClient("account", "a", session=session) as a:
+        ...         await a.upload_blob("file.txt", b"data")
+    """
+    connector = aiohttp.TCPConnector(limit=POOL_LIMIT, keepalive_timeout=KEEPALIVE_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class AsyncBlobStorageClient:
+    """
+    Async Azure Blob Storage client with DefaultAzureCredential.
+    
+    Mirrors the synchronous BlobStorageClient API with coroutine methods.
+    Use it as an async context manager so the HTTP session and credential
+    are released when done.
+    
+    Attributes:
+        account_name: Storage account name
+        container_name: Container name
+        container_client: Azure async ContainerClient instance
+        
+    Example:
+        >>> async with AsyncBlobStorageClient("mystorageaccount", "mycontainer") as storage:
+        ...     await storage.upload_blob("file.txt", b"content")
+    """
+    
+    def __init__(
+        self,
+        account_name: str,
+        container_name: str,
+        credential: AsyncTokenCredential | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """
+        Initialize async Blob Storage client.
+        
+        Args:
+            account_name: Azure Storage account name
+            container_name: Container name
+            credential: Async credential (a DefaultAzureCredential owned by
+                this client is created when omitted)
+            session: Shared aiohttp session from create_shared_session()
+                (the SDK opens a session per client when omitted)
+                
+        Example:
+            >>> storage = AsyncBlobStorageClient("mystorageaccount", "data")
+        """
+        self.account_name = account_name
+        self.container_name = container_name
+        
+        self._account_url = f"https://{account_name}.blob.core.windows.net"
+        logger.info("Initializing async Blob Storage client: {}", self._account_url)
+        
+        self._owns_credential = credential is None
+        self._credential = credential or DefaultAzureCredential()
+        
+        transport_kwargs: dict[str, AioHttpTransport] = {}
+        if session is not None:
+            transport_kwargs["transport"] = AioHttpTransport(
+                session=session,
+                session_owner=False,
+            )
+        
+        self.service_client = BlobServiceClient(
+            account_url=self._account_url,
+            credential=self._credential,
+            **transport_kwargs,
+        )
+        self.container_client = self.service_client.get_container_client(
+            container_name
+        )
+    
+    async def __aenter__(self) -> "AsyncBlobStorageClient":
+        """Enter the async context."""
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the async context and close the client."""
+        await self.close()
+    
+    async def upload_blob(
+        self,
+        blob_name: str,
+        data: bytes | str,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Upload data to blob.
+        
+        Args:
+            blob_name: Name of the blob
+            data: Data to upload (bytes or string)
+            overwrite: Overwrite if blob exists
+            
+        Example:
+            >>> await storage.upload_blob("file.txt", b"Hello, Azure!")
+        """
+        logger.debug("Uploading blob: {}", blob_name)
+        
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            await blob_client.upload_blob(data, overwrite=overwrite)
+            logger.debug("✓ Successfully uploaded: {}", blob_name)
+        except ResourceExistsError:
+            logger.error("Blob already exists: {}", blob_name)
+            raise
+        except Exception as e:
+            logger.error("Failed to upload blob: {}", e)
+            raise
+    
+    async def download_blob(self, blob_name: str) -> bytes:
+        """
+        Download blob data.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            Blob data as bytes
+            
+        Example:
+            >>> data = await storage.download_blob("file.txt")
+        """
+        logger.debug("Downloading blob: {}", blob_name)
+        
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            downloader = await blob_client.download_blob()
+            data = await downloader.readall()
+            logger.debug("✓ Downloaded {} bytes from {}", len(data), blob_name)
+            return data
+        except ResourceNotFoundError:
+            logger.error("Blob not found: {}", blob_name)
+            raise
+        except Exception as e:
+            logger.error("Failed to download blob: {}", e)
+            raise
+    
+    async def upload_many(
+        self,
+        items: Iterable[tuple[str, bytes | str]],
+        overwrite: bool = False,
+        concurrency: int = 32,
+    ) -> None:
+        """
+        Upload many blobs concurrently.
+        
+        Each small blob pays a full round-trip, so issuing them one at a time
+        leaves the connection pool idle. This keeps up to concurrency
+        requests in flight at once. If one upload fails, the rest are
+        cancelled.
+        
+        Args:
+            items: (blob_name, data) pairs to upload
+            overwrite: Overwrite blobs that already exist
+            concurrency: Maximum number of uploads in flight
+            
+        Raises:
+            ExceptionGroup: Wrapping the errors of the failed uploads
+            
+        Example:
+            >>> await storage.upload_many([("a.txt", b"a"), ("b.txt", b"b")])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def upload_one(blob_name: str, data: bytes | str) -> None:
+            async with semaphore:
+                await self.upload_blob(blob_name, data, overwrite=overwrite)
+        
+        async with asyncio.TaskGroup() as tg:
+            for name, data in items:
+                tg.create_task(upload_one(name, data))
+    
+    async def download_many(
+        self,
+        blob_names: Iterable[str],
+        concurrency: int = 32,
+    ) -> dict[str, bytes]:
+        """
+        Download many blobs concurrently.
+        
+        Args:
+            blob_names: Names of the blobs to download
+            concurrency: Maximum number of downloads in flight
+            
+        Returns:
+            Mapping of blob name to blob data
+            
+        Raises:
+            ExceptionGroup: Wrapping the errors of the failed downloads; the
+                rest are cancelled
+            
+        Example:
+            >>> blobs = await storage.download_many(["a.txt", "b.txt"])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def download_one(blob_name: str) -> bytes:
+            async with semaphore:
+                return await self.download_blob(blob_name)
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = {name: tg.create_task(download_one(name)) for name in blob_names}
+        return {name: task.result() for name, task in tasks.items()}
+    
+    async def list_blobs(self, prefix: str | None = None) -> AsyncIterator[str]:
+        """
+        Iterate over blob names in the container.
+        
+        Args:
+            prefix: Optional prefix filter
+            
+        Yields:
+            Blob names
+            
+        Example:
+            >>> async for name in storage.list_blobs(prefix="logs/"):
+            ...     print(name)
+        """
+        logger.info("Listing blobs (prefix={})", prefix)
+        
+        async for blob in self.container_client.list_blobs(name_starts_with=prefix):
+            yield blob.name
+    
+    async def delete_blob(self, blob_name: str) -> None:
+        """
+        Delete a blob.
+        
+        Args:
+            blob_name: Name of the blob to delete
+            
+        Example:
+            >>> await storage.delete_blob("old-file.txt")
+        """
+        logger.debug("Deleting blob: {}", blob_name)
+        
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            await blob_client.delete_blob()
+            logger.debug("✓ Deleted blob: {}", blob_name)
+        except ResourceNotFoundError:
+            logger.warning("Blob not found: {}", blob_name)
+        except Exception as e:
+            logger.error("Failed to delete blob: {}", e)
+            raise
+    
+    async def blob_exists(self, blob_name: str) -> bool:
+        """
+        Check if blob exists.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            True if blob exists, False otherwise
+            
+        Example:
+            >>> if await storage.blob_exists("file.txt"):
+            ...     print("File exists")
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            await blob_client.get_blob_properties()
+            return True
+        except ResourceNotFoundError:
+            return False
+        except Exception as e:
+            logger.error("Error checking blob {}: {}", blob_name, e)
+            return False
+    
+    async def get_blob_properties(self, blob_name: str) -> dict[str, str | int]:
+        """
+        Get blob properties.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            Dictionary with blob properties
+            
+        Example:
+            >>> props = await storage.get_blob_properties("file.txt")
+            >>> print(f"Size: {props['size']} bytes")
+        """
+        logger.debug("Getting properties for blob: {}", blob_name)
+        
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            properties = await blob_client.get_blob_properties()
+            
+            return {
+                "name": blob_name,
+                "size": properties.size,
+                "content_type": properties.content_settings.content_type,
+                "last_modified": str(properties.last_modified),
+                "etag": properties.etag,
+            }
+        except Exception as e:
+            logger.error("Failed to get blob properties: {}", e)
+            raise
+    
+    async def copy_blob(
+        self,
+        source_blob: str,
+        dest_blob: str,
+        source_container: str | None = None,
+    ) -> None:
+        """
+        Start a server-side copy within or across containers.
+        
+        Args:
+            source_blob: Source blob name
+            dest_blob: Destination blob name
+            source_container: Source container (uses same if None)
+            
+        Example:
+            >>> await storage.copy_blob("original.txt", "copy.txt")
+        """
+        source_container = source_container or self.container_name
+        logger.info("Copying blob: {}/{} -> {}", source_container, source_blob, dest_blob)
+        
+        try:
+            source_url = f"{self._account_url}/{source_container}/{quote(source_blob)}"
+            
+            dest_client = self.container_client.get_blob_client(dest_blob)
+            await dest_client.start_copy_from_url(source_url)
+            
+            logger.info("✓ Copied blob: {} -> {}", source_blob, dest_blob)
+        except Exception as e:
+            logger.error("Failed to copy blob: {}", e)
+            raise
+    
+    async def close(self) -> None:
+        """
+        Close the storage client and, if owned, its credential.
+        
+        A shared session passed to the constructor is left open.
+        
+        Example:
+            >>> storage = AsyncBlobStorageClient("account", "container")
+            >>> try:
+            ...     await storage.upload_blob("file.txt", b"data")
+            ... finally:
+            ...     await storage.close()
+        """
+        logger.info("Closing async Blob Storage client")
+        await self.service_client.close()
+        if self._owns_credential:
+            await self._credential.close()
@@ -4,15 +4,48 @@ Pytest tests for Azure integration modules.
 Tests Azure authentication, Key Vault, and Blob Storage with mocks.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core import MatchConditions
+from azure.core.credentials import AccessToken
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.identity import DefaultAzureCredential
 
-from credentials import AzureAuthDemo
-from keyvault import KeyVaultClient
+from credentials import AzureAuthDemo, CachingTokenCredential
+from keyvault import KeyVaultClient, _get_shared_credential
 from storage import BlobStorageClient
+from storage_async import POOL_LIMIT, AsyncBlobStorageClient, create_shared_session
+
+
+@pytest.fixture(scope="session", autouse=True)
+def patch_azure_sdk() -> Iterator[None]:
+    """Replace Azure credentials and service clients with mocks for the whole session."""
+    targets = (
+        "keyvault.DefaultAzureCredential",
+        "storage.DefaultAzureCredential",
+        "storage.BlobServiceClient",
+        "storage_async.DefaultAzureCredential",
+        "storage_async.BlobServiceClient",
+    )
+    patchers = [patch(target) for target in targets]
+    for patcher in patchers:
+        patcher.start()
+    yield
+    for patcher in reversed(patchers):
+        patcher.stop()
 
 
 class TestAzureAuthDemo:
@@ -33,10 +66,15 @@ class TestAzureAuthDemo:
         # Then
         assert isinstance(credential, DefaultAzureCredential)
     
+    @patch("credentials.AzurePowerShellCredential")
+    @patch("credentials.AzureCliCredential")
+    @patch("credentials.ManagedIdentityCredential")
+    @patch("credentials.WorkloadIdentityCredential")
     @patch("credentials.EnvironmentCredential")
     def test_demonstrate_credential_chain_tests_environment(
         self,
         mock_env_cred: MagicMock,
+        *other_creds: MagicMock,
     ) -> None:
         """
         Given: Mocked credentials
@@ -70,6 +108,47 @@ class TestAzureAuthDemo:
         assert credential is not None
 
 
+class TestCachingTokenCredential:
+    """Tests for the token-caching credential wrapper."""
+    
+    def test_get_token_reuses_fresh_token(self) -> None:
+        """
+        Given: A wrapped credential returning a long-lived token
+        When: Requesting the same scope twice
+        Then: The wrapped credential is called once
+        """
+        # Given
+        inner = MagicMock()
+        inner.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+        credential = CachingTokenCredential(inner)
+        
+        # When
+        first = credential.get_token("https://storage.azure.com/.default")
+        second = credential.get_token("https://storage.azure.com/.default")
+        
+        # Then
+        assert first is second
+        inner.get_token.assert_called_once()
+    
+    def test_get_token_refreshes_near_expiry(self) -> None:
+        """
+        Given: A cached token inside the refresh margin
+        When: Requesting the scope again
+        Then: A new token is fetched
+        """
+        # Given
+        inner = MagicMock()
+        inner.get_token.return_value = AccessToken("token", int(time.time()) + 60)
+        credential = CachingTokenCredential(inner, refresh_margin=300)
+        credential.get_token("https://storage.azure.com/.default")
+        
+        # When
+        credential.get_token("https://storage.azure.com/.default")
+        
+        # Then
+        assert inner.get_token.call_count == 2
+
+
 class TestKeyVaultClient:
     """Tests for Key Vault client."""
     
@@ -82,10 +161,9 @@ class TestKeyVaultClient:
     def kv_client(self, mock_secret_client: MagicMock) -> KeyVaultClient:
         """KeyVaultClient fixture with mocked SecretClient."""
         with patch("keyvault.SecretClient", return_value=mock_secret_client):
-            with patch("keyvault.DefaultAzureCredential"):
-                client = KeyVaultClient("https://test.vault.azure.net")
-                client.client = mock_secret_client
-                return client
+            client = KeyVaultClient("https://test.vault.azure.net")
+        client.client = mock_secret_client
+        return client
     
     def test_get_secret_returns_value(
         self,
@@ -109,6 +187,31 @@ class TestKeyVaultClient:
         assert value == "secret-value-123"
         mock_secret_client.get_secret.assert_called_once_with("test-secret")
     
+    def test_get_secret_serves_repeat_reads_from_cache(
+        self,
+        kv_client: KeyVaultClient,
+        mock_secret_client: MagicMock,
+    ) -> None:
+        """
+        Given: A secret that was already retrieved
+        When: Getting it again, then again after invalidation
+        Then: Only the first and post-invalidation reads hit Key Vault
+        """
+        # Given
+        mock_secret = MagicMock()
+        mock_secret.value = "secret-value-123"
+        mock_secret_client.get_secret.return_value = mock_secret
+        kv_client.get_secret("test-secret")
+        
+        # When
+        cached = kv_client.get_secret("test-secret")
+        kv_client.invalidate("test-secret")
+        refreshed = kv_client.get_secret("test-secret")
+        
+        # Then
+        assert cached == refreshed == "secret-value-123"
+        assert mock_secret_client.get_secret.call_count == 2
+    
     def test_get_secret_raises_on_not_found(
         self,
         kv_client: KeyVaultClient,
@@ -159,9 +262,9 @@ class TestKeyVaultClient:
         """
         # Given
         mock_props = [
-            MagicMock(name="secret1"),
-            MagicMock(name="secret2"),
-            MagicMock(name="secret3"),
+            SimpleNamespace(name="secret1"),
+            SimpleNamespace(name="secret2"),
+            SimpleNamespace(name="secret3"),
         ]
         mock_secret_client.list_properties_of_secrets.return_value = mock_props
         
@@ -210,13 +313,16 @@ class TestKeyVaultClient:
         Then: Returns True
         """
         # Given
-        mock_secret_client.get_secret.return_value = MagicMock()
+        mock_prop = MagicMock()
+        mock_prop.name = "existing-secret"
+        mock_secret_client.list_properties_of_secrets.return_value = [mock_prop]
         
         # When
         exists = kv_client.secret_exists("existing-secret")
         
         # Then
         assert exists is True
+        mock_secret_client.get_secret.assert_not_called()
     
     def test_secret_exists_returns_false_when_not_found(
         self,
@@ -229,13 +335,66 @@ class TestKeyVaultClient:
         Then: Returns False
         """
         # Given
-        mock_secret_client.get_secret.side_effect = ResourceNotFoundError()
+        mock_secret_client.list_properties_of_secrets.return_value = []
         
         # When
         exists = kv_client.secret_exists("nonexistent")
         
         # Then
         assert exists is False
+    
+    def test_secret_exists_probes_when_listing_forbidden(
+        self,
+        kv_client: KeyVaultClient,
+        mock_secret_client: MagicMock,
+    ) -> None:
+        """
+        Given: The identity may get secrets but not list them
+        When: Checking if secrets exist
+        Then: Each name is fetched directly; only not-found returns False
+        """
+        # Given
+        mock_secret_client.list_properties_of_secrets.side_effect = HttpResponseError(
+            message="Forbidden"
+        )
+        mock_secret = MagicMock()
+        mock_secret.value = "probe-value"
+        mock_secret_client.get_secret.side_effect = [
+            mock_secret,
+            ResourceNotFoundError("Not found"),
+        ]
+        
+        # When
+        exists = kv_client.secret_exists("existing-secret")
+        missing = kv_client.secret_exists("nonexistent")
+        
+        # Then
+        assert exists is True
+        assert missing is False
+        assert kv_client.get_secret("existing-secret") == "probe-value"
+        assert mock_secret_client.get_secret.call_count == 2
+        mock_secret_client.list_properties_of_secrets.assert_called_once()
+    
+    def test_clients_share_credential(self) -> None:
+        """
+        Given: Two KeyVaultClient instances
+        When: Both are constructed
+        Then: DefaultAzureCredential is created only once
+        """
+        # Given
+        _get_shared_credential.cache_clear()
+        
+        # When
+        with patch("keyvault.SecretClient") as mock_client_cls:
+            with patch("keyvault.DefaultAzureCredential") as mock_cred_cls:
+                KeyVaultClient("https://a.vault.azure.net")
+                KeyVaultClient("https://b.vault.azure.net")
+        _get_shared_credential.cache_clear()
+        
+        # Then
+        mock_cred_cls.assert_called_once_with()
+        credentials = {c.kwargs["credential"] for c in mock_client_cls.call_args_list}
+        assert credentials == {mock_cred_cls.return_value}
 
 
 class TestBlobStorageClient:
@@ -252,11 +411,46 @@ class TestBlobStorageClient:
         mock_container_client: MagicMock,
     ) -> BlobStorageClient:
         """BlobStorageClient fixture with mocked clients."""
-        with patch("storage.BlobServiceClient"):
-            with patch("storage.DefaultAzureCredential"):
-                client = BlobStorageClient("testaccount", "testcontainer")
-                client.container_client = mock_container_client
-                return client
+        client = BlobStorageClient("testaccount", "testcontainer")
+        client.container_client = mock_container_client
+        return client
+    
+    def test_clients_share_service_client_per_account(self) -> None:
+        """
+        Given: Two BlobStorageClient instances for the same account
+        When: Both are constructed
+        Then: They share one BlobServiceClient
+        """
+        # Given
+        BlobStorageClient.close_shared()
+        
+        # When
+        with patch("storage.BlobServiceClient") as mock_service_cls:
+            first = BlobStorageClient("testaccount", "container-a")
+            second = BlobStorageClient("testaccount", "container-b")
+        BlobStorageClient.close_shared()
+        
+        # Then
+        mock_service_cls.assert_called_once()
+        assert first.service_client is second.service_client
+    
+    def test_explicit_credential_passed_to_service_client(self) -> None:
+        """
+        Given: A caller-supplied credential
+        When: Constructing a BlobStorageClient with it
+        Then: The service client authenticates with that credential
+        """
+        # Given
+        BlobStorageClient.close_shared()
+        credential = MagicMock()
+        
+        # When
+        with patch("storage.BlobServiceClient") as mock_service_cls:
+            BlobStorageClient("testaccount", "container", credential=credential)
+        BlobStorageClient.close_shared()
+        
+        # Then
+        assert mock_service_cls.call_args.kwargs["credential"] is credential
     
     def test_upload_blob_uploads_data(
         self,
@@ -279,8 +473,34 @@ class TestBlobStorageClient:
         mock_blob_client.upload_blob.assert_called_once_with(
             b"test data",
             overwrite=False,
+            max_concurrency=4,
         )
     
+    def test_upload_file_streams_file_handle(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Given: A local file
+        When: Uploading the file
+        Then: Passes an open file handle instead of the file contents
+        """
+        # Given
+        file_path = tmp_path / "backup.bin"
+        file_path.write_bytes(b"file contents")
+        mock_blob_client = MagicMock()
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        storage_client.upload_file("backup.bin", file_path)
+        
+        # Then
+        uploaded = mock_blob_client.upload_blob.call_args.args[0]
+        assert not isinstance(uploaded, bytes)
+        assert uploaded.name == str(file_path)
+    
     def test_download_blob_returns_data(
         self,
         storage_client: BlobStorageClient,
@@ -304,6 +524,54 @@ class TestBlobStorageClient:
         # Then
         assert data == b"blob data"
     
+    def test_download_to_file_streams_into_file(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Given: A blob exists
+        When: Downloading it to a file
+        Then: Streams into the open file without reading all bytes
+        """
+        # Given
+        mock_download = MagicMock()
+        mock_download.readinto.side_effect = lambda f: f.write(b"blob data")
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob.return_value = mock_download
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        file_path = tmp_path / "out" / "test.txt"
+        
+        # When
+        storage_client.download_to_file("test.txt", file_path)
+        
+        # Then
+        assert file_path.read_bytes() == b"blob data"
+        mock_download.readall.assert_not_called()
+    
+    def test_try_download_blob_returns_none_when_missing(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: A blob doesn't exist
+        When: Trying to download it
+        Then: Returns None after a single request
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob.side_effect = ResourceNotFoundError()
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        data = storage_client.try_download_blob("missing.txt")
+        
+        # Then
+        assert data is None
+        mock_blob_client.get_blob_properties.assert_not_called()
+    
     def test_list_blobs_returns_names(
         self,
         storage_client: BlobStorageClient,
@@ -316,14 +584,14 @@ class TestBlobStorageClient:
         """
         # Given
         mock_blobs = [
-            MagicMock(name="blob1.txt"),
-            MagicMock(name="blob2.txt"),
-            MagicMock(name="blob3.txt"),
+            SimpleNamespace(name="blob1.txt"),
+            SimpleNamespace(name="blob2.txt"),
+            SimpleNamespace(name="blob3.txt"),
         ]
         mock_container_client.list_blobs.return_value = mock_blobs
         
         # When
-        names = storage_client.list_blobs()
+        names = list(storage_client.list_blobs())
         
         # Then
         assert names == ["blob1.txt", "blob2.txt", "blob3.txt"]
@@ -342,11 +610,12 @@ class TestBlobStorageClient:
         mock_container_client.list_blobs.return_value = []
         
         # When
-        storage_client.list_blobs(prefix="logs/")
+        list(storage_client.list_blobs(prefix="logs/"))
         
         # Then
         mock_container_client.list_blobs.assert_called_once_with(
-            name_starts_with="logs/"
+            name_starts_with="logs/",
+            results_per_page=BlobStorageClient.LIST_PAGE_SIZE,
         )
     
     def test_delete_blob_deletes(
@@ -369,6 +638,140 @@ class TestBlobStorageClient:
         # Then
         mock_blob_client.delete_blob.assert_called_once()
     
+    def test_create_blob_returns_false_when_exists(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: The blob already exists
+        When: Creating it
+        Then: Sends a conditional upload and returns False
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_blob_client.upload_blob.side_effect = ResourceExistsError("exists")
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        created = storage_client.create_blob("lock.txt", b"owner-1")
+        
+        # Then
+        assert created is False
+        mock_blob_client.upload_blob.assert_called_once_with(
+            b"owner-1",
+            match_condition=MatchConditions.IfMissing,
+        )
+    
+    def test_upload_json_sends_bytes(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: A dict payload
+        When: Uploading it as JSON
+        Then: Encoded JSON bytes are passed to the SDK
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        storage_client.upload_json("data.json", {"key": "value"})
+        
+        # Then
+        data = mock_blob_client.upload_blob.call_args.args[0]
+        assert isinstance(data, bytes)
+        assert json.loads(data) == {"key": "value"}
+    
+    def test_blob_client_reused_for_same_name(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: Repeated operations on the same blob
+        When: Uploading and then deleting it
+        Then: The BlobClient is created only once
+        """
+        # When
+        storage_client.upload_blob("test.txt", b"test data")
+        storage_client.delete_blob("test.txt")
+        
+        # Then
+        mock_container_client.get_blob_client.assert_called_once_with("test.txt")
+    
+    def test_delete_blobs_sends_batches(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: More blobs than fit in one batch request
+        When: Deleting them
+        Then: Sends one batch call per BATCH_SIZE blobs and counts successes
+        """
+        # Given
+        names = [f"blob{i}.txt" for i in range(BlobStorageClient.BATCH_SIZE + 1)]
+        mock_container_client.delete_blobs.side_effect = (
+            lambda *batch, **kwargs: [MagicMock(status_code=202) for _ in batch]
+        )
+        
+        # When
+        deleted = storage_client.delete_blobs(names)
+        
+        # Then
+        assert deleted == len(names)
+        assert mock_container_client.delete_blobs.call_count == 2
+    
+    def test_copy_blob_polls_until_complete(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: A server-side copy that starts as pending
+        When: Copying with wait enabled
+        Then: Polls blob properties until the copy succeeds
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_blob_client.start_copy_from_url.return_value = {"copy_status": "pending"}
+        mock_blob_client.get_blob_properties.return_value.copy.status = "success"
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        with patch("storage.time.sleep"):
+            status = storage_client.copy_blob("original.txt", "copy.txt")
+        
+        # Then
+        assert status == "success"
+        mock_blob_client.get_blob_properties.assert_called_once()
+    
+    def test_copy_blob_quotes_source_name(
+        self,
+        storage_client: BlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: A source blob name with a space and a '#'
+        When: Copying without waiting
+        Then: The source URL carries the percent-encoded name
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_blob_client.start_copy_from_url.return_value = {"copy_status": "pending"}
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        storage_client.copy_blob("dir/my file#1.txt", "copy.txt", wait=False)
+        
+        # Then
+        mock_blob_client.start_copy_from_url.assert_called_once_with(
+            "https://testaccount.blob.core.windows.net/testcontainer/dir/my%20file%231.txt"
+        )
+    
     def test_blob_exists_returns_true_when_found(
         self,
         storage_client: BlobStorageClient,
@@ -440,4 +843,162 @@ class TestBlobStorageClient:
         storage_client.upload_blob(blob_name, data, overwrite=overwrite)
         
         # Then
-        mock_blob_client.upload_blob.assert_called_once_with(data, overwrite=overwrite)
+        mock_blob_client.upload_blob.assert_called_once_with(
+            data,
+            overwrite=overwrite,
+            max_concurrency=4,
+        )
+
+
+class TestAsyncBlobStorageClient:
+    """Tests for async Blob Storage client."""
+    
+    @pytest.fixture
+    def mock_container_client(self) -> MagicMock:
+        """Mock async ContainerClient fixture."""
+        return MagicMock()
+    
+    @pytest.fixture
+    def storage_client(
+        self,
+        mock_container_client: MagicMock,
+    ) -> AsyncBlobStorageClient:
+        """AsyncBlobStorageClient fixture with mocked clients."""
+        client = AsyncBlobStorageClient("testaccount", "testcontainer")
+        client.container_client = mock_container_client
+        return client
+    
+    def test_upload_blob_awaits_client(
+        self,
+        storage_client: AsyncBlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: Data to upload
+        When: Uploading blob asynchronously
+        Then: Awaits upload_blob on the blob client
+        """
+        # Given
+        mock_blob_client = MagicMock()
+        mock_blob_client.upload_blob = AsyncMock()
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        asyncio.run(storage_client.upload_blob("test.txt", b"test data"))
+        
+        # Then
+        mock_blob_client.upload_blob.assert_awaited_once_with(b"test data", overwrite=False)
+    
+    def test_upload_many_cancels_remaining_on_failure(
+        self,
+        storage_client: AsyncBlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: One of several uploads fails
+        When: Uploading them concurrently
+        Then: The error is raised and the uploads still in flight are cancelled
+        """
+        # Given
+        cancelled: list[str] = []
+        
+        def make_blob_client(name: str) -> MagicMock:
+            async def upload(data: bytes, overwrite: bool) -> None:
+                if name == "bad.txt":
+                    raise ResourceExistsError("Blob exists")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            
+            mock_blob_client = MagicMock()
+            mock_blob_client.upload_blob = upload
+            return mock_blob_client
+        
+        mock_container_client.get_blob_client.side_effect = make_blob_client
+        items = [("a.txt", b"a"), ("bad.txt", b"x"), ("b.txt", b"b")]
+        
+        # When
+        with pytest.raises(ExceptionGroup) as exc_info:
+            asyncio.run(storage_client.upload_many(items))
+        
+        # Then
+        assert [type(e) for e in exc_info.value.exceptions] == [ResourceExistsError]
+        assert sorted(cancelled) == ["a.txt", "b.txt"]
+    
+    def test_clients_share_session_without_owning_it(self) -> None:
+        """
+        Given: A shared aiohttp session
+        When: Two clients are built on it
+        Then: Both transports use the session and neither owns it
+        """
+        # Given
+        async def build() -> tuple[aiohttp.ClientSession, int, list[AioHttpTransport]]:
+            async with create_shared_session() as session:
+                with patch("storage_async.BlobServiceClient") as mock_service:
+                    AsyncBlobStorageClient("testaccount", "a", session=session)
+                    AsyncBlobStorageClient("testaccount", "b", session=session)
+                return session, session.connector.limit, [
+                    call.kwargs["transport"] for call in mock_service.call_args_list
+                ]
+        
+        # When
+        session, limit, transports = asyncio.run(build())
+        
+        # Then
+        assert limit == POOL_LIMIT
+        assert [transport.session for transport in transports] == [session, session]
+        assert not any(transport._session_owner for transport in transports)
+        assert session.closed
+    
+    def test_download_many_returns_all_blobs(
+        self,
+        storage_client: AsyncBlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: Several blobs exist
+        When: Downloading them concurrently
+        Then: Returns data keyed by blob name
+        """
+        # Given
+        def make_blob_client(name: str) -> MagicMock:
+            mock_download = MagicMock()
+            mock_download.readall = AsyncMock(return_value=name.encode())
+            mock_blob_client = MagicMock()
+            mock_blob_client.download_blob = AsyncMock(return_value=mock_download)
+            return mock_blob_client
+        
+        mock_container_client.get_blob_client.side_effect = make_blob_client
+        
+        # When
+        blobs = asyncio.run(
+            storage_client.download_many(["a.txt", "b.txt"], concurrency=1)
+        )
+        
+        # Then
+        assert blobs == {"a.txt": b"a.txt", "b.txt": b"b.txt"}
+    
+    def test_download_blob_returns_data(
+        self,
+        storage_client: AsyncBlobStorageClient,
+        mock_container_client: MagicMock,
+    ) -> None:
+        """
+        Given: A blob exists
+        When: Downloading blob asynchronously
+        Then: Returns blob data
+        """
+        # Given
+        mock_download = MagicMock()
+        mock_download.readall = AsyncMock(return_value=b"blob data")
+        mock_blob_client = MagicMock()
+        mock_blob_client.download_blob = AsyncMock(return_value=mock_download)
+        mock_container_client.get_blob_client.return_value = mock_blob_client
+        
+        # When
+        data = asyncio.run(storage_client.download_blob("test.txt"))
+        
+        # Then
+        assert data == b"blob data"
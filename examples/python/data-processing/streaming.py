@@ -5,12 +5,61 @@ Demonstrates memory-efficient processing of large CSV/JSON files
 using Polars streaming capabilities.
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
 
 import polars as pl
 from loguru import logger
 
+# Parse each SQL filter string once
+_sql_expr = lru_cache(maxsize=128)(pl.sql_expr)
+
+
+def _scan(path: str | Path) -> pl.LazyFrame:
+    """
+    Lazily scan a file, choosing the reader from its suffix.
+    
+    Columnar formats are read with projection and predicate pushdown and
+    need no type inference, so prefer them over CSV for repeated scans.
+    
+    Args:
+        path: Path to a .parquet, .arrow/.ipc/.feather, .jsonl/.ndjson or CSV file
+        
+    Returns:
+        LazyFrame over the file
+    """
+    match Path(path).suffix.lower():
+        case ".parquet":
+            return pl.scan_parquet(path, use_statistics=True)
+        case ".arrow" | ".ipc" | ".feather":
+            return pl.scan_ipc(path)
+        case ".jsonl" | ".ndjson":
+            return pl.scan_ndjson(path)
+        case _:
+            return pl.scan_csv(path)
+
+
+def _sink_csv_counted(lf: pl.LazyFrame, path: str | Path) -> int:
+    """
+    Stream a query to CSV and return how many rows it wrote.
+    
+    The sink and the row count run together, sharing one pass over the
+    query, so the output is never read back.
+    
+    Args:
+        lf: Query to write
+        path: Output CSV file path
+        
+    Returns:
+        Number of rows written
+    """
+    _, counted = pl.collect_all(
+        [lf.sink_csv(path, lazy=True), lf.select(pl.len())],
+        engine="streaming",
+    )
+    return counted.item()
+
 
 class StreamingProcessor:
     """
@@ -42,6 +91,9 @@ class StreamingProcessor:
         """
         Stream CSV file in batches.
         
+        Batches are produced by the Polars streaming engine, so reading and
+        parsing run ahead in Rust while the caller handles each batch.
+        
         Args:
             path: Path to CSV file
             batch_size: Rows per batch (uses chunk_size if None)
@@ -57,17 +109,9 @@ class StreamingProcessor:
         batch_size = batch_size or self.chunk_size
         logger.info(f"Streaming CSV in batches of {batch_size}: {path}")
         
-        # Use Polars batched reader
-        reader = pl.read_csv_batched(path, batch_size=batch_size)
-        
         batch_num = 0
-        while True:
-            batch = reader.next_batches(1)
-            if not batch:
-                break
-            
+        for df in pl.scan_csv(path).collect_batches(chunk_size=batch_size):
             batch_num += 1
-            df = batch[0]
             logger.debug(f"Batch {batch_num}: {len(df)} rows")
             yield df
         
@@ -77,61 +121,62 @@ class StreamingProcessor:
         self,
         input_path: str | Path,
         output_path: str | Path,
-        transform_fn: callable | None = None,
+        transform_fn: Callable[[pl.DataFrame], pl.DataFrame] | pl.Expr | None = None,
     ) -> dict[str, int]:
         """
         Process large CSV file in streaming fashion.
         
+        Without a transform, or with a pl.Expr transform, the job runs
+        entirely inside the Polars streaming engine (see
+        process_large_csv_lazy). A Python callable is applied batch by
+        batch, writing to a single open output file.
+        
         Args:
             input_path: Input CSV file path
             output_path: Output CSV file path
-            transform_fn: Optional transformation function for each batch
-            
+            transform_fn: Optional column expression, or a function applied
+                to each batch
+                
         Returns:
-            Processing statistics
+            Processing statistics: total_rows, plus batch_count and
+            avg_batch_size when a callable is applied per batch
             
         Example:
-            >>> def add_tax(df: pl.DataFrame) -> pl.DataFrame:
-            ...     return df.with_columns((pl.col("amount") * 1.1).alias("total"))
-            >>> 
             >>> processor = StreamingProcessor()
             >>> stats = processor.process_large_csv(
             ...     "input.csv",
             ...     "output.csv",
-            ...     transform_fn=add_tax
+            ...     transform_fn=(pl.col("amount") * 1.1).alias("total"),
             ... )
         """
+        if transform_fn is None:
+            return self.process_large_csv_lazy(input_path, output_path)
+        if isinstance(transform_fn, pl.Expr):
+            expr = transform_fn
+            return self.process_large_csv_lazy(
+                input_path,
+                output_path,
+                transform_fn=lambda lf: lf.with_columns(expr),
+            )
+        
         logger.info(f"Processing large CSV: {input_path} -> {output_path}")
         
         total_rows = 0
         batch_count = 0
         
-        # Process first batch and write with header
-        batches = self.stream_csv_batches(input_path)
-        first_batch = next(batches)
-        
-        if transform_fn:
-            first_batch = transform_fn(first_batch)
-        
-        # Write first batch with header
-        first_batch.write_csv(output_path)
-        total_rows += len(first_batch)
-        batch_count += 1
-        
-        # Process remaining batches and append
-        for batch in batches:
-            if transform_fn:
-                batch = transform_fn(batch)
-            
-            # Append without header
-            with open(output_path, "ab") as f:
-                batch.write_csv(f, include_header=False)
-            
-            total_rows += len(batch)
-            batch_count += 1
-            
-            if batch_count % 10 == 0:
-                logger.info(f"Processed {batch_count} batches, {total_rows:,} rows")
+        with open(output_path, "wb") as f:
+            for batch in self.stream_csv_batches(input_path):
+                if transform_fn:
+                    batch = transform_fn(batch)
+                
+                # Header only on the first batch
+                batch.write_csv(f, include_header=batch_count == 0)
+                
+                total_rows += len(batch)
+                batch_count += 1
+                
+                if batch_count % 10 == 0:
+                    logger.info(f"Processed {batch_count} batches, {total_rows:,} rows")
         
         stats = {
             "total_rows": total_rows,
@@ -142,6 +187,46 @@ class StreamingProcessor:
         logger.info(f"Processing complete: {stats}")
         return stats
     
+    def process_large_csv_lazy(
+        self,
+        input_path: str | Path,
+        output_path: str | Path,
+        transform_fn: Callable[[pl.LazyFrame], pl.LazyFrame] | None = None,
+    ) -> dict[str, int]:
+        """
+        Process large CSV file as a single streaming query.
+        
+        Reading, transforming and writing run as one pipelined, backpressured
+        query in the Polars streaming engine, with no Python code between
+        batches.
+        
+        Args:
+            input_path: Input CSV file path
+            output_path: Output CSV file path
+            transform_fn: Optional function building the transformed query
+            
+        Returns:
+            Processing statistics with total_rows; the engine picks its own
+            morsel sizes, so there are no batch statistics
+            
+        Example:
+            >>> processor = StreamingProcessor()
+            >>> stats = processor.process_large_csv_lazy(
+            ...     "input.csv",
+            ...     "output.csv",
+            ...     transform_fn=lambda lf: lf.filter(pl.col("amount") > 0),
+            ... )
+        """
+        logger.info(f"Streaming CSV query: {input_path} -> {output_path}")
+        
+        lf = pl.scan_csv(input_path)
+        if transform_fn is not None:
+            lf = transform_fn(lf)
+        stats = {"total_rows": _sink_csv_counted(lf, output_path)}
+        
+        logger.info(f"Processing complete: {stats}")
+        return stats
+    
     def aggregate_large_file_lazy(
         self,
         path: str | Path,
@@ -155,7 +240,7 @@ class StreamingProcessor:
         enabling processing of files larger than RAM.
         
         Args:
-            path: Path to CSV file
+            path: Path to CSV, Parquet, Arrow IPC or NDJSON file
             group_by: Columns to group by
             aggregations: Dict mapping column -> aggregation function
             
@@ -173,7 +258,7 @@ class StreamingProcessor:
         logger.info(f"Lazy aggregating: {path}")
         
         # Scan file without loading into memory
-        lf = pl.scan_csv(path)
+        lf = _scan(path)
         
         # Build aggregation expressions
         agg_exprs = []
@@ -198,7 +283,7 @@ class StreamingProcessor:
             .group_by(group_by)
             .agg(agg_exprs)
             .sort(group_by)
-            .collect(streaming=True)  # Use streaming execution
+            .collect(engine="streaming")  # Use streaming execution
         )
         
         logger.info(f"Aggregation complete: {result.shape}")
@@ -208,16 +293,19 @@ class StreamingProcessor:
         self,
         input_path: str | Path,
         output_path: str | Path,
-        filter_expr: str,
+        filter_expr: str | pl.Expr,
         sample_fraction: float = 0.1,
     ) -> None:
         """
         Filter and sample large file efficiently.
         
+        Passing a pl.Expr (e.g. pl.col("revenue") > 1000) skips the SQL
+        parser entirely; SQL strings are parsed once and cached.
+        
         Args:
             input_path: Input CSV file
             output_path: Output CSV file
-            filter_expr: Polars filter expression
+            filter_expr: Polars expression or SQL filter string
             sample_fraction: Fraction of rows to sample (0.0-1.0)
             
         Example:
@@ -225,17 +313,20 @@ class StreamingProcessor:
             >>> processor.filter_and_sample_large_file(
             ...     "huge.csv",
             ...     "sample.csv",
-            ...     filter_expr="revenue > 1000",
+            ...     filter_expr=pl.col("revenue") > 1000,
             ...     sample_fraction=0.1
             ... )
         """
         logger.info(f"Filtering and sampling: {input_path} -> {output_path}")
         
+        if isinstance(filter_expr, str):
+            filter_expr = _sql_expr(filter_expr)
+        
         result = (
             pl.scan_csv(input_path)
-            .filter(pl.sql_expr(filter_expr))
+            .filter(filter_expr)
+            .collect(engine="streaming")
             .sample(fraction=sample_fraction)
-            .collect(streaming=True)
         )
         
         result.write_csv(output_path)
@@ -246,14 +337,19 @@ class StreamingProcessor:
         input_paths: list[str | Path],
         output_path: str | Path,
         deduplicate: bool = False,
+        subset: list[str] | None = None,
     ) -> dict[str, int]:
         """
         Merge multiple CSV files efficiently.
         
+        Deduplicating on a key subset hashes only the key columns, which is
+        far cheaper than hashing whole rows of a wide table.
+        
         Args:
             input_paths: List of CSV files to merge
             output_path: Output merged file
             deduplicate: Remove duplicate rows
+            subset: Key columns that identify duplicates (all columns if None)
             
         Returns:
             Merge statistics
@@ -263,7 +359,8 @@ class StreamingProcessor:
             >>> stats = processor.merge_multiple_files(
             ...     ["file1.csv", "file2.csv", "file3.csv"],
             ...     "merged.csv",
-            ...     deduplicate=True
+            ...     deduplicate=True,
+            ...     subset=["order_id"],
             ... )
         """
         logger.info(f"Merging {len(input_paths)} files -> {output_path}")
@@ -271,20 +368,17 @@ class StreamingProcessor:
         # Scan all files lazily
         lazy_frames = [pl.scan_csv(path) for path in input_paths]
         
-        # Concatenate
-        merged = pl.concat(lazy_frames)
+        # Concatenate (relaxed to a common supertype, no rechunk pass)
+        merged = pl.concat(lazy_frames, how="vertical_relaxed", rechunk=False)
         
         # Optionally deduplicate
         if deduplicate:
-            merged = merged.unique()
-        
-        # Collect and save
-        result = merged.collect(streaming=True)
-        result.write_csv(output_path)
+            merged = merged.unique(subset=subset, maintain_order=False)
         
+        # Stream straight to disk without materializing the merged frame
         stats = {
             "input_files": len(input_paths),
-            "output_rows": len(result),
+            "output_rows": _sink_csv_counted(merged, output_path),
         }
         
         logger.info(f"Merge complete: {stats}")
@@ -301,7 +395,7 @@ class StreamingProcessor:
         Compute rolling statistics on time series data.
         
         Args:
-            path: Input CSV file
+            path: Input CSV, Parquet, Arrow IPC or NDJSON file
             date_column: Date column name
             value_column: Value column for statistics
             window_size: Rolling window size
@@ -320,27 +414,28 @@ class StreamingProcessor:
         """
         logger.info(f"Computing rolling statistics (window={window_size})")
         
+        # All four windows read one shared input inside a single projection,
+        # so the sorted column is materialized once for every statistic
+        values = pl.col(value_column)
+        suffix = f"{window_size}d"
+        
         result = (
-            pl.scan_csv(path)
+            _scan(path)
             .with_columns([
                 pl.col(date_column).cast(pl.Date),
             ])
             .sort(date_column)
             .with_columns([
-                pl.col(value_column)
-                .rolling_mean(window_size=window_size)
-                .alias(f"{value_column}_rolling_mean_{window_size}d"),
-                pl.col(value_column)
-                .rolling_std(window_size=window_size)
-                .alias(f"{value_column}_rolling_std_{window_size}d"),
-                pl.col(value_column)
-                .rolling_max(window_size=window_size)
-                .alias(f"{value_column}_rolling_max_{window_size}d"),
-                pl.col(value_column)
-                .rolling_min(window_size=window_size)
-                .alias(f"{value_column}_rolling_min_{window_size}d"),
+                values.rolling_mean(window_size=window_size)
+                .alias(f"{value_column}_rolling_mean_{suffix}"),
+                values.rolling_std(window_size=window_size)
+                .alias(f"{value_column}_rolling_std_{suffix}"),
+                values.rolling_max(window_size=window_size)
+                .alias(f"{value_column}_rolling_max_{suffix}"),
+                values.rolling_min(window_size=window_size)
+                .alias(f"{value_column}_rolling_min_{suffix}"),
             ])
-            .collect(streaming=True)
+            .collect(engine="streaming")
         )
         
         logger.info(f"Rolling statistics computed: {result.shape}")
@@ -4,19 +4,32 @@ Pytest tests for data processing modules.
 Demonstrates modern testing patterns with Given-When-Then structure.
 """
 
+from pathlib import Path
+
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from processor import DataProcessor
+from processor import REGIONS, SAMPLE_SALES_SCHEMA, DataProcessor
 from streaming import StreamingProcessor
 
+# Generator schema with string dates (exercising the parse path) and the
+# precomputed total; passing it skips dtype inference in the fixture.
+_SALES_SCHEMA = {
+    **SAMPLE_SALES_SCHEMA,
+    "date": pl.String,
+    "total_amount": pl.Float64,
+}
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sales_data() -> pl.DataFrame:
     """
     Sample sales data fixture.
     
+    Shared across the session; Polars frames are immutable, so tests get
+    new frames from every operation and never alter this one.
+    
     Returns:
         Small DataFrame for testing
     """
@@ -28,16 +41,68 @@ def sample_sales_data() -> pl.DataFrame:
         "quantity": [10, 5, 15, 8, 12],
         "price": [100.0, 200.0, 100.0, 150.0, 100.0],
         "total_amount": [1000.0, 1000.0, 1500.0, 1200.0, 1200.0],
+    }, schema=_SALES_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def shared_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Streaming test inputs written once per session.
+    
+    Tests only read these files and write their outputs to tmp_path, so
+    they can share one copy. Under pytest-xdist, tmp_path_factory gives
+    each worker its own base directory.
+    
+    Returns:
+        Directory holding the input files:
+        category.{csv,arrow,parquet}: grouped category/value rows
+        values.csv: value column 1-5
+        range.csv: 100 rows of columns a and b
+        part{1,2,3}.csv: two rows each of columns a and b
+        keyed{1,2}.csv: id/value rows sharing id 2
+    """
+    data_dir = tmp_path_factory.mktemp("data")
+    
+    category = pl.DataFrame({
+        "category": ["A", "B", "A", "B", "A"],
+        "value": [10, 20, 30, 40, 50],
     })
+    category.write_csv(data_dir / "category.csv")
+    category.write_ipc(data_dir / "category.arrow", compression="uncompressed")
+    category.write_parquet(data_dir / "category.parquet")
+    
+    pl.DataFrame({"value": [1, 2, 3, 4, 5]}).write_csv(data_dir / "values.csv")
+    pl.DataFrame({
+        "a": list(range(100)),
+        "b": list(range(100, 200)),
+    }).write_csv(data_dir / "range.csv")
+    
+    parts = [
+        pl.DataFrame({"a": [1, 2], "b": [3, 4]}),
+        pl.DataFrame({"a": [5, 6], "b": [7, 8]}),
+        pl.DataFrame({"a": [9, 10], "b": [11, 12]}),
+    ]
+    for i, part in enumerate(parts, 1):
+        part.write_csv(data_dir / f"part{i}.csv")
+    
+    pl.DataFrame({"id": [1, 2], "value": [10, 20]}).write_csv(data_dir / "keyed1.csv")
+    pl.DataFrame({"id": [2, 3], "value": [99, 30]}).write_csv(data_dir / "keyed2.csv")
+    return data_dir
+
 
+@pytest.fixture(params=["csv", "arrow"])
+def category_file(request: pytest.FixtureRequest, shared_data_dir: Path) -> Path:
+    """Category data file, once per supported input format."""
+    return shared_data_dir / f"category.{request.param}"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def processor() -> DataProcessor:
     """Data processor fixture."""
     return DataProcessor(lazy=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def streaming_processor() -> StreamingProcessor:
     """Streaming processor fixture."""
     return StreamingProcessor(chunk_size=10)
@@ -70,6 +135,25 @@ class TestDataProcessor:
         }
         assert set(df.columns) == expected_columns
     
+    def test_create_sample_data_uses_compact_schema(
+        self,
+        processor: DataProcessor,
+    ) -> None:
+        """
+        Given: A DataProcessor instance
+        When: Sample data is generated
+        Then: Columns use the declared compact dtypes
+        """
+        # When
+        df = processor.create_sample_sales_data(n_rows=10)
+        
+        # Then
+        assert df.schema["order_id"] == pl.UInt32
+        assert df.schema["date"] == pl.Date
+        assert df.schema["quantity"] == pl.UInt8
+        assert df.schema["region"] == pl.Enum(REGIONS)
+        assert df.schema["total_amount"] == pl.Float64
+    
     @pytest.mark.parametrize("n_rows", [10, 100, 1000])
     def test_create_sample_data_generates_correct_row_count(
         self,
@@ -87,6 +171,27 @@ class TestDataProcessor:
         # Then
         assert len(df) == n_rows
     
+    def test_load_csv_lazy_returns_lazyframe(
+        self,
+        sample_sales_data: pl.DataFrame,
+        tmp_path,
+    ) -> None:
+        """
+        Given: A CSV file and a lazy DataProcessor
+        When: The CSV is loaded
+        Then: A LazyFrame with the file's columns is returned
+        """
+        # Given
+        csv_path = tmp_path / "sales.csv"
+        sample_sales_data.write_csv(csv_path)
+        
+        # When
+        lf = DataProcessor(lazy=True).load_csv(csv_path)
+        
+        # Then
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect_schema().names() == sample_sales_data.columns
+    
     def test_transform_sales_data_adds_date_columns(
         self,
         processor: DataProcessor,
@@ -120,7 +225,9 @@ class TestDataProcessor:
         
         # Then
         assert "avg_price_per_unit" in result.columns
-        expected = sample_sales_data["total_amount"] / sample_sales_data["quantity"]
+        expected = sample_sales_data.select(
+            (pl.col("total_amount") / pl.col("quantity")).alias("expected")
+        )["expected"]
         assert (result["avg_price_per_unit"] - expected).abs().max() < 0.01
     
     def test_analyze_sales_by_region_groups_correctly(
@@ -179,8 +286,43 @@ class TestDataProcessor:
         result = processor.analyze_sales_by_region(sample_sales_data)
         
         # Then
-        revenues = result["total_revenue"].to_list()
-        assert revenues == sorted(revenues, reverse=True)
+        assert result["total_revenue"].is_sorted(descending=True)
+    
+    def test_analyze_product_performance_counts_orders(
+        self,
+        processor: DataProcessor,
+        sample_sales_data: pl.DataFrame,
+    ) -> None:
+        """
+        Given: Sample sales DataFrame
+        When: Product analysis is performed
+        Then: Orders are counted per product and month
+        """
+        # When
+        result = processor.analyze_product_performance(sample_sales_data)
+        
+        # Then
+        orders = dict(zip(result["product"], result["orders"], strict=True))
+        assert orders == {"ProductA": 3, "ProductB": 1, "ProductC": 1}
+    
+    def test_analyze_product_performance_partitioned_matches_lazy(
+        self,
+        processor: DataProcessor,
+    ) -> None:
+        """
+        Given: Generated sales data with several products
+        When: Analyzing it eagerly (partitioned) and lazily (single query)
+        Then: Both paths produce the same result
+        """
+        # Given
+        df = processor.create_sample_sales_data(n_rows=500)
+        
+        # When
+        eager = processor.analyze_product_performance(df)
+        lazy = processor.analyze_product_performance(df.lazy())
+        
+        # Then
+        assert_frame_equal(eager, lazy)
     
     def test_filter_high_value_orders_filters_correctly(
         self,
@@ -201,6 +343,37 @@ class TestDataProcessor:
         # Then
         assert all(result["total_amount"] > threshold)
     
+    @pytest.mark.parametrize(
+        "fmt,reader",
+        [
+            ("csv", pl.read_csv),
+            ("json", pl.read_ndjson),
+            ("parquet", pl.read_parquet),
+        ],
+    )
+    def test_save_results_round_trips_lazyframe(
+        self,
+        processor: DataProcessor,
+        sample_sales_data: pl.DataFrame,
+        tmp_path,
+        fmt: str,
+        reader,
+    ) -> None:
+        """
+        Given: Sample sales data as a LazyFrame
+        When: Results are saved in each supported format
+        Then: The written file reads back to the same data
+        """
+        # Given
+        path = tmp_path / "out" / f"results.{fmt}"
+        
+        # When
+        processor.save_results(sample_sales_data.lazy(), path, format=fmt)
+        
+        # Then (text formats don't store dtypes, so restore the schema)
+        result = reader(path).cast(dict(sample_sales_data.schema))
+        assert_frame_equal(result, sample_sales_data)
+    
     def test_get_summary_statistics_returns_stats(
         self,
         processor: DataProcessor,
@@ -217,6 +390,72 @@ class TestDataProcessor:
         # Then
         assert isinstance(stats, pl.DataFrame)
         assert "statistic" in stats.columns or "describe" in stats.columns
+    
+    
+    @pytest.mark.parametrize(
+        "include_quantiles,expected_has_median",
+        [(False, False), (True, True)],
+    )
+    def test_get_summary_statistics_quantiles_are_optional(
+        self,
+        processor: DataProcessor,
+        sample_sales_data: pl.DataFrame,
+        include_quantiles: bool,
+        expected_has_median: bool,
+    ) -> None:
+        """
+        Given: Sample sales DataFrame
+        When: Summary statistics are computed with or without quantiles
+        Then: Percentile rows appear only when requested
+        """
+        # When
+        stats = processor.get_summary_statistics(
+            sample_sales_data,
+            include_quantiles=include_quantiles,
+        )
+        
+        # Then
+        assert ("50%" in stats["statistic"].to_list()) is expected_has_median
+        assert "mean" in stats["statistic"].to_list()
+    
+    def test_get_summary_statistics_accepts_lazyframe(
+        self,
+        processor: DataProcessor,
+        sample_sales_data: pl.DataFrame,
+    ) -> None:
+        """
+        Given: Sample sales data as a LazyFrame
+        When: Summary statistics are computed
+        Then: Stats match those of the eager DataFrame
+        """
+        # When
+        lazy_stats = processor.get_summary_statistics(sample_sales_data.lazy())
+        eager_stats = processor.get_summary_statistics(sample_sales_data)
+        
+        # Then
+        assert_frame_equal(lazy_stats, eager_stats)
+    
+    def test_get_summary_statistics_keeps_all_numeric_widths(
+        self,
+        processor: DataProcessor,
+    ) -> None:
+        """
+        Given: A DataFrame with narrow integer and string columns
+        When: Numeric-only summary statistics are computed
+        Then: All numeric columns are described and strings are dropped
+        """
+        # Given
+        df = pl.DataFrame({
+            "small": pl.Series([1, 2, 3], dtype=pl.Int16),
+            "unsigned": pl.Series([4, 5, 6], dtype=pl.UInt32),
+            "label": ["a", "b", "c"],
+        })
+        
+        # When
+        stats = processor.get_summary_statistics(df)
+        
+        # Then
+        assert set(stats.columns) == {"statistic", "small", "unsigned"}
 
 
 class TestStreamingProcessor:
@@ -225,36 +464,29 @@ class TestStreamingProcessor:
     def test_stream_csv_batches_yields_dataframes(
         self,
         streaming_processor: StreamingProcessor,
-        tmp_path,
+        shared_data_dir: Path,
     ) -> None:
         """
         Given: A CSV file
         When: Streaming in batches
         Then: Yields DataFrame batches
         """
-        # Given
-        df = pl.DataFrame({
-            "a": list(range(100)),
-            "b": list(range(100, 200)),
-        })
-        csv_path = tmp_path / "test.csv"
-        df.write_csv(csv_path)
-        
         # When
         batches = list(
-            streaming_processor.stream_csv_batches(csv_path, batch_size=30)
+            streaming_processor.stream_csv_batches(
+                shared_data_dir / "range.csv", batch_size=30
+            )
         )
         
         # Then
-        assert len(batches) > 0
-        assert all(isinstance(batch, pl.DataFrame) for batch in batches)
-        total_rows = sum(len(batch) for batch in batches)
-        assert total_rows == 100
+        assert batches and isinstance(batches[0], pl.DataFrame)
+        assert pl.concat(batches).height == 100
     
     def test_process_large_csv_applies_transformation(
         self,
         streaming_processor: StreamingProcessor,
-        tmp_path,
+        shared_data_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """
         Given: A CSV file and transformation function
@@ -262,12 +494,8 @@ class TestStreamingProcessor:
         Then: Transformation is applied to all rows
         """
         # Given
-        df = pl.DataFrame({
-            "value": [1, 2, 3, 4, 5],
-        })
-        input_path = tmp_path / "input.csv"
+        input_path = shared_data_dir / "values.csv"
         output_path = tmp_path / "output.csv"
-        df.write_csv(input_path)
         
         def double_value(batch: pl.DataFrame) -> pl.DataFrame:
             return batch.with_columns((pl.col("value") * 2).alias("value"))
@@ -285,27 +513,74 @@ class TestStreamingProcessor:
         assert_frame_equal(result, expected)
         assert stats["total_rows"] == 5
     
+    def test_process_large_csv_applies_expression(
+        self,
+        streaming_processor: StreamingProcessor,
+        shared_data_dir: Path,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Given: A CSV file and a transformation expression
+        When: Processing large CSV
+        Then: The expression is applied by the streaming engine
+        """
+        # Given
+        input_path = shared_data_dir / "values.csv"
+        output_path = tmp_path / "output.csv"
+        
+        # When
+        stats = streaming_processor.process_large_csv(
+            input_path,
+            output_path,
+            transform_fn=(pl.col("value") * 2).alias("value"),
+        )
+        
+        # Then
+        result = pl.read_csv(output_path)
+        expected = pl.DataFrame({"value": [2, 4, 6, 8, 10]})
+        assert_frame_equal(result, expected)
+        assert stats["total_rows"] == 5
+    
+    def test_process_large_csv_lazy_applies_query(
+        self,
+        streaming_processor: StreamingProcessor,
+        shared_data_dir: Path,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Given: A CSV file and a LazyFrame transformation
+        When: Processing as a single streaming query
+        Then: The transformed rows are written
+        """
+        # Given
+        input_path = shared_data_dir / "values.csv"
+        output_path = tmp_path / "output.csv"
+        
+        # When
+        stats = streaming_processor.process_large_csv_lazy(
+            input_path,
+            output_path,
+            transform_fn=lambda lf: lf.filter(pl.col("value") > 2),
+        )
+        
+        # Then
+        result = pl.read_csv(output_path)
+        assert_frame_equal(result, pl.DataFrame({"value": [3, 4, 5]}))
+        assert stats == {"total_rows": 3}
+    
     def test_aggregate_large_file_lazy_groups_correctly(
         self,
         streaming_processor: StreamingProcessor,
-        tmp_path,
+        category_file: Path,
     ) -> None:
         """
-        Given: A CSV file with groupable data
+        Given: A CSV or Arrow IPC file with groupable data
         When: Lazy aggregation is performed
         Then: Correct groups and aggregations are computed
         """
-        # Given
-        df = pl.DataFrame({
-            "category": ["A", "B", "A", "B", "A"],
-            "value": [10, 20, 30, 40, 50],
-        })
-        csv_path = tmp_path / "data.csv"
-        df.write_csv(csv_path)
-        
         # When
         result = streaming_processor.aggregate_large_file_lazy(
-            csv_path,
+            category_file,
             group_by=["category"],
             aggregations={"value": "sum"},
         )
@@ -315,10 +590,29 @@ class TestStreamingProcessor:
         assert set(result["category"].to_list()) == {"A", "B"}
         
         # Check sums
-        a_sum = result.filter(pl.col("category") == "A")["value_sum"][0]
-        b_sum = result.filter(pl.col("category") == "B")["value_sum"][0]
-        assert a_sum == 90  # 10 + 30 + 50
-        assert b_sum == 60  # 20 + 40
+        sums = dict(zip(result["category"], result["value_sum"], strict=True))
+        assert sums["A"] == 90  # 10 + 30 + 50
+        assert sums["B"] == 60  # 20 + 40
+    
+    def test_aggregate_large_file_lazy_reads_parquet(
+        self,
+        streaming_processor: StreamingProcessor,
+        shared_data_dir: Path,
+    ) -> None:
+        """
+        Given: A Parquet file with groupable data
+        When: Lazy aggregation is performed
+        Then: The file is scanned as Parquet and aggregated
+        """
+        # When
+        result = streaming_processor.aggregate_large_file_lazy(
+            shared_data_dir / "category.parquet",
+            group_by=["category"],
+            aggregations={"value": "sum"},
+        )
+        
+        # Then
+        assert result["value_sum"].to_list() == [90, 60]
     
     @pytest.mark.parametrize(
         "agg_func,expected",
@@ -332,40 +626,62 @@ class TestStreamingProcessor:
     def test_aggregate_large_file_lazy_aggregation_functions(
         self,
         streaming_processor: StreamingProcessor,
-        tmp_path,
+        shared_data_dir: Path,
         agg_func: str,
         expected: dict[str, int],
     ) -> None:
         """
-        Given: A CSV file and aggregation function
+        Given: A shared data file and aggregation function
         When: Lazy aggregation is performed
         Then: Correct aggregation is computed
         """
-        # Given
-        df = pl.DataFrame({
-            "category": ["A", "B", "A", "B", "A"],
-            "value": [10, 20, 30, 40, 50],
-        })
-        csv_path = tmp_path / "data.csv"
-        df.write_csv(csv_path)
-        
         # When
         result = streaming_processor.aggregate_large_file_lazy(
-            csv_path,
+            shared_data_dir / "category.arrow",
             group_by=["category"],
             aggregations={"value": agg_func},
         )
         
         # Then
-        result_col = f"value_{agg_func}"
-        for category, expected_value in expected.items():
-            actual = result.filter(pl.col("category") == category)[result_col][0]
-            assert actual == expected_value
+        lookup = dict(zip(result["category"], result[f"value_{agg_func}"], strict=True))
+        assert lookup == expected
+    
+    @pytest.mark.parametrize(
+        "filter_expr",
+        ["value > 25", pl.col("value") > 25],
+    )
+    def test_filter_and_sample_large_file_filters_rows(
+        self,
+        streaming_processor: StreamingProcessor,
+        shared_data_dir: Path,
+        tmp_path: Path,
+        filter_expr: str | pl.Expr,
+    ) -> None:
+        """
+        Given: A CSV file and a SQL or expression filter
+        When: Filtering with a sample fraction of 1.0
+        Then: Only matching rows are written
+        """
+        # Given
+        output_path = tmp_path / "sample.csv"
+        
+        # When
+        streaming_processor.filter_and_sample_large_file(
+            shared_data_dir / "category.csv",
+            output_path,
+            filter_expr=filter_expr,
+            sample_fraction=1.0,
+        )
+        
+        # Then
+        result = pl.read_csv(output_path)
+        assert sorted(result["value"].to_list()) == [30, 40, 50]
     
     def test_merge_multiple_files_combines_data(
         self,
         streaming_processor: StreamingProcessor,
-        tmp_path,
+        shared_data_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """
         Given: Multiple CSV files
@@ -373,16 +689,7 @@ class TestStreamingProcessor:
         Then: Combined data is written to output
         """
         # Given
-        df1 = pl.DataFrame({"a": [1, 2], "b": [3, 4]})
-        df2 = pl.DataFrame({"a": [5, 6], "b": [7, 8]})
-        df3 = pl.DataFrame({"a": [9, 10], "b": [11, 12]})
-        
-        paths = []
-        for i, df in enumerate([df1, df2, df3], 1):
-            path = tmp_path / f"file{i}.csv"
-            df.write_csv(path)
-            paths.append(path)
-        
+        paths = [shared_data_dir / f"part{i}.csv" for i in (1, 2, 3)]
         output_path = tmp_path / "merged.csv"
         
         # When
@@ -393,71 +700,71 @@ class TestStreamingProcessor:
         )
         
         # Then
-        result = pl.read_csv(output_path)
-        assert len(result) == 6
+        assert pl.scan_csv(output_path).select(pl.len()).collect().item() == 6
         assert stats["input_files"] == 3
         assert stats["output_rows"] == 6
-
-
-class TestPolarsOperations:
-    """Tests demonstrating modern Polars operations."""
     
-    def test_modern_polars_select_syntax(self) -> None:
-        """
-        Given: A Polars DataFrame
-        When: Using modern select syntax
-        Then: Correct columns are selected
-        """
-        # Given
-        df = pl.DataFrame({
-            "a": [1, 2, 3],
-            "b": [4, 5, 6],
-            "c": [7, 8, 9],
-        })
-        
-        # When
-        result = df.select([pl.col("a"), pl.col("b")])
-        
-        # Then
-        assert result.columns == ["a", "b"]
     
-    def test_modern_polars_with_columns_syntax(self) -> None:
+    def test_merge_multiple_files_deduplicates_on_subset(
+        self,
+        streaming_processor: StreamingProcessor,
+        shared_data_dir: Path,
+        tmp_path: Path,
+    ) -> None:
         """
-        Given: A Polars DataFrame
-        When: Using with_columns to add calculated column
-        Then: New column is added correctly
+        Given: CSV files sharing a key with differing payloads
+        When: Files are merged with deduplication on the key
+        Then: One row is kept per key
         """
         # Given
-        df = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        paths = [shared_data_dir / "keyed1.csv", shared_data_dir / "keyed2.csv"]
+        output_path = tmp_path / "merged.csv"
         
         # When
-        result = df.with_columns((pl.col("a") + pl.col("b")).alias("sum"))
+        stats = streaming_processor.merge_multiple_files(
+            paths,
+            output_path,
+            deduplicate=True,
+            subset=["id"],
+        )
         
         # Then
-        assert "sum" in result.columns
-        assert result["sum"].to_list() == [5, 7, 9]
+        result = pl.read_csv(output_path)
+        assert sorted(result["id"].to_list()) == [1, 2, 3]
+        assert stats["output_rows"] == 3
+
+
+class TestPolarsOperations:
+    """Tests demonstrating modern Polars operations."""
     
-    def test_modern_polars_chaining(self) -> None:
+    def test_modern_polars_lazy_operations(self) -> None:
         """
-        Given: A Polars DataFrame
-        When: Chaining multiple operations
-        Then: All operations are applied in sequence
+        Given: A Polars LazyFrame
+        When: Selecting, adding a calculated column and chaining a group_by
+        Then: All three queries produce the expected results
         """
         # Given
-        df = pl.DataFrame({
+        lf = pl.LazyFrame({
+            "a": [1, 2, 3, 4],
+            "b": [4, 5, 6, 7],
+            "c": [7, 8, 9, 10],
             "category": ["A", "B", "A", "B"],
             "value": [10, 20, 30, 40],
         })
         
         # When
-        result = (
-            df
+        selected, with_sum, totals = pl.collect_all([
+            lf.select(pl.col("a"), pl.col("b")),
+            lf.with_columns((pl.col("a") + pl.col("b")).alias("sum")),
+            lf
             .filter(pl.col("value") > 15)
             .group_by("category")
             .agg(pl.col("value").sum().alias("total"))
-            .sort("total", descending=True)
-        )
+            .sort("total", descending=True),
+        ])
         
         # Then
-        assert len(result) == 2
-        assert result["total"].to_list() == [60, 30]  # B=60, A=30
+        assert selected.columns == ["a", "b"]
+        assert with_sum["sum"].to_list() == [5, 7, 9, 11]
+        assert len(totals) == 2
+        assert totals["total"].to_list() == [60, 30]  # B=60, A=30
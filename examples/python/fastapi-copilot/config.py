@@ -5,7 +5,9 @@ Demonstrates modern configuration management using Pydantic settings
 and Azure Key Vault with DefaultAzureCredential.
 """
 
-from functools import lru_cache
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
@@ -13,6 +15,12 @@ from loguru import logger
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Key Vault secret name -> Settings attribute it populates
+KEYVAULT_SECRETS = {
+    "copilot-api-key": "copilot_api_key",
+    "database-url": "database_url",
+}
+
 
 class Settings(BaseSettings):
     """
@@ -28,6 +36,7 @@ class Settings(BaseSettings):
         azure_keyvault_url: Azure Key Vault URL (optional)
         copilot_api_key: GitHub Copilot API key
         log_level: Logging level
+        simulate_latency: Sleep in endpoints to mimic upstream API latency
         
     Example:
         >>> settings = Settings()
@@ -54,6 +63,12 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO")
     
+    # Simulated Copilot latency (disable for tests and load benchmarks)
+    simulate_latency: bool = Field(
+        default=True,
+        description="Sleep in endpoints to mimic upstream API latency",
+    )
+    
     # Database (example)
     database_url: str = Field(
         default="sqlite:///./app.db",
@@ -78,6 +93,9 @@ class Settings(BaseSettings):
         4. Azure PowerShell
         5. Interactive browser (fallback)
         
+        Secrets are fetched concurrently, so loading them costs roughly one
+        round-trip rather than one per secret.
+        
         Example:
             >>> settings = Settings(azure_keyvault_url="https://myvault.vault.azure.net")
             >>> settings.load_secrets_from_keyvault()
@@ -96,21 +114,18 @@ class Settings(BaseSettings):
                 credential=credential,
             )
             
-            # Load Copilot API key from Key Vault
-            try:
-                secret = client.get_secret("copilot-api-key")
-                self.copilot_api_key = secret.value
-                logger.info("Successfully loaded copilot-api-key from Key Vault")
-            except Exception as e:
-                logger.warning(f"Could not load copilot-api-key: {e}")
+            with ThreadPoolExecutor(max_workers=len(KEYVAULT_SECRETS)) as executor:
+                futures = {
+                    name: executor.submit(client.get_secret, name)
+                    for name in KEYVAULT_SECRETS
+                }
             
-            # Load database URL from Key Vault (example)
-            try:
-                secret = client.get_secret("database-url")
-                self.database_url = secret.value
-                logger.info("Successfully loaded database-url from Key Vault")
-            except Exception as e:
-                logger.warning(f"Could not load database-url: {e}")
+            for name, future in futures.items():
+                try:
+                    setattr(self, KEYVAULT_SECRETS[name], future.result().value)
+                    logger.info(f"Successfully loaded {name} from Key Vault")
+                except Exception as e:
+                    logger.warning(f"Could not load {name}: {e}")
             
             credential.close()
             
@@ -132,9 +147,10 @@ def configure_logging(settings: Settings) -> None:
     """
     logger.remove()  # Remove default handler
     
-    # Add console handler with custom format
+    # Add console handler with custom format; enqueue hands records to a
+    # background writer so request handlers never block on stderr
     logger.add(
-        sink=lambda msg: print(msg, end=""),
+        sys.stderr,
         format=(
             "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
             "<level>{level: <8}</level> | "
@@ -143,6 +159,7 @@ def configure_logging(settings: Settings) -> None:
         ),
         level=settings.log_level,
         colorize=True,
+        enqueue=True,
     )
     
     # Add file handler for production
@@ -156,11 +173,14 @@ def configure_logging(settings: Settings) -> None:
         )
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """
     Get cached application settings.
     
+    Key Vault secrets are not loaded here; the application lifespan loads
+    them once at startup so no request pays for the network round-trip.
+    
     Returns:
         Singleton Settings instance
         
@@ -171,12 +191,4 @@ def get_settings() -> Settings:
     """
     settings = Settings()
     configure_logging(settings)
-    
-    # Load secrets from Key Vault if configured
-    if settings.azure_keyvault_url:
-        try:
-            settings.load_secrets_from_keyvault()
-        except Exception as e:
-            logger.error(f"Failed to initialize Key Vault: {e}")
-    
     return settings
@@ -14,14 +14,20 @@ Example:
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, TypeVar
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.json_schema import models_json_schema
 
 from config import Settings, get_settings
 from models import (
+    CHAT_REQ_ADAPTER,
+    CODE_REVIEW_ADAPTER,
+    HEALTH_RESP_ADAPTER,
     ChatRequest,
     ChatResponse,
     CodeReviewRequest,
@@ -30,6 +36,106 @@ from models import (
     Message,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson serializes responses several times faster than the stdlib encoder
+ResponseClass: type[JSONResponse] = (
+    ORJSONResponse if orjson is not None else JSONResponse
+)
+
+# Static suggestions returned by the simulated code review
+_DEFAULT_SUGGESTIONS: tuple[str, ...] = (
+    "Consider adding type hints to function parameters",
+    "Add docstring describing function purpose",
+    "Use f-string for better readability",
+)
+_DEFAULT_ISSUE_COUNT = len(_DEFAULT_SUGGESTIONS)
+
+# Request bodies are parsed by dependencies, so FastAPI never sees these
+# models; their schemas are added to the OpenAPI components by _openapi.
+_BODY_MODELS: tuple[type[BaseModel], ...] = (ChatRequest, CodeReviewRequest)
+
+T = TypeVar("T")
+
+
+async def _validate_body(request: Request, adapter: TypeAdapter[T]) -> T:
+    """
+    Validate the raw request body with a prebuilt TypeAdapter.
+    
+    Args:
+        request: Incoming request
+        adapter: Adapter for the expected body model
+        
+    Returns:
+        Validated body model
+        
+    Raises:
+        RequestValidationError: If the body is not valid for the model
+    """
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        # Match FastAPI's own 422 entries, which leave out pydantic's docs URL
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]) from e
+
+
+async def chat_request_body(request: Request) -> ChatRequest:
+    """Parse and validate a chat request body."""
+    return await _validate_body(request, CHAT_REQ_ADAPTER)
+
+
+async def code_review_request_body(request: Request) -> CodeReviewRequest:
+    """Parse and validate a code review request body."""
+    return await _validate_body(request, CODE_REVIEW_ADAPTER)
+
+
+def _json_body_schema(model: type[BaseModel], example: dict[str, Any]) -> dict[str, Any]:
+    """Describe a JSON request body in OpenAPI for body-parsing dependencies."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"},
+                    "examples": {"default": {"value": example}},
+                }
+            },
+        }
+    }
+
+
+def _json_response_schema(
+    model: type, example: dict[str, Any] | None = None
+) -> dict[int | str, dict[str, Any]]:
+    """Describe a 200 JSON response in OpenAPI for routes returning _model_response."""
+    response: dict[str, Any] = {"model": model}
+    if example is not None:
+        response["content"] = {"application/json": {"example": example}}
+    return {200: response}
+
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model the handler built itself straight to JSON.
+    
+    The model was validated on construction, so the route skips FastAPI's
+    response_model re-validation and dict conversion; pydantic writes the
+    JSON in one step.
+    
+    Args:
+        model: Response model instance
+        
+    Returns:
+        JSON response with the serialized model
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -37,11 +143,27 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Application lifespan manager for startup and shutdown events.
     
     Initializes connections and resources on startup, cleans up on shutdown.
+    Key Vault secrets are loaded here, off the event loop, so the first
+    request doesn't pay for the round-trip.
     """
     settings = get_settings()
     logger.info(f"Starting {settings.app_name} v{settings.version}")
     logger.info(f"Environment: {settings.environment}")
     
+    if settings.azure_keyvault_url:
+        try:
+            await asyncio.to_thread(settings.load_secrets_from_keyvault)
+        except Exception as e:
+            logger.error(f"Failed to initialize Key Vault: {e}")
+    
+    app.state.settings = settings
+    
+    # Build the deferred request validators before the first request
+    CHAT_REQ_ADAPTER.validate_python(
+        {"messages": [{"role": "user", "content": "warm-up"}]}
+    )
+    CODE_REVIEW_ADAPTER.validate_python({"code": "pass", "language": "python"})
+    
     # Initialize Copilot client (would be actual initialization in production)
     logger.info("Initializing Copilot SDK client...")
     
@@ -56,21 +178,59 @@ app = FastAPI(
     description="Modern FastAPI app with GitHub Copilot SDK integration",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ResponseClass,
 )
 
 
+def _openapi() -> dict[str, Any]:
+    """
+    Build the OpenAPI document, registering the request body schemas.
+    
+    The body models and the models they reference are added under
+    components.schemas, so the requestBody $refs resolve. Schemas FastAPI
+    already emitted are left as they are.
+    
+    Returns:
+        OpenAPI document
+    """
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        _, body_schemas = models_json_schema(
+            [(model, "validation") for model in _BODY_MODELS],
+            ref_template="#/components/schemas/{model}",
+        )
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, model_schema in body_schemas.get("$defs", {}).items():
+            components.setdefault(name, model_schema)
+    return app.openapi_schema
+
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Global exception handler for unhandled errors."""
     logger.exception(f"Unhandled exception on {request.url}")
-    return JSONResponse(
+    return ResponseClass(
         status_code=500,
         content={"detail": "Internal server error", "type": type(exc).__name__},
     )
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+@app.get(
+    "/health",
+    response_model=None,
+    responses=_json_response_schema(HealthResponse, {
+        "status": "healthy",
+        "service": "fastapi-copilot",
+        "version": "1.0.0",
+        "environment": "production",
+    }),
+)
+async def health_check(
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Health check endpoint.
     
@@ -79,25 +239,41 @@ async def health_check() -> HealthResponse:
         
     Example:
         >>> response = await health_check()
-        >>> response.status
-        'healthy'
+        >>> response.status_code
+        200
     """
-    settings = get_settings()
-    return HealthResponse(
+    health = HealthResponse(
         status="healthy",
         service=settings.app_name,
         version=settings.version,
         environment=settings.environment,
     )
+    return Response(
+        content=HEALTH_RESP_ADAPTER.dump_json(health),
+        media_type="application/json",
+    )
 
 
-@app.post("/api/v1/chat", response_model=ChatResponse)
-async def chat_completion(request: ChatRequest) -> ChatResponse:
+@app.post(
+    "/api/v1/chat",
+    response_model=None,
+    responses=_json_response_schema(ChatResponse),
+    openapi_extra=_json_body_schema(ChatRequest, {
+        "messages": [{"role": "user", "content": "Explain FastAPI"}],
+        "model": "gpt-4",
+        "temperature": 0.7,
+    }),
+)
+async def chat_completion(
+    request: ChatRequest = Depends(chat_request_body),
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Generate chat completion using Copilot SDK.
     
     Args:
         request: Chat request with messages and optional parameters
+        settings: Application settings
         
     Returns:
         Chat response with generated message
@@ -112,15 +288,14 @@ async def chat_completion(request: ChatRequest) -> ChatResponse:
         ... )
         >>> response = await chat_completion(req)
     """
-    settings = get_settings()
-    
     logger.info(
         f"Chat request: model={request.model}, messages={len(request.messages)}"
     )
     
     try:
         # Simulate async API call to Copilot SDK
-        await asyncio.sleep(0.1)
+        if settings.simulate_latency:
+            await asyncio.sleep(0.1)
         
         # In production, this would be actual Copilot SDK call:
         # response = await copilot_client.chat.completions.create(
@@ -137,24 +312,37 @@ async def chat_completion(request: ChatRequest) -> ChatResponse:
         
         logger.info("Chat completion successful")
         
-        return ChatResponse(
+        return _model_response(ChatResponse(
             message=response_message,
             model=request.model,
             usage={"prompt_tokens": 10, "completion_tokens": 15, "total_tokens": 25},
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Chat completion failed: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.post("/api/v1/code-review", response_model=CodeReviewResponse)
-async def code_review(request: CodeReviewRequest) -> CodeReviewResponse:
+@app.post(
+    "/api/v1/code-review",
+    response_model=None,
+    responses=_json_response_schema(CodeReviewResponse),
+    openapi_extra=_json_body_schema(CodeReviewRequest, {
+        "code": "def hello(): print('world')",
+        "language": "python",
+        "focus_areas": ["style", "performance"],
+    }),
+)
+async def code_review(
+    request: CodeReviewRequest = Depends(code_review_request_body),
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Perform AI-powered code review.
     
     Args:
         request: Code review request with code and language
+        settings: Application settings
         
     Returns:
         Code review with suggestions and analysis
@@ -171,26 +359,22 @@ async def code_review(request: CodeReviewRequest) -> CodeReviewResponse:
     
     try:
         # Simulate async processing
-        await asyncio.sleep(0.2)
+        if settings.simulate_latency:
+            await asyncio.sleep(0.2)
         
         # Simulated code review results
-        suggestions = [
-            "Consider adding type hints to function parameters",
-            "Add docstring describing function purpose",
-            "Use f-string for better readability",
-        ]
-        
-        issues_found = len(suggestions)
+        suggestions = _DEFAULT_SUGGESTIONS
+        issues_found = _DEFAULT_ISSUE_COUNT
         severity_score = 5.0 if issues_found > 0 else 0.0
         
         logger.info(f"Code review complete: {issues_found} issues found")
         
-        return CodeReviewResponse(
+        return _model_response(CodeReviewResponse(
             suggestions=suggestions,
             severity_score=severity_score,
             language=request.language,
             issues_found=issues_found,
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Code review failed: {e}")
@@ -2,9 +2,34 @@
 Pydantic v2 models for FastAPI application.
 
 Modern type-safe data models using Pydantic v2 with lowercase type hints.
+Every model sets defer_build, so validators are built on first use (or
+by the application lifespan) rather than at import time. Request models
+forbid unknown fields; OpenAPI examples live on the routes in main.py.
+Responses the server fills entirely on its own, with nothing to
+validate, are plain dataclasses serialized through a TypeAdapter.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
+
+# Literal fields are checked inside pydantic-core, with no Python callback
+Role = Literal["user", "assistant", "system"]
+SupportedLanguage = Literal[
+    "python",
+    "javascript",
+    "typescript",
+    "java",
+    "go",
+    "rust",
+    "csharp",
+]
+
+
+def _lowercase(value: object) -> object:
+    """Lowercase string input so language matching is case-insensitive."""
+    return value.lower() if isinstance(value, str) else value
 
 
 class Message(BaseModel):
@@ -21,28 +46,10 @@ class Message(BaseModel):
         'user'
     """
     
-    role: str = Field(..., description="Message role (user, assistant, system)")
+    role: Role = Field(..., description="Message role (user, assistant, system)")
     content: str = Field(..., description="Message content")
     
-    @field_validator("role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
-        """Validate message role is one of allowed values."""
-        allowed_roles = {"user", "assistant", "system"}
-        if v not in allowed_roles:
-            raise ValueError(f"Role must be one of {allowed_roles}")
-        return v
-    
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "role": "user",
-                    "content": "What is FastAPI?",
-                }
-            ]
-        }
-    }
+    model_config = {"defer_build": True, "extra": "forbid"}
 
 
 class ChatRequest(BaseModel):
@@ -67,19 +74,7 @@ class ChatRequest(BaseModel):
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int | None = Field(default=None, ge=1, le=4000)
     
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "messages": [
-                        {"role": "user", "content": "Explain FastAPI"}
-                    ],
-                    "model": "gpt-4",
-                    "temperature": 0.7,
-                }
-            ]
-        }
-    }
+    model_config = {"defer_build": True, "extra": "forbid"}
 
 
 class ChatResponse(BaseModel):
@@ -98,6 +93,8 @@ class ChatResponse(BaseModel):
         default_factory=dict,
         description="Token usage statistics",
     )
+    
+    model_config = {"defer_build": True}
 
 
 class CodeReviewRequest(BaseModel):
@@ -118,28 +115,16 @@ class CodeReviewRequest(BaseModel):
     """
     
     code: str = Field(..., min_length=1, description="Source code to review")
-    language: str = Field(..., description="Programming language")
+    language: Annotated[SupportedLanguage, BeforeValidator(_lowercase)] = Field(
+        ...,
+        description="Programming language (case-insensitive)",
+    )
     focus_areas: list[str] | None = Field(
         default=None,
         description="Specific areas to focus on",
     )
     
-    @field_validator("language")
-    @classmethod
-    def validate_language(cls, v: str) -> str:
-        """Validate programming language is supported."""
-        supported = {
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "go",
-            "rust",
-            "csharp",
-        }
-        if v.lower() not in supported:
-            raise ValueError(f"Language must be one of {supported}")
-        return v.lower()
+    model_config = {"defer_build": True, "extra": "forbid"}
 
 
 class CodeReviewResponse(BaseModel):
@@ -157,11 +142,16 @@ class CodeReviewResponse(BaseModel):
     severity_score: float = Field(ge=0.0, le=10.0)
     language: str
     issues_found: int = Field(ge=0)
+    
+    model_config = {"defer_build": True}
 
 
-class HealthResponse(BaseModel):
+# Filled from settings on every health probe with nothing to validate, so
+# it is a plain dataclass; HEALTH_RESP_ADAPTER serializes it.
+@dataclass(slots=True)
+class HealthResponse:
     """
-    Health check response model.
+    Health check response.
     
     Attributes:
         status: Service health status
@@ -170,20 +160,14 @@ class HealthResponse(BaseModel):
         environment: Deployment environment
     """
     
-    status: str = Field(..., description="Health status")
+    status: Annotated[str, Field(description="Health status")]
     service: str
     version: str
     environment: str
-    
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "status": "healthy",
-                    "service": "fastapi-copilot",
-                    "version": "1.0.0",
-                    "environment": "production",
-                }
-            ]
-        }
-    }
+
+
+# Prebuilt adapters for the request bodies; validate_json parses raw bytes
+# straight into the model inside pydantic-core, with no json.loads step.
+CHAT_REQ_ADAPTER: TypeAdapter[ChatRequest] = TypeAdapter(ChatRequest)
+CODE_REVIEW_ADAPTER: TypeAdapter[CodeReviewRequest] = TypeAdapter(CodeReviewRequest)
+HEALTH_RESP_ADAPTER: TypeAdapter[HealthResponse] = TypeAdapter(HealthResponse)
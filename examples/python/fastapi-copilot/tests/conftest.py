@@ -0,0 +1,37 @@
+"""
+Shared pytest configuration for FastAPI tests.
+
+Disables the simulated Copilot latency before the application settings
+are first loaded, so endpoint tests don't sleep, and provides an async
+client that runs the application lifespan once per session.
+"""
+
+import os
+from collections.abc import AsyncIterator
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+os.environ.setdefault("SIMULATE_LATENCY", "false")
+
+# Imported after the env override so the settings see it
+from main import app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[AsyncClient]:
+    """
+    Async HTTP client fixture shared by every test in the session.
+    
+    Requests go straight to the ASGI app in-process, with no thread
+    bridge. ASGITransport does not send lifespan events, so the
+    application lifespan (logging setup, Key Vault loading) is entered
+    here a single time around the whole session.
+    
+    Yields:
+        httpx async client bound to the application
+    """
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+            yield test_client
@@ -57,8 +57,8 @@ from test_hints import suggest_tests
 
 code = json.loads(${JSON.stringify(JSON.stringify(pythonCode))})
 
-# Get basic AST analysis
-analysis_result = json.loads(analyze_code(code))
+# Get basic AST analysis (the raw AST dict is not displayed, so skip it)
+analysis_result = json.loads(analyze_code(code, include_ast=False))
 
 if analysis_result['success']:
     tree = ast.parse(code)
@@ -10,7 +10,225 @@ License: CC0-1.0
 
 import ast
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Not available in every Pyodide build
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Uses orjson's native encoder when it is installed and falls back to
+    the standard library otherwise.
+
+    Args:
+        obj: JSON-compatible object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _simple_source(node: ast.expr) -> Optional[str]:
+    """Render names, dotted names, subscripts and X | Y unions, else None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _simple_source(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    if isinstance(node, ast.Subscript):
+        value = _simple_source(node.value)
+        slice_node = node.slice
+        inner: Optional[str]
+        if isinstance(slice_node, ast.Tuple) and slice_node.elts:
+            parts: List[str] = []
+            for elt in slice_node.elts:
+                part = _simple_source(elt)
+                if part is None:
+                    return None
+                parts.append(part)
+            inner = ", ".join(parts)
+            if len(parts) == 1:
+                inner += ","
+        else:
+            inner = _simple_source(slice_node)
+        return None if value is None or inner is None else f"{value}[{inner}]"
+    if isinstance(node, ast.Constant) and node.value is None:
+        return "None"
+    if (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.BitOr)
+        and not isinstance(node.right, ast.BinOp)
+    ):
+        left = _simple_source(node.left)
+        right = _simple_source(node.right)
+        return None if left is None or right is None else f"{left} | {right}"
+    return None
+
+
+def _source(node: ast.expr) -> str:
+    """
+    Render an annotation, decorator or base class expression as source.
+
+    The common shapes are rendered from plain attribute reads; anything
+    else falls back to ast.unparse, which builds a full unparser per call.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        Source text equal to ast.unparse(node)
+    """
+    return _simple_source(node) or ast.unparse(node)
+
+
+def _has_docstring(node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]) -> bool:
+    """
+    Check for a docstring the way ast.get_docstring does, minus the cleandoc.
+
+    Args:
+        node: Function or class definition node
+
+    Returns:
+        True if the body starts with a string literal expression
+    """
+    if not node.body:
+        return False
+    first = node.body[0]
+    return (
+        type(first) is ast.Expr
+        and type(first.value) is ast.Constant
+        and type(first.value.value) is str
+    )
+
+
+# Sentinel for attributes and fields that are absent on a node
+_MISSING: Any = object()
+
+# Every node class exported by the ast module. Nodes are never user
+# subclasses, so an exact type lookup replaces isinstance(x, ast.AST).
+_AST_TYPES: FrozenSet[type] = frozenset(
+    cls for cls in vars(ast).values() if isinstance(cls, type) and issubclass(cls, ast.AST)
+)
+
+
+class _Collector(ast.NodeVisitor):
+    """
+    Single AST pass gathering what the structure and metrics reports share.
+
+    Besides the function, class and import entries it tracks the deepest
+    nesting of control-flow and definition blocks.
+    """
+
+    # Node type -> handler, resolved once per type rather than building
+    # and looking up the "visit_<Name>" attribute for every node
+    _handlers: ClassVar[Dict[type, Callable[["_Collector", Any], Any]]] = {}
+
+    def __init__(self) -> None:
+        self.functions: List[Dict[str, Any]] = []
+        self.classes: List[Dict[str, Any]] = []
+        self.imports: List[Dict[str, Any]] = []
+        self.import_count = 0
+        self.max_depth = 0
+        self._depth = 0
+
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch to the handler for the node's type."""
+        node_type = type(node)
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            handler = self._handlers[node_type] = getattr(
+                _Collector, f"visit_{node_type.__name__}", _Collector.generic_visit
+            )
+        handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit child nodes with a direct loop over _fields, not ast.iter_fields."""
+        visit = self.visit
+        for field in node._fields:
+            value = getattr(node, field, _MISSING)
+            if isinstance(value, list):
+                for item in value:
+                    if type(item) in _AST_TYPES:
+                        visit(item)
+            elif type(value) in _AST_TYPES:
+                visit(value)
+
+    def _visit_nested(self, node: ast.AST) -> None:
+        """Visit a block that adds one level of nesting."""
+        self._depth += 1
+        if self._depth > self.max_depth:
+            self.max_depth = self._depth
+        try:
+            self.generic_visit(node)
+        finally:
+            self._depth -= 1
+
+    def visit_If(self, node: ast.If) -> None:
+        self._visit_nested(node)
+
+    def visit_For(self, node: ast.For) -> None:
+        self._visit_nested(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        self._visit_nested(node)
+
+    def visit_With(self, node: ast.With) -> None:
+        self._visit_nested(node)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self._visit_nested(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append({
+            "name": node.name,
+            "lineno": node.lineno,
+            "args": [arg.arg for arg in node.args.args],
+            "returns": _source(node.returns) if node.returns else None,
+            "decorators": [_source(d) for d in node.decorator_list],
+            "has_docstring": _has_docstring(node),
+        })
+        self._visit_nested(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append({
+            "name": node.name,
+            "lineno": node.lineno,
+            "bases": [_source(base) for base in node.bases],
+            "methods": [
+                item.name
+                for item in node.body
+                if isinstance(item, ast.FunctionDef)
+            ],
+            "has_docstring": _has_docstring(node),
+        })
+        self._visit_nested(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.import_count += 1
+        for alias in node.names:
+            self.imports.append({
+                "module": alias.name,
+                "alias": alias.asname,
+                "lineno": node.lineno,
+            })
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.import_count += 1
+        for alias in node.names:
+            self.imports.append({
+                "module": f"{node.module}.{alias.name}",
+                "alias": alias.asname,
+                "lineno": node.lineno,
+            })
 
 
 class ASTAnalyzer:
@@ -29,6 +247,11 @@ class ASTAnalyzer:
         self.source_code = source_code
         self.tree: Optional[ast.AST] = None
         self.errors: List[str] = []
+        self._collected: Optional[_Collector] = None
+        self._line_counts: Optional[Tuple[int, int, int, int]] = None
+        self._structure: Optional[Dict[str, Any]] = None
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._ast_dict: Optional[Dict[str, Any]] = None
 
     def parse(self) -> bool:
         """
@@ -39,6 +262,8 @@ class ASTAnalyzer:
         """
         try:
             self.tree = ast.parse(self.source_code)
+            self._collected = None
+            self._structure = self._metrics = self._ast_dict = None
             return True
         except SyntaxError as e:
             self.errors.append(f"Syntax error at line {e.lineno}: {e.msg}")
@@ -47,177 +272,177 @@ class ASTAnalyzer:
             self.errors.append(f"Parse error: {str(e)}")
             return False
 
+    def _collect(self, tree: ast.AST) -> _Collector:
+        """Walk the AST once and memoize what get_structure/get_metrics need."""
+        if self._collected is None:
+            collector = _Collector()
+            collector.visit(tree)
+            self._collected = collector
+        return self._collected
+
     def get_structure(self) -> Dict[str, Any]:
         """
         Extract code structure (functions, classes, imports).
 
+        Entries are listed in source order. The result is cached until
+        the next parse().
+
         Returns:
             Dictionary containing code structure information
         """
         if not self.tree:
             return {"error": "No AST available. Call parse() first."}
 
-        structure = {
-            "functions": [],
-            "classes": [],
-            "imports": [],
-            "globals": [],
-        }
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                structure["functions"].append({
-                    "name": node.name,
-                    "lineno": node.lineno,
-                    "args": [arg.arg for arg in node.args.args],
-                    "returns": ast.unparse(node.returns) if node.returns else None,
-                    "decorators": [ast.unparse(d) for d in node.decorator_list],
-                    "has_docstring": ast.get_docstring(node) is not None,
-                })
-
-            elif isinstance(node, ast.ClassDef):
-                structure["classes"].append({
-                    "name": node.name,
-                    "lineno": node.lineno,
-                    "bases": [ast.unparse(base) for base in node.bases],
-                    "methods": [
-                        item.name
-                        for item in node.body
-                        if isinstance(item, ast.FunctionDef)
-                    ],
-                    "has_docstring": ast.get_docstring(node) is not None,
-                })
-
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        structure["imports"].append({
-                            "module": alias.name,
-                            "alias": alias.asname,
-                            "lineno": node.lineno,
-                        })
-                else:
-                    for alias in node.names:
-                        structure["imports"].append({
-                            "module": f"{node.module}.{alias.name}",
-                            "alias": alias.asname,
-                            "lineno": node.lineno,
-                        })
-
-        return structure
+        if self._structure is None:
+            collected = self._collect(self.tree)
+            self._structure = {
+                "functions": collected.functions,
+                "classes": collected.classes,
+                "imports": collected.imports,
+                "globals": [],
+            }
+        return self._structure
 
     def get_metrics(self) -> Dict[str, Any]:
         """
         Calculate code metrics.
 
+        The result is cached until the next parse().
+
         Returns:
             Dictionary of code metrics
         """
         if not self.tree:
             return {"error": "No AST available"}
 
-        metrics = {
-            "total_lines": len(self.source_code.splitlines()),
-            "code_lines": self._count_code_lines(),
-            "comment_lines": self._count_comment_lines(),
-            "blank_lines": self._count_blank_lines(),
-            "function_count": 0,
-            "class_count": 0,
-            "import_count": 0,
-            "max_nesting_depth": 0,
-        }
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                metrics["function_count"] += 1
-            elif isinstance(node, ast.ClassDef):
-                metrics["class_count"] += 1
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                metrics["import_count"] += 1
-
-        # Calculate max nesting depth
-        metrics["max_nesting_depth"] = self._calculate_max_depth(self.tree)
-
-        return metrics
-
-    def get_ast_json(self) -> str:
+        if self._metrics is None:
+            collected = self._collect(self.tree)
+            total_lines, code_lines, comment_lines, blank_lines = self._count_lines()
+            self._metrics = {
+                "total_lines": total_lines,
+                "code_lines": code_lines,
+                "comment_lines": comment_lines,
+                "blank_lines": blank_lines,
+                "function_count": len(collected.functions),
+                "class_count": len(collected.classes),
+                "import_count": collected.import_count,
+                "max_nesting_depth": collected.max_depth,
+            }
+        return self._metrics
+
+    def get_ast_dict(self) -> Dict[str, Any]:
         """
-        Convert AST to JSON representation.
+        Convert AST to a JSON-compatible dictionary.
+
+        The result is cached until the next parse(), so get_ast_json()
+        can be called repeatedly without re-walking the tree.
 
         Returns:
-            JSON string of AST structure
+            Nested dictionary of AST structure
         """
         if not self.tree:
-            return json.dumps({"error": "No AST available"})
+            return {"error": "No AST available"}
+
+        if self._ast_dict is None:
+            self._ast_dict = self._ast_to_dict(self.tree)
+        return self._ast_dict
 
-        return json.dumps(self._ast_to_dict(self.tree), indent=2)
+    def get_ast_json(self, pretty: bool = True) -> str:
+        """
+        Convert AST to JSON representation.
+
+        Args:
+            pretty: Indent the output by two spaces
+
+        Returns:
+            JSON string of AST structure
+        """
+        return _dumps(self.get_ast_dict(), indent=pretty)
 
     def _ast_to_dict(self, node: ast.AST) -> Dict[str, Any]:
-        """Convert AST node to dictionary recursively."""
-        result: Dict[str, Any] = {"type": node.__class__.__name__}
+        """
+        Convert AST node to dictionary.
 
-        if hasattr(node, "lineno"):
-            result["lineno"] = node.lineno
-        if hasattr(node, "col_offset"):
-            result["col_offset"] = node.col_offset
+        Walks the tree with an explicit work stack instead of recursion:
+        each child's dict is attached to its parent up front and filled
+        when the child is popped, so large modules don't pay a Python
+        frame per node.
+        """
+        root: Dict[str, Any] = {}
+        stack: List[Tuple[ast.AST, Dict[str, Any]]] = [(node, root)]
+        push = stack.append
+
+        while stack:
+            current, result = stack.pop()
+            result["type"] = current.__class__.__name__
+
+            lineno = getattr(current, "lineno", _MISSING)
+            if lineno is not _MISSING:
+                result["lineno"] = lineno
+            col_offset = getattr(current, "col_offset", _MISSING)
+            if col_offset is not _MISSING:
+                result["col_offset"] = col_offset
+
+            for field in current._fields:
+                value = getattr(current, field, _MISSING)
+                if value is _MISSING:
+                    continue
+                if isinstance(value, list):
+                    items: List[Any] = []
+                    for item in value:
+                        if type(item) in _AST_TYPES:
+                            child: Dict[str, Any] = {}
+                            push((item, child))
+                            items.append(child)
+                        else:
+                            items.append(item)
+                    result[field] = items
+                elif type(value) in _AST_TYPES:
+                    child = {}
+                    push((value, child))
+                    result[field] = child
+                else:
+                    result[field] = str(value) if value is not None else None
+
+        return root
+
+    def _count_lines(self) -> Tuple[int, int, int, int]:
+        """Count total, code, comment and blank lines in a single pass."""
+        if self._line_counts is None:
+            lines = self.source_code.splitlines()
+            code = comment = blank = 0
+            for line in lines:
+                stripped = line.strip()
+                if not stripped:
+                    blank += 1
+                elif stripped[0] == "#":
+                    comment += 1
+                else:
+                    code += 1
+            self._line_counts = (len(lines), code, comment, blank)
+        return self._line_counts
 
-        for field, value in ast.iter_fields(node):
-            if isinstance(value, list):
-                result[field] = [
-                    self._ast_to_dict(item) if isinstance(item, ast.AST) else item
-                    for item in value
-                ]
-            elif isinstance(value, ast.AST):
-                result[field] = self._ast_to_dict(value)
-            else:
-                result[field] = str(value) if value is not None else None
-
-        return result
-
-    def _count_code_lines(self) -> int:
-        """Count non-comment, non-blank lines."""
-        lines = self.source_code.splitlines()
-        return sum(
-            1
-            for line in lines
-            if line.strip() and not line.strip().startswith("#")
-        )
-
-    def _count_comment_lines(self) -> int:
-        """Count comment lines."""
-        lines = self.source_code.splitlines()
-        return sum(1 for line in lines if line.strip().startswith("#"))
-
-    def _count_blank_lines(self) -> int:
-        """Count blank lines."""
-        lines = self.source_code.splitlines()
-        return sum(1 for line in lines if not line.strip())
-
-    def _calculate_max_depth(self, node: ast.AST, current_depth: int = 0) -> int:
-        """Calculate maximum nesting depth."""
-        max_depth = current_depth
-
-        for child in ast.iter_child_nodes(node):
-            # Count control flow structures
-            if isinstance(
-                child,
-                (ast.If, ast.For, ast.While, ast.With, ast.Try, ast.FunctionDef, ast.ClassDef),
-            ):
-                child_depth = self._calculate_max_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-            else:
-                child_depth = self._calculate_max_depth(child, current_depth)
-                max_depth = max(max_depth, child_depth)
-
-        return max_depth
-
-
-def analyze_code(source_code: str) -> str:
+
+def analyze_code(
+    source_code: str,
+    include_structure: bool = True,
+    include_metrics: bool = True,
+    include_ast: bool = True,
+) -> str:
     """
     Main entry point for code analysis from JavaScript.
 
+    This is the only function JavaScript should call: each call into
+    Pyodide crosses the JS/WASM boundary, so the analyzer's individual
+    methods are not meant to be driven from JS one by one. Sections the
+    caller does not need can be switched off to skip their work; they
+    are then left out of the result.
+
     Args:
         source_code: Python code to analyze
+        include_structure: Include functions, classes and imports
+        include_metrics: Include line counts and nesting metrics
+        include_ast: Include the full AST dictionary (the most expensive part)
 
     Returns:
         JSON string with analysis results
@@ -225,15 +450,16 @@ def analyze_code(source_code: str) -> str:
     analyzer = ASTAnalyzer(source_code)
 
     if not analyzer.parse():
-        return json.dumps({"success": False, "errors": analyzer.errors})
+        return _dumps({"success": False, "errors": analyzer.errors})
 
     try:
-        results = {
-            "success": True,
-            "structure": analyzer.get_structure(),
-            "metrics": analyzer.get_metrics(),
-            "ast": json.loads(analyzer.get_ast_json()),
-        }
-        return json.dumps(results)
+        results: Dict[str, Any] = {"success": True}
+        if include_structure:
+            results["structure"] = analyzer.get_structure()
+        if include_metrics:
+            results["metrics"] = analyzer.get_metrics()
+        if include_ast:
+            results["ast"] = analyzer.get_ast_dict()
+        return _dumps(results)
     except Exception as e:
-        return json.dumps({"success": False, "errors": [str(e)]})
+        return _dumps({"success": False, "errors": [str(e)]})
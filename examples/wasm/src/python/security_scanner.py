@@ -10,7 +10,51 @@ License: CC0-1.0
 
 import ast
 import re
-from typing import Any, Dict, List
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Set, Tuple
+
+try:
+    import re2  # type: ignore[import-not-found]
+except ImportError:  # google-re2 is optional and not built for Pyodide
+    re2 = None
+
+# Patterns for common secrets: group name -> (pattern, label). They are
+# compiled into one alternation that is run once over the whole source;
+# the matching group's name identifies the secret type. Whitespace around
+# "=" excludes newlines so that no match spans two lines. With google-re2
+# installed the alternation runs on RE2's linear-time automaton, which
+# cannot backtrack catastrophically on hostile input.
+_SECRET_PATTERNS: Dict[str, Tuple[str, str]] = {
+    "password": (r"password[^\S\n]*=[^\S\n]*['\"][\w!@#$%^&*]+['\"]", "Password"),
+    "api_key": (r"api[_-]?key[^\S\n]*=[^\S\n]*['\"][\w-]+['\"]", "API Key"),
+    "secret_key": (r"secret[_-]?key[^\S\n]*=[^\S\n]*['\"][\w-]+['\"]", "Secret Key"),
+    "token": (r"token[^\S\n]*=[^\S\n]*['\"][\w.-]+['\"]", "Token"),
+    "aws_secret": (r"aws[_-]?secret[^\S\n]*=[^\S\n]*['\"][\w/+]+['\"]", "AWS Secret"),
+}
+_SECRET_ALTERNATION = "|".join(
+    f"(?P<{name}>{pattern})" for name, (pattern, _) in _SECRET_PATTERNS.items()
+)
+if re2 is not None:
+    _re2_options = re2.Options()
+    _re2_options.case_sensitive = False
+    _SECRET_RE = re2.compile(_SECRET_ALTERNATION, _re2_options)
+else:
+    # A lookahead on the patterns' first letters lets re skip positions
+    # where no alternative can start without trying each of them
+    _first_chars = "".join(sorted({pattern[0] for pattern, _ in _SECRET_PATTERNS.values()}))
+    _SECRET_RE = re.compile(f"(?=[{_first_chars}])(?:{_SECRET_ALTERNATION})", re.IGNORECASE)
+
+# Built-in functions flagged on sight: name -> (severity, description)
+_DANGEROUS_FUNCS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "eval": ("HIGH", "Arbitrary code execution risk"),
+    "exec": ("HIGH", "Arbitrary code execution risk"),
+    "compile": ("MEDIUM", "Dynamic code compilation"),
+    "__import__": ("MEDIUM", "Dynamic import can load malicious code"),
+})
+
+# hashlib constructors for broken hash algorithms
+_WEAK_ALGORITHMS: FrozenSet[str] = frozenset({"md5", "sha1"})
 
 
 class SecurityScanner:
@@ -23,6 +67,11 @@ class SecurityScanner:
     LOW = "LOW"
     INFO = "INFO"
 
+    # Sort position of each severity, most severe first. Severities are
+    # spelled as literals here: under mypyc, class-body expressions
+    # cannot read the class attributes defined above.
+    _SEVERITY_RANK: Dict[str, int] = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
+
     def __init__(self, source_code: str, tree: ast.AST) -> None:
         """
         Initialize security scanner.
@@ -44,18 +93,14 @@ class SecurityScanner:
         """
         self.issues = []
 
-        # Run all security checks
-        self._check_dangerous_functions()
-        self._check_sql_injection()
-        self._check_path_traversal()
-        self._check_unsafe_deserialization()
+        # Run all call-based checks over the tree's (cached) call nodes
+        for node in _calls(self.tree):
+            self._check_call(node)
         self._check_hardcoded_secrets()
-        self._check_weak_crypto()
-        self._check_shell_injection()
 
         # Sort by severity
-        severity_order = [self.CRITICAL, self.HIGH, self.MEDIUM, self.LOW, self.INFO]
-        self.issues.sort(key=lambda x: severity_order.index(x["severity"]))
+        rank = self._SEVERITY_RANK
+        self.issues.sort(key=lambda x: rank[x["severity"]])
 
         return self.issues
 
@@ -76,117 +121,109 @@ class SecurityScanner:
             "recommendation": recommendation,
         })
 
-    def _check_dangerous_functions(self) -> None:
+    def _check_call(self, node: ast.Call) -> None:
+        """Run every call-based check against a single call node."""
+        func = node.func
+        if isinstance(func, ast.Name):
+            self._check_dangerous_functions(node, func)
+            self._check_path_traversal(node, func)
+        elif isinstance(func, ast.Attribute):
+            self._check_sql_injection(node, func)
+            self._check_unsafe_deserialization(node, func)
+            self._check_weak_crypto(node, func)
+            self._check_shell_injection(node, func)
+
+    def _check_dangerous_functions(self, node: ast.Call, func: ast.Name) -> None:
         """Check for dangerous built-in functions."""
-        dangerous_funcs = {
-            "eval": (self.HIGH, "Arbitrary code execution risk"),
-            "exec": (self.HIGH, "Arbitrary code execution risk"),
-            "compile": (self.MEDIUM, "Dynamic code compilation"),
-            "__import__": (self.MEDIUM, "Dynamic import can load malicious code"),
-        }
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                    if func_name in dangerous_funcs:
-                        severity, desc = dangerous_funcs[func_name]
-                        self._add_issue(
-                            severity=severity,
-                            title=f"Dangerous function: {func_name}()",
-                            description=desc,
-                            lineno=node.lineno,
-                            recommendation=f"Avoid using {func_name}(). "
-                            "Consider safer alternatives like ast.literal_eval() for eval(), "
-                            "or refactor to eliminate dynamic code execution.",
-                        )
-
-    def _check_sql_injection(self) -> None:
+        func_name = func.id
+        entry = _DANGEROUS_FUNCS.get(func_name)
+        if entry is not None:
+            severity, desc = entry
+            self._add_issue(
+                severity=severity,
+                title=f"Dangerous function: {func_name}()",
+                description=desc,
+                lineno=node.lineno,
+                recommendation=f"Avoid using {func_name}(). "
+                "Consider safer alternatives like ast.literal_eval() for eval(), "
+                "or refactor to eliminate dynamic code execution.",
+            )
+
+    def _check_sql_injection(self, node: ast.Call, func: ast.Attribute) -> None:
         """Check for potential SQL injection vulnerabilities."""
-        for node in ast.walk(self.tree):
-            # Check for string formatting in SQL-like strings
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Attribute):
-                    # Check for .execute() calls
-                    if node.func.attr == "execute" and node.args:
-                        first_arg = node.args[0]
-
-                        # Check for f-strings or % formatting
-                        if isinstance(first_arg, ast.JoinedStr):
-                            self._add_issue(
-                                severity=self.HIGH,
-                                title="SQL Injection: f-string in SQL query",
-                                description="Using f-strings for SQL queries allows injection attacks",
-                                lineno=node.lineno,
-                                recommendation="Use parameterized queries with placeholders: "
-                                "execute('SELECT * FROM users WHERE id = ?', [user_id])",
-                            )
-
-                        # Check for string concatenation
-                        elif isinstance(first_arg, ast.BinOp) and isinstance(
-                            first_arg.op, ast.Add
-                        ):
-                            if self._contains_string(first_arg):
-                                self._add_issue(
-                                    severity=self.HIGH,
-                                    title="SQL Injection: String concatenation in query",
-                                    description="String concatenation in SQL queries is unsafe",
-                                    lineno=node.lineno,
-                                    recommendation="Use parameterized queries instead of concatenation",
-                                )
-
-    def _check_path_traversal(self) -> None:
+        # Check for .execute() calls
+        if func.attr == "execute" and node.args:
+            first_arg = node.args[0]
+
+            # Check for f-strings or % formatting
+            if isinstance(first_arg, ast.JoinedStr):
+                self._add_issue(
+                    severity=self.HIGH,
+                    title="SQL Injection: f-string in SQL query",
+                    description="Using f-strings for SQL queries allows injection attacks",
+                    lineno=node.lineno,
+                    recommendation="Use parameterized queries with placeholders: "
+                    "execute('SELECT * FROM users WHERE id = ?', [user_id])",
+                )
+
+            # Check for string concatenation
+            elif isinstance(first_arg, ast.BinOp) and isinstance(first_arg.op, ast.Add):
+                if self._contains_string(first_arg):
+                    self._add_issue(
+                        severity=self.HIGH,
+                        title="SQL Injection: String concatenation in query",
+                        description="String concatenation in SQL queries is unsafe",
+                        lineno=node.lineno,
+                        recommendation="Use parameterized queries instead of concatenation",
+                    )
+
+    def _check_path_traversal(self, node: ast.Call, func: ast.Name) -> None:
         """Check for path traversal vulnerabilities."""
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    # Check for file operations
-                    if node.func.id in ("open", "read", "write"):
-                        if node.args and isinstance(node.args[0], (ast.Name, ast.BinOp)):
-                            self._add_issue(
-                                severity=self.MEDIUM,
-                                title="Potential path traversal",
-                                description="User-controlled file paths can lead to unauthorized access",
-                                lineno=node.lineno,
-                                recommendation="Validate and sanitize file paths. Use os.path.basename() "
-                                "or pathlib.Path.resolve() to prevent directory traversal.",
-                            )
-
-    def _check_unsafe_deserialization(self) -> None:
+        # Check for file operations
+        if func.id in ("open", "read", "write"):
+            if node.args and isinstance(node.args[0], (ast.Name, ast.BinOp)):
+                self._add_issue(
+                    severity=self.MEDIUM,
+                    title="Potential path traversal",
+                    description="User-controlled file paths can lead to unauthorized access",
+                    lineno=node.lineno,
+                    recommendation="Validate and sanitize file paths. Use os.path.basename() "
+                    "or pathlib.Path.resolve() to prevent directory traversal.",
+                )
+
+    def _check_unsafe_deserialization(self, node: ast.Call, func: ast.Attribute) -> None:
         """Check for unsafe deserialization (pickle)."""
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Call):
-                # Check for pickle.loads()
-                if isinstance(node.func, ast.Attribute):
-                    if (
-                        isinstance(node.func.value, ast.Name)
-                        and node.func.value.id == "pickle"
-                        and node.func.attr in ("loads", "load")
-                    ):
-                        self._add_issue(
-                            severity=self.HIGH,
-                            title="Unsafe deserialization: pickle",
-                            description="pickle.loads() can execute arbitrary code from untrusted data",
-                            lineno=node.lineno,
-                            recommendation="Use JSON or other safe serialization formats. "
-                            "If pickle is required, ensure data source is trusted and verified.",
-                        )
+        # Check for pickle.loads()
+        if (
+            isinstance(func.value, ast.Name)
+            and func.value.id == "pickle"
+            and func.attr in ("loads", "load")
+        ):
+            self._add_issue(
+                severity=self.HIGH,
+                title="Unsafe deserialization: pickle",
+                description="pickle.loads() can execute arbitrary code from untrusted data",
+                lineno=node.lineno,
+                recommendation="Use JSON or other safe serialization formats. "
+                "If pickle is required, ensure data source is trusted and verified.",
+            )
 
     def _check_hardcoded_secrets(self) -> None:
         """Check for hardcoded secrets in source code."""
-        # Patterns for common secrets
-        secret_patterns = [
-            (r"password\s*=\s*['\"][\w!@#$%^&*]+['\"]", "Password"),
-            (r"api[_-]?key\s*=\s*['\"][\w-]+['\"]", "API Key"),
-            (r"secret[_-]?key\s*=\s*['\"][\w-]+['\"]", "Secret Key"),
-            (r"token\s*=\s*['\"][\w.-]+['\"]", "Token"),
-            (r"aws[_-]?secret\s*=\s*['\"][\w/+]+['\"]", "AWS Secret"),
-        ]
-
-        lines = self.source_code.splitlines()
-        for lineno, line in enumerate(lines, start=1):
-            for pattern, secret_type in secret_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+        source = self.source_code
+
+        # Secret types per line number, counting newlines between matches
+        found: Dict[int, Set[str]] = {}
+        lineno, pos = 1, 0
+        for match in _SECRET_RE.finditer(source):
+            start = match.start()
+            lineno += source.count("\n", pos, start)
+            pos = start
+            found.setdefault(lineno, set()).add(match.lastgroup)
+
+        for lineno, names in found.items():
+            for name, (_, secret_type) in _SECRET_PATTERNS.items():
+                if name in names:
                     self._add_issue(
                         severity=self.CRITICAL,
                         title=f"Hardcoded secret: {secret_type}",
@@ -196,73 +233,122 @@ class SecurityScanner:
                         "Use os.getenv() or python-dotenv to load from .env files.",
                     )
 
-    def _check_weak_crypto(self) -> None:
+    def _check_weak_crypto(self, node: ast.Call, func: ast.Attribute) -> None:
         """Check for weak cryptographic practices."""
-        weak_algorithms = {"md5", "sha1"}
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Call):
-                # Check for hashlib weak algorithms
-                if isinstance(node.func, ast.Attribute):
-                    if (
-                        isinstance(node.func.value, ast.Name)
-                        and node.func.value.id == "hashlib"
-                        and node.func.attr in weak_algorithms
-                    ):
-                        self._add_issue(
-                            severity=self.MEDIUM,
-                            title=f"Weak cryptographic algorithm: {node.func.attr}",
-                            description=f"{node.func.attr.upper()} is cryptographically weak",
-                            lineno=node.lineno,
-                            recommendation="Use stronger algorithms like SHA-256 or SHA-512 "
-                            "for cryptographic purposes.",
-                        )
-
-    def _check_shell_injection(self) -> None:
+        # Check for hashlib weak algorithms
+        if (
+            isinstance(func.value, ast.Name)
+            and func.value.id == "hashlib"
+            and func.attr in _WEAK_ALGORITHMS
+        ):
+            self._add_issue(
+                severity=self.MEDIUM,
+                title=f"Weak cryptographic algorithm: {func.attr}",
+                description=f"{func.attr.upper()} is cryptographically weak",
+                lineno=node.lineno,
+                recommendation="Use stronger algorithms like SHA-256 or SHA-512 "
+                "for cryptographic purposes.",
+            )
+
+    def _check_shell_injection(self, node: ast.Call, func: ast.Attribute) -> None:
         """Check for shell injection vulnerabilities."""
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Call):
-                # Check for os.system, subprocess with shell=True
-                if isinstance(node.func, ast.Attribute):
-                    if (
-                        isinstance(node.func.value, ast.Name)
-                        and node.func.value.id == "os"
-                        and node.func.attr == "system"
-                    ):
+        attr = func.attr
+
+        # Check for os.system
+        if isinstance(func.value, ast.Name) and func.value.id == "os" and attr == "system":
+            self._add_issue(
+                severity=self.HIGH,
+                title="Shell injection risk: os.system()",
+                description="os.system() with user input can execute arbitrary commands",
+                lineno=node.lineno,
+                recommendation="Use subprocess.run() with shell=False and argument list. "
+                "Validate and sanitize all user input.",
+            )
+
+        # Check for subprocess with shell=True
+        elif attr in ("call", "run", "Popen"):
+            for keyword in node.keywords:
+                if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant):
+                    if keyword.value.value is True:
                         self._add_issue(
                             severity=self.HIGH,
-                            title="Shell injection risk: os.system()",
-                            description="os.system() with user input can execute arbitrary commands",
+                            title="Shell injection risk: shell=True",
+                            description="subprocess with shell=True is vulnerable to injection",
                             lineno=node.lineno,
-                            recommendation="Use subprocess.run() with shell=False and argument list. "
-                            "Validate and sanitize all user input.",
+                            recommendation="Set shell=False and pass command as list of arguments",
                         )
 
-                # Check for subprocess with shell=True
-                elif isinstance(node.func, ast.Attribute) and node.func.attr in (
-                    "call",
-                    "run",
-                    "Popen",
-                ):
-                    for keyword in node.keywords:
-                        if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant):
-                            if keyword.value.value is True:
-                                self._add_issue(
-                                    severity=self.HIGH,
-                                    title="Shell injection risk: shell=True",
-                                    description="subprocess with shell=True is vulnerable to injection",
-                                    lineno=node.lineno,
-                                    recommendation="Set shell=False and pass command as list of arguments",
-                                )
-
     def _contains_string(self, node: ast.AST) -> bool:
         """Check if node contains string constants."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Constant) and isinstance(child.value, str):
-                return True
+        if type(node) is ast.Constant and type(node.value) is str:
+            return True
+        # Depth-first with an explicit stack, stopping at the first string.
+        # Each node's children are tested before any is descended into, so a
+        # string operand near the top of a long concatenation is found
+        # without walking the rest of the chain.
+        stack = [node]
+        pop, push = stack.pop, stack.append
+        while stack:
+            children = list(ast.iter_child_nodes(pop()))
+            for child in children:
+                if type(child) is ast.Constant and type(child.value) is str:
+                    return True
+            for child in reversed(children):
+                push(child)
         return False
 
 
+# Every node class exported by the ast module. Nodes are never user
+# subclasses, so an exact type lookup replaces isinstance(x, ast.AST).
+_AST_TYPES: FrozenSet[type] = frozenset(
+    cls for cls in vars(ast).values() if isinstance(cls, type) and issubclass(cls, ast.AST)
+)
+
+
+class _CallCollector(ast.NodeVisitor):
+    """Single AST pass collecting every call node in visit order."""
+
+    def __init__(self) -> None:
+        self.calls: List[ast.Call] = []
+
+    def visit(self, node: ast.AST) -> None:
+        """
+        Record call nodes and recurse into children.
+
+        Only calls are of interest, so this replaces NodeVisitor's per-node
+        visit_<Class> method lookup with one exact type check, and walks
+        _fields directly instead of through ast.iter_fields.
+        """
+        if type(node) is ast.Call:
+            self.calls.append(node)
+        visit = self.visit
+        for field in node._fields:
+            value: Any = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if type(item) in _AST_TYPES:
+                        visit(item)
+            elif type(value) in _AST_TYPES:
+                visit(value)
+
+
+# Call nodes per tree, held only as long as the tree itself is alive.
+# Trees are treated as immutable once scanned.
+_CALLS_BY_TREE: weakref.WeakKeyDictionary[ast.AST, List[ast.Call]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _calls(tree: ast.AST) -> List[ast.Call]:
+    """Return the call nodes of a tree, walking it only on first use."""
+    calls = _CALLS_BY_TREE.get(tree)
+    if calls is None:
+        collector = _CallCollector()
+        collector.visit(tree)
+        calls = _CALLS_BY_TREE[tree] = collector.calls
+    return calls
+
+
 def scan_security(source_code: str, tree: ast.AST) -> List[Dict[str, Any]]:
     """
     Main entry point for security scanning.
@@ -1,9 +1,26 @@
 """Configuration management using Pydantic settings."""
 
 import os
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 from pydantic_settings import BaseSettings
-from google.cloud import secretmanager
+
+if TYPE_CHECKING:
+    from google.cloud import secretmanager
+
+# Shared Secret Manager client, created on first use
+_secret_client: Optional["secretmanager.SecretManagerServiceClient"] = None
+
+
+def _get_secret_client() -> "secretmanager.SecretManagerServiceClient":
+    """Return the shared Secret Manager client, creating it on first use."""
+    global _secret_client
+    if _secret_client is None:
+        # Imported here so startups that never reach Secret Manager
+        # (local development) skip the gRPC/protobuf import cost
+        from google.cloud import secretmanager
+        
+        _secret_client = secretmanager.SecretManagerServiceClient()
+    return _secret_client
 
 
 class Settings(BaseSettings):
@@ -46,7 +63,7 @@ class Settings(BaseSettings):
     def _get_secret(self, secret_id: str, version: str = "latest") -> str:
         """Retrieve secret from Secret Manager."""
         try:
-            client = secretmanager.SecretManagerServiceClient()
+            client = _get_secret_client()
             name = f"projects/{self.project_id}/secrets/{secret_id}/versions/{version}"
             response = client.access_secret_version(request={"name": name})
             return response.payload.data.decode("UTF-8")
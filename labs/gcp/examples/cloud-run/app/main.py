@@ -12,8 +12,9 @@ import os
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from brotli_asgi import BrotliMiddleware
 
 from app.routes import health, api
 from app.config import settings
@@ -46,19 +47,24 @@ app = FastAPI(
     description="Production-ready FastAPI on Cloud Run",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
 )
 
 # Add middleware
+# Credentials are only allowed with an explicit origin list. With a "*"
+# wildcard Starlette would otherwise echo each request's Origin back;
+# without credentials it sends a static "Access-Control-Allow-Origin: *".
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
-    allow_credentials=True,
+    allow_credentials="*" not in settings.cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Brotli where the client accepts it, gzip as the fallback
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1000, gzip_fallback=True)
 
 # Include routers
 app.include_router(health.router, tags=["health"])
@@ -1,7 +1,9 @@
 """API endpoints."""
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Header, Depends, status
+import hmac
+from itertools import islice
+from typing import Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Header, Depends, Query, status
 from pydantic import BaseModel, Field
 
 from app.config import settings
@@ -23,25 +25,32 @@ class ItemList(BaseModel):
     total: int
 
 
-# In-memory storage (replace with database in production)
-items_db: List[Item] = [
-    Item(id=1, name="Widget", description="A useful widget", price=9.99),
-    Item(id=2, name="Gadget", description="An amazing gadget", price=19.99),
-]
+# In-memory storage keyed by item ID (replace with database in production)
+items_db: Dict[int, Item] = {
+    1: Item(id=1, name="Widget", description="A useful widget", price=9.99),
+    2: Item(id=2, name="Gadget", description="An amazing gadget", price=19.99),
+}
+
+
+# Settings are fixed after startup, so bind what the auth check needs once
+_API_KEY = settings.api_key
+_API_KEY_BYTES = _API_KEY.encode()
+_IS_DEV = settings.environment == "development"
 
 
 async def verify_api_key(x_api_key: str = Header(...)):
     """Verify API key from header."""
-    if not settings.api_key:
+    if not _API_KEY:
         # If no API key configured, skip validation (development only)
-        if settings.environment == "development":
+        if _IS_DEV:
             return True
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="API key not configured"
         )
     
-    if x_api_key != settings.api_key:
+    # Constant-time comparison so response timing doesn't leak the key
+    if not hmac.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
@@ -51,8 +60,8 @@ async def verify_api_key(x_api_key: str = Header(...)):
 
 @router.get("/items", response_model=ItemList)
 async def list_items(
-    skip: int = 0,
-    limit: int = 10,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=0),
     authenticated: bool = Depends(verify_api_key)
 ):
     """
@@ -61,7 +70,7 @@ async def list_items(
     Requires X-API-Key header for authentication.
     """
     total = len(items_db)
-    items = items_db[skip : skip + limit]
+    items = list(islice(items_db.values(), skip, skip + limit))
     
     return {
         "items": items,
@@ -75,14 +84,14 @@ async def get_item(
     authenticated: bool = Depends(verify_api_key)
 ):
     """Get item by ID."""
-    for item in items_db:
-        if item.id == item_id:
-            return item
+    item = items_db.get(item_id)
+    if item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item {item_id} not found"
+        )
     
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item {item_id} not found"
-    )
+    return item
 
 
 @router.post("/items", response_model=Item, status_code=status.HTTP_201_CREATED)
@@ -92,13 +101,13 @@ async def create_item(
 ):
     """Create a new item."""
     # Check if ID already exists
-    if any(i.id == item.id for i in items_db):
+    if item.id in items_db:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Item with ID {item.id} already exists"
         )
     
-    items_db.append(item)
+    items_db[item.id] = item
     return item
 
 
@@ -109,15 +118,14 @@ async def update_item(
     authenticated: bool = Depends(verify_api_key)
 ):
     """Update an existing item."""
-    for i, item in enumerate(items_db):
-        if item.id == item_id:
-            items_db[i] = updated_item
-            return updated_item
+    if item_id not in items_db:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item {item_id} not found"
+        )
     
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item {item_id} not found"
-    )
+    items_db[item_id] = updated_item
+    return updated_item
 
 
 @router.delete("/items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -126,12 +134,8 @@ async def delete_item(
     authenticated: bool = Depends(verify_api_key)
 ):
     """Delete an item."""
-    for i, item in enumerate(items_db):
-        if item.id == item_id:
-            items_db.pop(i)
-            return
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item {item_id} not found"
-    )
+    if items_db.pop(item_id, None) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item {item_id} not found"
+        )
@@ -6,7 +6,7 @@ This script listens for incoming SMS messages via VoIP.ms SIP MESSAGE protocol
 and displays them in the terminal in real-time.
 
 Usage:
-    python sms_monitor.py [--verbose]
+    python sms_monitor.py [--verbose] [--filter-source]
 
 Environment Variables Required:
     VOIPMS_SERVER   - VoIP.ms SIP server (e.g., seattle.voip.ms)
@@ -14,19 +14,38 @@ Environment Variables Required:
     VOIPMS_PASSWORD - VoIP.ms password
     VOIPMS_DID      - Your VoIP.ms phone number
 
+Linux Tuning:
+    The socket asks for a 12 MiB receive buffer so bursts are not dropped.
+    The kernel caps this at net.core.rmem_max, so raise that to match:
+        sudo sysctl -w net.core.rmem_max=12582912
+    For lower receive latency the socket also requests 50 us of busy
+    polling (needs root). Set the system default too and pin the monitor
+    to the NIC's NUMA node:
+        sudo sysctl -w net.core.busy_read=50
+        numactl --cpunodebind=<node> python sms_monitor.py
+
 Author: M. Gustave & Zero
 License: CC0-1.0
 Last Updated: January 31, 2026
 """
 
 import os
+import re
 import sys
 import socket
+import ctypes
+import collections
+import errno
+import functools
 import hashlib
 import datetime
+import logging
+import queue
+import select
 import signal
 import time
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Try to load from .env file
 try:
@@ -36,6 +55,289 @@ try:
 except ImportError:
     print("⚠️  python-dotenv not installed. Using system environment variables only.")
 
+# Receive buffer size per datagram and datagrams per recvmmsg/sendmmsg call
+RECV_BUFSIZE = 4096
+RECV_BATCH = 32
+
+# (Call-ID, CSeq) -> 200 OK of recently answered MESSAGEs, for retransmits
+ANSWERED_CACHE_SIZE = 4096
+
+# Socket receive buffer; the default (~208 KiB on Linux) drops bursts
+SOCKET_RCVBUF = 12 * 1024 * 1024
+
+# Busy-poll budget (microseconds) for blocking receives. The socket module
+# does not export SO_BUSY_POLL, so fall back to the Linux value.
+BUSY_POLL_USEC = 50
+_SO_BUSY_POLL = getattr(
+    socket, 'SO_BUSY_POLL', 46 if sys.platform.startswith('linux') else None
+)
+
+# Classic BPF socket filter support (Linux), for --filter-source
+_SO_ATTACH_FILTER = getattr(
+    socket, 'SO_ATTACH_FILTER', 26 if sys.platform.startswith('linux') else None
+)
+# Socket filters see the UDP header at offset 0; this reaches the IP header
+_SKF_NET_OFF = -0x100000
+
+Packet = Tuple[bytes, Tuple[str, int]]
+
+# The only header lines the listener reads: From/To for display, the body
+# length, and everything a 200 OK echoes back. Other headers are never
+# materialized.
+# Packets stay as bytes end to end; only displayed text is decoded.
+_WANTED_HEADER_RE = re.compile(
+    rb'^(Via|From|To|Call-ID|CSeq|Content-Length)[ \t]*:(.*)$', re.IGNORECASE | re.MULTILINE
+)
+# User part of a SIP URI
+_SIP_USER_RE = re.compile(rb'sip:([^@]*)@')
+_NON_DIGITS_RE = re.compile(rb'\D+')
+
+_OK_RESPONSE = (
+    b"SIP/2.0 200 OK\r\n"
+    b"Via: %b\r\n"
+    b"From: %b\r\n"
+    b"To: %b\r\n"
+    b"Call-ID: %b\r\n"
+    b"CSeq: %b\r\n"
+    b"Content-Length: 0\r\n"
+    b"User-Agent: voipms-monitor/1.0\r\n"
+    b"\r\n"
+)
+
+
+def _parse_headers(head: bytes) -> Dict[bytes, bytes]:
+    """Map lower-cased names of the wanted headers to stripped values."""
+    return {
+        key.lower(): value.strip()
+        for key, value in _WANTED_HEADER_RE.findall(head)
+    }
+
+
+def _strip_uri_params(header: bytes) -> bytes:
+    """Drop the parameters (;tag=...) that follow the user part of a header."""
+    at = header.find(b'@')
+    end = header.find(b';', at) if at >= 0 else -1
+    return header[:end] if end >= 0 else header
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+class _SockFilter(ctypes.Structure):
+    _fields_ = [
+        ("code", ctypes.c_uint16),
+        ("jt", ctypes.c_uint8),
+        ("jf", ctypes.c_uint8),
+        ("k", ctypes.c_uint32),
+    ]
+
+
+class _SockFprog(ctypes.Structure):
+    _fields_ = [("len", ctypes.c_ushort), ("filter", ctypes.POINTER(_SockFilter))]
+
+
+def _attach_source_filter(sock: socket.socket, addresses: List[str]) -> None:
+    """
+    Drop datagrams in the kernel unless their IPv4 source is in addresses.
+    
+    Attaches the classic BPF program
+        ld [net + 12]; jeq #addr, accept ...; ret #0; accept: ret #-1
+    so unwanted traffic (e.g. SIP scanners) never reaches Python.
+    """
+    count = len(addresses)
+    program = [(0x20, 0, 0, (_SKF_NET_OFF + 12) & 0xFFFFFFFF)]  # ld source IP
+    for i, address in enumerate(addresses, 1):
+        ip = int.from_bytes(socket.inet_aton(address), 'big')
+        program.append((0x15, count + 1 - i, 0, ip))  # jeq -> accept
+    program.append((0x06, 0, 0, 0))  # ret #0: drop
+    program.append((0x06, 0, 0, 0xFFFFFFFF))  # ret #-1: accept whole packet
+    
+    filters = (_SockFilter * len(program))(*program)
+    fprog = _SockFprog(len(program), filters)
+    sock.setsockopt(socket.SOL_SOCKET, _SO_ATTACH_FILTER, bytes(fprog))
+
+
+def _load_libc_function(name: str, argtypes: list) -> Optional[Callable]:
+    """Return a libc function such as recvmmsg(2), or None where it is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        func = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+
+def _load_recvmmsg() -> Optional[Callable]:
+    """Return libc's recvmmsg(2), or None where it is unavailable (non-Linux)."""
+    return _load_libc_function('recvmmsg', [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p,
+    ])
+
+
+def _load_sendmmsg() -> Optional[Callable]:
+    """Return libc's sendmmsg(2), or None where it is unavailable (non-Linux)."""
+    return _load_libc_function('sendmmsg', [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int,
+    ])
+
+
+class _BatchReceiver:
+    """
+    Drain up to RECV_BATCH datagrams per syscall with Linux recvmmsg(2).
+    
+    Buffers, iovecs and address slots are allocated once and reused. Each
+    call blocks until at least one datagram arrives (MSG_WAITFORONE) and
+    then returns whatever else is already queued, so a burst costs one
+    syscall instead of one per packet.
+    """
+    
+    MSG_WAITFORONE = 0x10000
+    
+    def __init__(self, sock: socket.socket, recvmmsg: Callable) -> None:
+        self.sock = sock
+        self._recvmmsg = recvmmsg
+        self._buffers = [ctypes.create_string_buffer(RECV_BUFSIZE) for _ in range(RECV_BATCH)]
+        self._iovecs = (_IOVec * RECV_BATCH)()
+        self._names = (_SockAddrIn * RECV_BATCH)()
+        self._msgs = (_MMsgHdr * RECV_BATCH)()
+        for i in range(RECV_BATCH):
+            self._iovecs[i].iov_base = ctypes.addressof(self._buffers[i])
+            self._iovecs[i].iov_len = RECV_BUFSIZE
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names[i])
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+    
+    def __call__(self) -> List[Packet]:
+        """Receive the next batch of (data, addr) packets."""
+        namelen = ctypes.sizeof(_SockAddrIn)
+        for msg in self._msgs:
+            msg.msg_hdr.msg_namelen = namelen
+        
+        count = self._recvmmsg(
+            self.sock.fileno(), self._msgs, RECV_BATCH, self.MSG_WAITFORONE, None
+        )
+        if count < 0:
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                return []
+            raise OSError(err, os.strerror(err))
+        
+        packets = []
+        for i in range(count):
+            name = self._names[i]
+            addr = (socket.inet_ntoa(bytes(name.sin_addr)), socket.ntohs(name.sin_port))
+            data = ctypes.string_at(self._buffers[i], self._msgs[i].msg_len)
+            packets.append((data, addr))
+        return packets
+
+
+class _DrainReceiver:
+    """
+    Portable batch receive: wait for readiness, then drain the socket.
+    
+    The socket is switched to non-blocking mode. Each call waits up to
+    POLL_TIMEOUT seconds in select() and then reads up to RECV_BATCH queued
+    datagrams, so a burst costs one wakeup instead of one per packet.
+    """
+    
+    POLL_TIMEOUT = 1.0
+    
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        sock.setblocking(False)
+    
+    def __call__(self) -> List[Packet]:
+        """Receive the next batch of (data, addr) packets."""
+        readable, _, _ = select.select([self.sock], [], [], self.POLL_TIMEOUT)
+        if not readable:
+            return []
+        
+        recvfrom = self.sock.recvfrom
+        packets = []
+        for _ in range(RECV_BATCH):
+            try:
+                packets.append(recvfrom(RECV_BUFSIZE))
+            except BlockingIOError:
+                break
+        return packets
+
+
+class _BatchSender:
+    """
+    Send queued datagrams with Linux sendmmsg(2), RECV_BATCH per syscall.
+    
+    Header and address slots are allocated once; each call points them at
+    the queued payloads and destinations.
+    """
+    
+    def __init__(self, sock: socket.socket, sendmmsg: Callable) -> None:
+        self.sock = sock
+        self._sendmmsg = sendmmsg
+        self._iovecs = (_IOVec * RECV_BATCH)()
+        self._names = (_SockAddrIn * RECV_BATCH)()
+        self._msgs = (_MMsgHdr * RECV_BATCH)()
+        for i in range(RECV_BATCH):
+            self._names[i].sin_family = socket.AF_INET
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names[i])
+            hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+    
+    def __call__(self, packets: List[Packet]) -> int:
+        """
+        Send (data, addr) packets in order.
+        
+        Returns:
+            How many leading packets were sent; the caller handles the rest
+        """
+        sent = 0
+        while sent < len(packets):
+            chunk = packets[sent:sent + RECV_BATCH]
+            for i, (data, (host, port)) in enumerate(chunk):
+                self._iovecs[i].iov_base = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p)
+                self._iovecs[i].iov_len = len(data)
+                self._names[i].sin_port = socket.htons(port)
+                ctypes.memmove(self._names[i].sin_addr, socket.inet_aton(host), 4)
+            
+            count = self._sendmmsg(self.sock.fileno(), self._msgs, len(chunk), 0)
+            if count <= 0:
+                break
+            sent += count
+            if count < len(chunk):
+                break
+        return sent
+
 
 class VoIPMSMessageListener:
     """
@@ -45,6 +347,10 @@ class VoIPMSMessageListener:
     and displays the received SMS content.
     """
     
+    SMS_BANNER = "🟢" * 35
+    SMS_RULE = f"   {'-' * 66}"
+    PACKET_RULE = "=" * 70
+    
     def __init__(
         self,
         server: str,
@@ -52,6 +358,7 @@ class VoIPMSMessageListener:
         password: str,
         port: int = 5060,
         verbose: bool = False,
+        filter_source: bool = False,
     ) -> None:
         """
         Initialize VoIP.ms SMS listener.
@@ -62,15 +369,37 @@ class VoIPMSMessageListener:
             password: VoIP.ms password
             port: SIP port to listen on (default 5060)
             verbose: Enable verbose output
+            filter_source: Drop packets not sent from the server's
+                addresses in the kernel (Linux only)
         """
         self.server = server
         self.username = username
         self.password = password
         self.port = port
         self.verbose = verbose
+        self.filter_source = filter_source
         self.running = False
         self.sock: Optional[socket.socket] = None
         
+        # 200 OK responses queued while handling a batch, sent together
+        self._outbox: List[Packet] = []
+        self._send_batch: Optional[_BatchSender] = None
+        self._answered: 'collections.OrderedDict[Tuple[bytes, bytes], bytes]' = (
+            collections.OrderedDict()
+        )
+        
+        # Display timestamp, reformatted at most once per second
+        self._ts_sec = 0
+        self._ts_str = ''
+        
+        # Receive-path output is queued and written to the terminal by a
+        # background thread, so a slow TTY cannot stall the socket
+        self._log = logging.getLogger('sms_monitor')
+        self._log.setLevel(logging.INFO)
+        self._log.propagate = False
+        self._log_handler: Optional[QueueHandler] = None
+        self._log_listener: Optional[QueueListener] = None
+        
         # Get local IP
         self.local_ip = self._get_local_ip()
         
@@ -97,46 +426,49 @@ class VoIPMSMessageListener:
         print(f"   Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 70)
         print("\n🔊 Listening for incoming SMS messages... (Press Ctrl+C to stop)\n")
+        self._start_logging()
         
         # Create UDP socket
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+        # Lets several listener processes share the port, kernel-balanced
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Attach before bind so nothing unfiltered is queued in between
+        if self.filter_source:
+            self._filter_to_server()
         
         try:
             # Bind to port
             self.sock.bind(('', self.port))
+            self._enable_busy_poll()
             self.running = True
+            receive = self._make_receiver()
+            sendmmsg = _load_sendmmsg()
+            if sendmmsg is not None:
+                self._send_batch = _BatchSender(self.sock, sendmmsg)
             
             # Listen for messages
             while self.running:
                 try:
-                    data, addr = self.sock.recvfrom(4096)
-                    message = data.decode('utf-8', errors='ignore')
-                    
-                    if self.verbose:
-                        print("\n" + "=" * 70)
-                        print(f"📥 Received packet from {addr}")
-                        print("=" * 70)
-                        print(message)
-                        print("=" * 70)
-                    
-                    # Process SIP MESSAGE
-                    if message.startswith('MESSAGE '):
-                        self._handle_message(message, addr)
-                    elif message.startswith('OPTIONS '):
-                        self._handle_options(message, addr)
-                    elif self.verbose:
-                        print(f"⚠️  Received non-MESSAGE SIP request from {addr}")
-                        
+                    packets = receive()
                 except socket.timeout:
                     continue
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
-                    print(f"❌ Error receiving message: {e}")
-                    if self.verbose:
-                        import traceback
-                        traceback.print_exc()
+                    self._report_error(e)
+                    continue
+                
+                # Handle each packet separately so one bad datagram does not
+                # drop the rest of its batch
+                for data, addr in packets:
+                    try:
+                        self._process_packet(data, addr)
+                    except Exception as e:
+                        self._report_error(e)
+                self._flush_responses()
                     
         except OSError as e:
             print(f"❌ Failed to bind to port {self.port}: {e}")
@@ -145,136 +477,241 @@ class VoIPMSMessageListener:
         finally:
             self.stop()
     
-    def _handle_message(self, message: str, addr: tuple) -> None:
+    def _filter_to_server(self) -> None:
+        """Only let packets from the server's resolved addresses through."""
+        if _SO_ATTACH_FILTER is None:
+            print("⚠️  Source filtering needs Linux; accepting packets from any host")
+            return
+        try:
+            addresses = socket.gethostbyname_ex(self.server)[2]
+            _attach_source_filter(self.sock, addresses)
+        except OSError as e:
+            print(f"⚠️  Could not filter to {self.server} ({e}); accepting packets from any host")
+            return
+        print(f"   Accepting packets only from: {', '.join(addresses)}")
+    
+    def _enable_busy_poll(self) -> None:
+        """Spin on the NIC queue briefly before sleeping in a receive."""
+        if _SO_BUSY_POLL is None:
+            return
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, BUSY_POLL_USEC)
+        except OSError:
+            # Raising the budget needs CAP_NET_ADMIN; run without it
+            pass
+    
+    def _make_receiver(self) -> Callable[[], List[Packet]]:
+        """Return a callable yielding the next batch of received packets."""
+        recvmmsg = _load_recvmmsg()
+        if recvmmsg is not None:
+            return _BatchReceiver(self.sock, recvmmsg)
+        # Portable fallback: select() then drain with recvfrom
+        return _DrainReceiver(self.sock)
+    
+    def _flush_responses(self) -> None:
+        """Send the responses queued while handling the last batch."""
+        outbox, self._outbox = self._outbox, []
+        sent = 0
+        if self._send_batch is not None and len(outbox) > 1:
+            sent = self._send_batch(outbox)
+        
+        # Per-packet sendto for single responses, other platforms, and
+        # anything sendmmsg did not take (this also reports the error)
+        for response, addr in outbox[sent:]:
+            try:
+                self.sock.sendto(response, addr)
+            except Exception as e:
+                self._log.error("❌ Failed to send response: %s", e)
+    
+    def _report_error(self, error: Exception) -> None:
+        """Report a receive or processing error and keep listening."""
+        self._log.error("❌ Error receiving message: %s", error, exc_info=self.verbose)
+    
+    def _start_logging(self) -> None:
+        """Route receive-path output through a queue drained off-thread."""
+        if self._log_listener is not None:
+            return
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter('%(message)s'))
+        self._log_handler = QueueHandler(log_queue)
+        self._log.addHandler(self._log_handler)
+        self._log_listener = QueueListener(log_queue, console)
+        self._log_listener.start()
+    
+    def _stop_logging(self) -> None:
+        """Write out any queued output and detach the queue handler."""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        self._log.removeHandler(self._log_handler)
+        self._log_listener = None
+        self._log_handler = None
+    
+    def _process_packet(self, data: bytes, addr: tuple) -> None:
+        """
+        Dispatch one received datagram.
+        
+        Args:
+            data: Raw datagram
+            addr: Source address (ip, port)
+        """
+        if self.verbose:
+            message = data.decode('utf-8', errors='ignore')
+            rule = self.PACKET_RULE
+            self._log.info(
+                "\n%s\n📥 Received packet from %s\n%s\n%s\n%s",
+                rule, addr, rule, message, rule,
+            )
+        
+        # Process SIP MESSAGE
+        if data.startswith(b'MESSAGE '):
+            self._handle_message(data, addr)
+        elif data.startswith(b'OPTIONS '):
+            self._handle_options(data, addr)
+        elif self.verbose:
+            self._log.info("⚠️  Received non-MESSAGE SIP request from %s", addr)
+    
+    def _handle_message(self, data: bytes, addr: tuple) -> None:
         """
         Handle incoming SIP MESSAGE request.
         
         Args:
-            message: SIP MESSAGE content
+            data: Raw SIP MESSAGE datagram
             addr: Source address (ip, port)
         """
-        lines = message.split('\r\n')
+        # Split headers from body at the first blank line
+        head, _, raw_body = data.partition(b'\r\n\r\n')
+        headers = _parse_headers(head)
         
-        # Extract headers
-        headers = {}
-        body_start = 0
-        for i, line in enumerate(lines):
-            if line == '':
-                body_start = i + 1
-                break
-            if ':' in line:
-                key, value = line.split(':', 1)
-                headers[key.strip().lower()] = value.strip()
+        # A retransmit of a MESSAGE already shown just gets its 200 OK again
+        key = (headers.get(b'call-id', b''), headers.get(b'cseq', b''))
+        answered = self._answered
+        response = answered.get(key) if key[0] else None
+        if response is not None:
+            answered.move_to_end(key)
+            if self.verbose:
+                self._log.info("🔁 Re-sending 200 OK for retransmitted MESSAGE from %s", addr)
+            self._outbox.append((response, addr))
+            return
         
-        # Extract message body
-        body = '\r\n'.join(lines[body_start:]).strip()
+        # Content-Length bounds the body; anything a proxy appended is ignored
+        try:
+            length = int(headers.get(b'content-length', b''))
+        except ValueError:
+            length = -1
+        if length >= 0:
+            raw_body = raw_body[:length]
+        body = raw_body.strip().decode('utf-8', errors='ignore')
         
         # Parse FROM header
-        from_header = headers.get('from', 'Unknown')
-        from_number = self._extract_phone(from_header)
+        from_header = headers.get(b'from', b'Unknown')
+        from_number = self._extract_phone(_strip_uri_params(from_header))
         
         # Parse TO header
-        to_header = headers.get('to', 'Unknown')
-        to_number = self._extract_phone(to_header)
+        to_header = headers.get(b'to', b'Unknown')
+        to_number = self._extract_phone(_strip_uri_params(to_header))
         
         # Get timestamp
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        timestamp = self._ts_str
         
-        # Display SMS
-        print("\n" + "🟢" * 35)
-        print(f"📨 NEW SMS MESSAGE")
-        print("🟢" * 35)
-        print(f"   Time: {timestamp}")
-        print(f"   From: {from_number}")
-        print(f"   To: {to_number}")
-        print(f"   Message:")
-        print(f"   {'-' * 66}")
-        for line in body.split('\n'):
-            print(f"   {line}")
-        print(f"   {'-' * 66}")
-        print("🟢" * 35 + "\n")
+        # Display SMS as a single log record
+        banner = self.SMS_BANNER
+        lines = [
+            "\n" + banner,
+            "📨 NEW SMS MESSAGE",
+            banner,
+            f"   Time: {timestamp}",
+            f"   From: {from_number}",
+            f"   To: {to_number}",
+            "   Message:",
+            self.SMS_RULE,
+        ]
+        lines.extend(f"   {line}" for line in body.split('\n'))
+        lines.append(self.SMS_RULE)
+        lines.append(banner + "\n")
+        self._log.info('\n'.join(lines))
         
-        # Send 200 OK response
-        self._send_ok_response(message, addr)
+        # Send 200 OK response and remember it for retransmits
+        response = self._send_ok_response(headers, addr)
+        if key[0]:
+            answered[key] = response
+            if len(answered) > ANSWERED_CACHE_SIZE:
+                answered.popitem(last=False)
     
-    def _handle_options(self, message: str, addr: tuple) -> None:
+    def _handle_options(self, data: bytes, addr: tuple) -> None:
         """
         Handle SIP OPTIONS request (keepalive/ping).
         
         Args:
-            message: SIP OPTIONS content
+            data: Raw SIP OPTIONS datagram
             addr: Source address (ip, port)
         """
         if self.verbose:
-            print(f"📡 Received OPTIONS request from {addr}")
+            self._log.info("📡 Received OPTIONS request from %s", addr)
         
-        # Send 200 OK response
-        self._send_ok_response(message, addr)
+        # OPTIONS carries no body; pick out just the headers the 200 OK needs
+        head = data.partition(b'\r\n\r\n')[0]
+        self._send_ok_response(_parse_headers(head), addr)
     
-    def _send_ok_response(self, request: str, addr: tuple) -> None:
+    def _send_ok_response(self, headers: Dict[bytes, bytes], addr: tuple) -> bytes:
         """
         Send SIP 200 OK response.
         
         Args:
-            request: Original SIP request
+            headers: Request headers keyed by lower-cased name
             addr: Destination address (ip, port)
+            
+        Returns:
+            The encoded response
         """
-        lines = request.split('\r\n')
-        
-        # Extract headers
-        headers = {}
-        for line in lines[1:]:
-            if line == '':
-                break
-            if ':' in line:
-                key, value = line.split(':', 1)
-                headers[key.strip().lower()] = value.strip()
-        
         # Build response
-        response = (
-            f"SIP/2.0 200 OK\r\n"
-            f"Via: {headers.get('via', '')}\r\n"
-            f"From: {headers.get('from', '')}\r\n"
-            f"To: {headers.get('to', '')}\r\n"
-            f"Call-ID: {headers.get('call-id', '')}\r\n"
-            f"CSeq: {headers.get('cseq', '')}\r\n"
-            f"Content-Length: 0\r\n"
-            f"User-Agent: voipms-monitor/1.0\r\n"
-            f"\r\n"
+        get = headers.get
+        response = _OK_RESPONSE % (
+            get(b'via', b''),
+            get(b'from', b''),
+            get(b'to', b''),
+            get(b'call-id', b''),
+            get(b'cseq', b''),
         )
         
         if self.verbose:
-            print(f"📤 Sending 200 OK to {addr}")
-            print(response)
+            self._log.info(
+                "📤 Sending 200 OK to %s\n%s",
+                addr, response.decode('utf-8', errors='ignore'),
+            )
         
-        # Send response
-        try:
-            self.sock.sendto(response.encode('utf-8'), addr)
-        except Exception as e:
-            print(f"❌ Failed to send response: {e}")
+        # Queue response; the receive loop sends each batch's responses together
+        self._outbox.append((response, addr))
+        return response
     
-    def _extract_phone(self, header: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_phone(header: bytes) -> str:
         """
         Extract phone number from SIP header.
         
+        Results are cached, since the same From/To numbers recur on every
+        message from a carrier session.
+        
         Args:
-            header: SIP From/To header
+            header: SIP From/To header, ideally without its volatile
+                ;tag= parameters (see _strip_uri_params)
             
         Returns:
             Phone number or 'Unknown'
         """
         # Format: <sip:1234567890@server.com>
-        if 'sip:' in header:
-            try:
-                start = header.index('sip:') + 4
-                end = header.index('@', start)
-                phone = header[start:end]
-                # Remove any non-digit characters
-                phone = ''.join(c for c in phone if c.isdigit())
-                if phone:
-                    return phone
-            except (ValueError, IndexError):
-                pass
+        match = _SIP_USER_RE.search(header)
+        if match:
+            # Remove any non-digit characters
+            phone = _NON_DIGITS_RE.sub(b'', match.group(1))
+            if phone:
+                return phone.decode('ascii')
         return 'Unknown'
     
     def stop(self) -> None:
@@ -283,6 +720,7 @@ class VoIPMSMessageListener:
         if self.sock:
             self.sock.close()
             self.sock = None
+        self._stop_logging()
         print("\n" + "=" * 70)
         print(f"🛑 SMS Monitor Stopped at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 70)
@@ -320,6 +758,7 @@ def main() -> int:
         username=username,
         password=password,
         verbose='--verbose' in sys.argv or '-v' in sys.argv,
+        filter_source='--filter-source' in sys.argv,
     )
     
     # Handle Ctrl+C gracefully